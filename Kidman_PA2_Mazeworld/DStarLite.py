@@ -0,0 +1,219 @@
+# Author: Lauren Kidman
+# Date: 19 October 2026
+# COSC 76: Artificial Intelligence 24F
+
+import math
+from heapq import heappush, heappop
+
+from SearchSolution import SearchSolution
+
+
+class DStarLite:
+    """
+    Summary: Incremental replanning for a single robot in a Maze whose cells can change while the robot
+    is moving (D* Lite, Koenig & Likhachev 2002). The search runs backwards from the goal, so when a cell
+    is opened or blocked only the part of the search tree that depended on that cell is repaired, instead
+    of starting over.
+
+    Typical use:
+        planner = DStarLite(maze, (1, 0), (2, 5))
+        planner.replan()                # first plan, a full search
+        planner.move_to(1, 1)           # the robot advanced along the path
+        planner.set_floor(1, 2, False)  # a door closed
+        planner.replan()                # repairs only what the closed door affects
+
+    Attributes:
+        maze: the Maze being planned in (set_floor changes it)
+        start: the robot's current cell
+        goal: the goal cell
+        g, rhs: the D* Lite cost estimates (cell -> cost to goal); missing means infinity
+        km: key modifier accumulated as the robot moves
+        expansions: total number of nodes expanded over the planner's lifetime
+        last_expansions: nodes expanded by the most recent replan
+    """
+    def __init__(self, maze, start, goal):
+        self.maze = maze
+        self.start = tuple(start)
+        self.goal = tuple(goal)
+        self.last = self.start
+        self.km = 0
+
+        self.g = {}
+        self.rhs = {self.goal: 0}
+        self.queue = []        # heap of (key, cell), may contain stale entries
+        self.queue_keys = {}   # cell -> its current key, for cells really in the queue
+        self.push(self.goal, self.calculate_key(self.goal))
+
+        self.changed_cells = []
+        self.expansions = 0
+        self.last_expansions = 0
+
+    def __str__(self):
+        return "D* Lite problem: "
+
+    def heuristic(self, cell):
+        # Manhattan distance from the robot, consistent for unit-cost grid moves
+        return abs(cell[0] - self.start[0]) + abs(cell[1] - self.start[1])
+
+    def calculate_key(self, cell):
+        best = min(self.g.get(cell, math.inf), self.rhs.get(cell, math.inf))
+        return best + self.heuristic(cell) + self.km, best
+
+    def push(self, cell, key):
+        self.queue_keys[cell] = key
+        heappush(self.queue, (key, cell))
+
+    def top_key(self):
+        # drop stale heap entries (cells removed or re-keyed since they were pushed)
+        while self.queue:
+            key, cell = self.queue[0]
+            if self.queue_keys.get(cell) == key:
+                return key
+            heappop(self.queue)
+        return math.inf, math.inf
+
+    def neighbors(self, cell):
+        x, y = cell
+        for neighbor in ((x + 1, y), (x, y + 1), (x - 1, y), (x, y - 1)):
+            if 0 <= neighbor[0] < self.maze.width and 0 <= neighbor[1] < self.maze.height:
+                yield neighbor
+
+    def cost(self, cell_a, cell_b):
+        # moving between neighboring cells costs 1, unless either one is a wall
+        if self.maze.is_floor(*cell_a) and self.maze.is_floor(*cell_b):
+            return 1
+        return math.inf
+
+    def update_vertex(self, cell):
+        if cell != self.goal:
+            self.rhs[cell] = min((self.cost(cell, neighbor) + self.g.get(neighbor, math.inf)
+                                  for neighbor in self.neighbors(cell)), default=math.inf)
+        self.queue_keys.pop(cell, None)
+        if self.g.get(cell, math.inf) != self.rhs.get(cell, math.inf):
+            self.push(cell, self.calculate_key(cell))
+
+    def compute_shortest_path(self):
+        """
+        Summary: Expand locally inconsistent cells until the robot's cell is consistent
+
+        :return: the number of nodes expanded
+        """
+        expanded = 0
+        while (self.top_key() < self.calculate_key(self.start)
+               or self.rhs.get(self.start, math.inf) > self.g.get(self.start, math.inf)):
+            old_key, cell = heappop(self.queue)
+            del self.queue_keys[cell]
+            expanded += 1
+
+            new_key = self.calculate_key(cell)
+            if old_key < new_key:
+                self.push(cell, new_key)
+            elif self.g.get(cell, math.inf) > self.rhs.get(cell, math.inf):
+                # overconsistent: the cell got cheaper, settle it
+                self.g[cell] = self.rhs[cell]
+                for neighbor in self.neighbors(cell):
+                    self.update_vertex(neighbor)
+            else:
+                # underconsistent: the cell got more expensive, re-derive it and its neighbors
+                self.g[cell] = math.inf
+                self.update_vertex(cell)
+                for neighbor in self.neighbors(cell):
+                    self.update_vertex(neighbor)
+
+            if not self.queue_keys:
+                break
+        return expanded
+
+    def set_floor(self, x, y, floor=True):
+        """
+        Summary: Open or block a cell of the maze; the change is repaired on the next replan
+
+        :param x: column of the cell
+        :param y: row of the cell (counted from the bottom)
+        :param floor: True to make the cell a floor, False to make it a wall
+        """
+        if self.maze.is_floor(x, y) != floor:
+            self.maze.set_floor(x, y, floor)
+            self.changed_cells.append((x, y))
+
+    def move_to(self, x, y):
+        """
+        Summary: Tell the planner the robot is now at (x, y)
+        """
+        self.start = (x, y)
+
+    def replan(self):
+        """
+        Summary: Repair the search after cell changes and robot moves, and extract the current path
+
+        :return: a SearchSolution in the single-robot MazeworldProblem state format (turn, x, y); its
+            nodes_visited counts only the nodes re-expanded by this replan
+        """
+        # the heuristic is relative to the robot, so shift all future keys by how far it moved
+        self.km += abs(self.last[0] - self.start[0]) + abs(self.last[1] - self.start[1])
+        self.last = self.start
+
+        if self.changed_cells:
+            for cell in self.changed_cells:
+                self.update_vertex(cell)
+                for neighbor in self.neighbors(cell):
+                    self.update_vertex(neighbor)
+            self.changed_cells = []
+
+        self.last_expansions = self.compute_shortest_path()
+        self.expansions += self.last_expansions
+
+        solution = SearchSolution(self, "D* Lite")
+        solution.nodes_visited = self.last_expansions
+        cells = self.path()
+        if cells:
+            solution.path = [(0, x, y) for x, y in cells]
+            solution.cost = len(cells) - 1
+        return solution
+
+    def path(self):
+        """
+        Summary: Follow the cheapest neighbors from the robot to the goal
+
+        :return: a list of (x, y) cells from start to goal, or [] if the goal is unreachable
+        """
+        # the robot's own cell may be left overconsistent, so its rhs is the cost to trust
+        if self.rhs.get(self.start, math.inf) == math.inf:
+            return []
+
+        cells = [self.start]
+        cell = self.start
+        while cell != self.goal:
+            cell = min(self.neighbors(cell),
+                       key=lambda neighbor: self.cost(cell, neighbor) + self.g.get(neighbor, math.inf))
+            if self.g.get(cell, math.inf) == math.inf or len(cells) > self.maze.width * self.maze.height:
+                return []
+            cells.append(cell)
+        return cells
+
+    def compare_with_fresh_search(self):
+        """
+        Summary: How much work the last replan saved, compared with planning from scratch on the
+        maze as it is now
+
+        :return: a dict with the nodes expanded by the last incremental replan and by a fresh search
+        """
+        fresh = DStarLite(self.maze, self.start, self.goal)
+        fresh.replan()
+        return {"incremental_expansions": self.last_expansions,
+                "fresh_expansions": fresh.last_expansions}
+
+
+if __name__ == "__main__":
+    from Maze import Maze
+
+    test_maze5 = Maze("maze5.maz")
+    planner = DStarLite(test_maze5, (4, 12), (38, 22))
+    print(planner.replan())
+
+    # walk a few steps, then block the cell just ahead of the robot
+    route = planner.path()
+    planner.move_to(*route[5])
+    planner.set_floor(*route[8], False)
+    print(planner.replan())
+    print(planner.compare_with_fresh_search())
@@ -0,0 +1,282 @@
+# Author: Lauren Kidman
+# Date: 19 October 2026
+# COSC 76: Artificial Intelligence 24F
+
+import mmap
+import os
+import shutil
+import struct
+import tempfile
+from array import array
+
+# one slot of the open-addressing table: 64-bit key hash (0 = empty), offset of the packed key in
+#  the key log, and a 64-bit integer value
+SLOT = struct.Struct("<QQq")
+KEY_LENGTH = struct.Struct("<I")
+HASH_MASK = (1 << 64) - 1
+
+# key offset of a deleted slot (a tombstone): probing carries on past it, and insert may reuse it
+TOMBSTONE = HASH_MASK
+
+# grow (double) the table when it is this full
+MAX_LOAD = 0.6
+
+
+def pack_key(state):
+    # states are tuples of small ints; 32 bits per coordinate is plenty
+    return array("i", state).tobytes()
+
+
+def unpack_key(data):
+    values = array("i")
+    values.frombytes(data)
+    return tuple(values)
+
+
+class DiskHashTable:
+    """
+    Summary: An open-addressing hash table of search states that lives on disk instead of in RAM, for
+    searches whose visited/explored sets outgrow memory. Packed states are appended to a key log file,
+    and a memory-mapped slot file holds (hash, key offset, value) for each entry, so the operating
+    system keeps only the recently used pages in memory.
+
+    Lookups compare the 64-bit hash first and read the key back from the log only on a hash match, so
+    the table is exact (no false positives). Use DiskCostMap in place of astar_search's visited_cost
+    dict, or DiskStateSet in place of bfs_search's explored set.
+
+    Attributes:
+        directory: the temporary directory holding the two files (removed by close())
+        capacity: number of slots (a power of two)
+        count: number of entries
+        tombstones: number of deleted slots not yet reused (cleared when the table grows)
+    """
+    def __init__(self, directory=None, initial_capacity=1 << 16):
+        self.directory = tempfile.mkdtemp(prefix="visited_", dir=directory)
+        self.capacity = 1
+        while self.capacity < initial_capacity:
+            self.capacity *= 2
+        self.count = 0
+        self.tombstones = 0
+        self.generation = 0
+
+        self.log = open(os.path.join(self.directory, "keys.log"), "w+b")
+        self.log_size = 0
+        self.log_flushed = 0
+        self.slots_file, self.slots = self.new_slots(self.capacity)
+
+    def new_slots(self, capacity):
+        # a fresh, zero-filled (all empty) slot file and its memory map
+        self.generation += 1
+        f = open(os.path.join(self.directory, "slots.{:d}".format(self.generation)), "w+b")
+        f.truncate(capacity * SLOT.size)
+        return f, mmap.mmap(f.fileno(), capacity * SLOT.size)
+
+    def close(self):
+        """
+        Summary: Release the memory map and delete the files
+        """
+        if getattr(self, "slots_file", None) is None:
+            return
+        self.slots.close()
+        self.slots_file.close()
+        self.log.close()
+        self.slots_file = None
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
+    def __len__(self):
+        return self.count
+
+    def read_key(self, offset):
+        # the log is written through a buffer; make sure the bytes we want have reached the file
+        if offset + KEY_LENGTH.size > self.log_flushed:
+            self.log.flush()
+            self.log_flushed = self.log_size
+        fd = self.log.fileno()
+        length = KEY_LENGTH.unpack(os.pread(fd, KEY_LENGTH.size, offset))[0]
+        if offset + KEY_LENGTH.size + length > self.log_flushed:
+            self.log.flush()
+            self.log_flushed = self.log_size
+        return os.pread(fd, length, offset + KEY_LENGTH.size)
+
+    def find(self, key, key_hash):
+        """
+        Summary: Linear probing for a packed key
+
+        :return: (slot index, found) -- the slot holding the key, or the free slot where it would go
+            (the first tombstone on the way, else the empty slot that ended the probe)
+        """
+        mask = self.capacity - 1
+        index = key_hash & mask
+        slots = self.slots
+        free = None
+        while True:
+            slot_hash, offset, _ = SLOT.unpack_from(slots, index * SLOT.size)
+            if slot_hash == 0:
+                return (index if free is None else free), False
+            if offset == TOMBSTONE:
+                if free is None:
+                    free = index
+            elif slot_hash == key_hash and self.read_key(offset) == key:
+                return index, True
+            index = (index + 1) & mask
+
+    @staticmethod
+    def hash_key(key):
+        # 0 marks an empty slot, so never use it as a hash
+        return (hash(key) & HASH_MASK) or 1
+
+    def lookup(self, state):
+        key = pack_key(state)
+        index, found = self.find(key, self.hash_key(key))
+        return index, found, key
+
+    def store(self, state, value):
+        index, found, key = self.lookup(state)
+        if found:
+            slot_hash, offset, _ = SLOT.unpack_from(self.slots, index * SLOT.size)
+            SLOT.pack_into(self.slots, index * SLOT.size, slot_hash, offset, value)
+        else:
+            self.insert(index, key, value)
+
+    def insert(self, index, key, value):
+        # append the key to the log and claim the free slot found by lookup
+        if SLOT.unpack_from(self.slots, index * SLOT.size)[1] == TOMBSTONE:
+            self.tombstones -= 1
+        offset = self.log_size
+        self.log.write(KEY_LENGTH.pack(len(key)))
+        self.log.write(key)
+        self.log_size += KEY_LENGTH.size + len(key)
+
+        SLOT.pack_into(self.slots, index * SLOT.size, self.hash_key(key), offset, value)
+        self.count += 1
+        if self.count + self.tombstones > MAX_LOAD * self.capacity:
+            self.grow()
+
+    def delete(self, state):
+        """
+        Summary: Remove a state, leaving a tombstone in its slot (its key stays in the log, unused)
+        """
+        index, found, _ = self.lookup(state)
+        if not found:
+            raise KeyError(state)
+        SLOT.pack_into(self.slots, index * SLOT.size, 1, TOMBSTONE, 0)
+        self.count -= 1
+        self.tombstones += 1
+
+    def grow(self):
+        """
+        Summary: Double the number of slots; entries move using their stored hashes, without reading keys,
+        and tombstones are left behind
+        """
+        old_file, old_slots, old_capacity = self.slots_file, self.slots, self.capacity
+        self.capacity *= 2
+        new_file, new_slots = self.new_slots(self.capacity)
+
+        mask = self.capacity - 1
+        for old_index in range(old_capacity):
+            slot = SLOT.unpack_from(old_slots, old_index * SLOT.size)
+            if slot[0] == 0 or slot[1] == TOMBSTONE:
+                continue
+            index = slot[0] & mask
+            while SLOT.unpack_from(new_slots, index * SLOT.size)[0] != 0:
+                index = (index + 1) & mask
+            SLOT.pack_into(new_slots, index * SLOT.size, *slot)
+
+        old_slots.close()
+        old_file.close()
+        os.remove(old_file.name)
+        self.slots_file, self.slots = new_file, new_slots
+        self.tombstones = 0
+
+    def entries(self):
+        """
+        Summary: Every (state, value) pair, in slot order
+
+        :return: a generator of (state, value)
+        """
+        for index in range(self.capacity):
+            slot_hash, offset, value = SLOT.unpack_from(self.slots, index * SLOT.size)
+            if slot_hash != 0 and offset != TOMBSTONE:
+                yield unpack_key(self.read_key(offset)), value
+
+
+class DiskCostMap(DiskHashTable):
+    """
+    Summary: A disk-backed replacement for a dict from state to integer cost (astar_search's visited_cost)
+    """
+    def __contains__(self, state):
+        return self.lookup(state)[1]
+
+    def __getitem__(self, state):
+        index, found, _ = self.lookup(state)
+        if not found:
+            raise KeyError(state)
+        return SLOT.unpack_from(self.slots, index * SLOT.size)[2]
+
+    def __setitem__(self, state, cost):
+        self.store(state, cost)
+
+    def __delitem__(self, state):
+        self.delete(state)
+
+    def get(self, state, default=None):
+        index, found, _ = self.lookup(state)
+        return SLOT.unpack_from(self.slots, index * SLOT.size)[2] if found else default
+
+    def __iter__(self):
+        return (state for state, _ in self.entries())
+
+    def values(self):
+        return [value for _, value in self.entries()]
+
+    def items(self):
+        return self.entries()
+
+    def update(self, pairs):
+        for state, cost in pairs:
+            self.store(state, cost)
+
+
+class DiskStateSet(DiskHashTable):
+    """
+    Summary: A disk-backed replacement for a set of states (bfs_search's explored set)
+    """
+    def __contains__(self, state):
+        return self.lookup(state)[1]
+
+    def add(self, state):
+        index, found, key = self.lookup(state)
+        if not found:
+            self.insert(index, key, 0)
+
+    def update(self, states):
+        for state in states:
+            self.add(state)
+
+    def __iter__(self):
+        return (state for state, _ in self.entries())
+
+
+if __name__ == "__main__":
+    from Maze import Maze
+    from MazeworldProblem import MazeworldProblem
+    from astar_search import astar_search
+
+    test_maze4 = Maze("maze4.maz")
+    test_mp4 = MazeworldProblem(test_maze4, (5, 5, 4, 5, 6, 5))
+    print(astar_search(test_mp4, test_mp4.manhattan_heuristic))
+    with DiskCostMap() as visited:
+        print(astar_search(test_mp4, test_mp4.manhattan_heuristic, visited=visited))
+        print("states on disk:", len(visited))
@@ -0,0 +1,255 @@
+# Author: Lauren Kidman
+# Date: 19 October 2026
+# COSC 76: Artificial Intelligence 24F
+
+import struct
+from array import array
+from collections import deque
+
+from Maze import Maze
+from maze_loader import FLOOR, source_signature, sidecar_path, write_atomically
+
+# Sidecar layout (little-endian), stored next to the maze as e.g. maze5.maz.alt:
+#    header: magic "ALTL", version, distance typecode, width, height, source mtime_ns, source size, k
+#    landmarks: k unsigned 32-bit cell indices (Maze.map order)
+#    distances: k arrays of width * height distances, one per landmark
+ALT_SUFFIX = ".alt"
+ALT_MAGIC = b"ALTL"
+ALT_VERSION = 1
+ALT_HEADER = struct.Struct("<4sHcxIIqqI")
+
+
+def bfs_distances(maze, x, y):
+    """
+    Summary: Breadth-first distances from (x, y) to every cell of the maze, moving north/south/east/west
+
+    :param maze: the Maze
+    :param x: column of the source cell
+    :param y: row of the source cell (counted from the bottom)
+    :return: a list indexed like Maze.map, with None for walls and unreachable cells
+    """
+    width, height, grid = maze.width, maze.height, maze.map
+    distances = [None] * (width * height)
+    start = maze.index(x, y)
+    if grid[start] != FLOOR:
+        return distances
+
+    distances[start] = 0
+    queue = deque([start])
+    while queue:
+        index = queue.popleft()
+        next_distance = distances[index] + 1
+        row, col = divmod(index, width)
+        for neighbor, ok in ((index - 1, col > 0), (index + 1, col < width - 1),
+                             (index - width, row > 0), (index + width, row < height - 1)):
+            if ok and distances[neighbor] is None and grid[neighbor] == FLOOR:
+                distances[neighbor] = next_distance
+                queue.append(neighbor)
+    return distances
+
+
+class LandmarkTable:
+    """
+    Summary: ALT (A*, Landmarks, Triangle inequality) preprocessing for repeated path queries on one maze.
+    A few landmark cells are chosen by farthest-point selection, and the exact BFS distance from each
+    landmark to every cell is stored. For any two cells p and g and landmark L, the triangle inequality
+    gives |d(L, g) - d(L, p)| <= d(p, g), which is an admissible (and consistent) distance estimate.
+
+    Attributes:
+        maze: the Maze the table was built for
+        landmarks: cell indices (Maze.map order) of the landmarks
+        distances: one compact array per landmark, indexed like Maze.map
+        unreachable: the value stored in distances for walls and unreachable cells
+    """
+    def __init__(self, maze, landmarks, distances):
+        self.maze = maze
+        self.landmarks = landmarks
+        self.distances = distances
+        self.unreachable = (1 << (8 * distances[0].itemsize)) - 1 if distances else 0
+
+    @staticmethod
+    def build(maze, num_landmarks=8):
+        """
+        Summary: Choose landmarks by farthest-point selection and compute their distance arrays
+
+        :param maze: the Maze
+        :param num_landmarks: how many landmarks (k) to place
+        :return: a new LandmarkTable
+        """
+        first_floor = maze.map.find(FLOOR)
+        if first_floor == -1 or num_landmarks < 1:
+            return LandmarkTable(maze, [], [])
+
+        def coords(index):
+            return index % maze.width, maze.height - index // maze.width - 1
+
+        # the first landmark is the cell farthest from an arbitrary floor cell; each later one is the
+        #  reachable cell farthest from all the landmarks chosen so far
+        closest = bfs_distances(maze, *coords(first_floor))
+        landmarks = []
+        raw_distances = []
+        for _ in range(num_landmarks):
+            best_index, best_distance = None, 0
+            for index, distance in enumerate(closest):
+                if distance is not None and distance > best_distance:
+                    best_index, best_distance = index, distance
+            if best_index is None:
+                break
+
+            from_landmark = bfs_distances(maze, *coords(best_index))
+            landmarks.append(best_index)
+            raw_distances.append(from_landmark)
+            closest = [None if c is None else min(c, d) for c, d in zip(closest, from_landmark)]
+
+        if not raw_distances:
+            return LandmarkTable(maze, [], [])
+
+        # 16-bit distances are enough for all but the longest corridors
+        longest = max(max(d for d in distances if d is not None) for distances in raw_distances)
+        typecode = "H" if longest < 0xFFFF else "I"
+        unreachable = 0xFFFF if typecode == "H" else 0xFFFFFFFF
+        distances = [array(typecode, [unreachable if d is None else d for d in raw]) for raw in raw_distances]
+
+        return LandmarkTable(maze, landmarks, distances)
+
+    @staticmethod
+    def load_or_build(maze, num_landmarks=8):
+        """
+        Summary: Load the table saved alongside the maze file, or build it and save it there.
+        A saved table is only used if it was built from the same version of the .maz file
+        with the same number of landmarks. A maze edited in memory (set_floor, so revision > 0) no
+        longer matches its file: its table is built from scratch and not saved, since a table for
+        the wrong walls can overestimate distances.
+
+        :param maze: the Maze (its filename decides where the table is saved)
+        :param num_landmarks: how many landmarks (k) to place
+        :return: a LandmarkTable
+        """
+        if maze.revision != 0:
+            return LandmarkTable.build(maze, num_landmarks)
+
+        table_filename = sidecar_path(maze.filename, ALT_SUFFIX)
+        signature = source_signature(maze.filename)
+
+        table = LandmarkTable.load(maze, table_filename, signature)
+        if table is not None and len(table.landmarks) == num_landmarks:
+            return table
+
+        table = LandmarkTable.build(maze, num_landmarks)
+        try:
+            table.save(table_filename, signature)
+        except OSError:
+            pass
+        return table
+
+    @staticmethod
+    def load(maze, table_filename, signature):
+        """
+        Summary: Read a saved table in a single read
+
+        :param maze: the Maze the table belongs to
+        :param table_filename: path of the saved table
+        :param signature: (mtime_ns, size) of the maze file, from maze_loader.source_signature
+        :return: a LandmarkTable, or None if the file is missing or out of date
+        """
+        try:
+            with open(table_filename, "rb") as f:
+                data = f.read()
+        except OSError:
+            return None
+
+        if len(data) < ALT_HEADER.size:
+            return None
+        magic, version, typecode, width, height, mtime_ns, size, k = ALT_HEADER.unpack_from(data)
+        if (magic != ALT_MAGIC or version != ALT_VERSION or (mtime_ns, size) != signature
+                or (width, height) != (maze.width, maze.height)):
+            return None
+
+        typecode = typecode.decode("ascii")
+        num_cells = width * height
+        itemsize = array(typecode).itemsize
+        offset = ALT_HEADER.size
+        if len(data) != offset + 4 * k + k * num_cells * itemsize:
+            return None
+
+        landmarks = array("I")
+        landmarks.frombytes(data[offset:offset + 4 * k])
+        offset += 4 * k
+
+        distances = []
+        for _ in range(k):
+            distances.append(array(typecode))
+            distances[-1].frombytes(data[offset:offset + num_cells * itemsize])
+            offset += num_cells * itemsize
+
+        return LandmarkTable(maze, landmarks.tolist(), distances)
+
+    def save(self, table_filename, signature):
+        """
+        Summary: Write the table next to the maze so later processes can load it instantly
+
+        :param table_filename: where to write the table
+        :param signature: (mtime_ns, size) of the maze file, from maze_loader.source_signature
+        """
+        typecode = self.distances[0].typecode if self.distances else "H"
+        header = ALT_HEADER.pack(ALT_MAGIC, ALT_VERSION, typecode.encode("ascii"), self.maze.width,
+                                 self.maze.height, signature[0], signature[1], len(self.landmarks))
+        chunks = [header, array("I", self.landmarks).tobytes()]
+        chunks.extend(distances.tobytes() for distances in self.distances)
+        write_atomically(table_filename, chunks)
+
+    def lower_bound(self, x1, y1, x2, y2):
+        """
+        Summary: Admissible estimate of the maze distance between two floor cells, the larger of the
+        Manhattan distance and the best landmark bound
+
+        :return: a lower bound on the number of moves from (x1, y1) to (x2, y2)
+        """
+        p = self.maze.index(x1, y1)
+        g = self.maze.index(x2, y2)
+        unreachable = self.unreachable
+
+        bound = abs(x2 - x1) + abs(y2 - y1)
+        for distances in self.distances:
+            dp = distances[p]
+            dg = distances[g]
+            if dp != unreachable and dg != unreachable:
+                if dp - dg > bound:
+                    bound = dp - dg
+                elif dg - dp > bound:
+                    bound = dg - dp
+        return bound
+
+    def make_heuristic(self, goal_locations):
+        """
+        Summary: A heuristic_fn for astar_search on a MazeworldProblem with the given goals. Each robot
+        pays one unit of fuel per move, so the sum of the per-robot bounds is still admissible.
+
+        :param goal_locations: the goal coordinates, x1, y1, x2, y2, ... as given to MazeworldProblem
+        :return: a function of a MazeworldProblem state (turn indicator first)
+        """
+        goals = tuple(goal_locations)
+        lower_bound = self.lower_bound
+
+        def alt_heuristic(state):
+            total = 0
+            # Loop starts at 1 to skip turn indicator in the tuple
+            for step in range(1, len(state), 2):
+                total += lower_bound(state[step], state[step + 1], goals[step - 1], goals[step])
+            return total
+
+        return alt_heuristic
+
+
+if __name__ == "__main__":
+    from MazeworldProblem import MazeworldProblem
+    from astar_search import astar_search
+
+    test_maze5 = Maze("maze5.maz")
+    table = LandmarkTable.build(test_maze5, 4)
+    print("landmarks:", [(i % test_maze5.width, test_maze5.height - i // test_maze5.width - 1)
+                         for i in table.landmarks])
+
+    test_mp5 = MazeworldProblem(test_maze5, (38, 22, 5, 31))
+    print(astar_search(test_mp5, test_mp5.manhattan_heuristic))
+    print(astar_search(test_mp5, table.make_heuristic(test_mp5.goal_state)))
@@ -1,5 +1,7 @@
 from time import sleep
 
+from maze_loader import load_maze_data, FLOOR, WALL
+
 
 # Maze.py
 #  original version by db, Fall 2017
@@ -28,36 +30,19 @@ from time import sleep
 class Maze:
 
     # internal structure:
-    #   self.walls: set of tuples with wall locations
+    #   self.map: bytearray with one byte per cell ('#' or '.'), top row first
     #   self.width: number of columns
-    #   self.rows
-
-    def __init__(self, mazefilename):
-        self.robotloc = []
-        # read the maze file into a list of strings
-        f = open(mazefilename)
-        lines = []
-        for line in f:
-            line = line.strip()
-            # ignore blank limes
-            if len(line) == 0:
-                pass
-            elif line[0] == "\\":
-                # print("command")
-                # there's only one command, \robot, so assume it is that
-                parms = line.split()
-                x = int(parms[1])
-                y = int(parms[2])
-                self.robotloc.append(x)
-                self.robotloc.append(y)
-            else:
-                lines.append(line)
-        f.close()
-
-        self.width = len(lines[0])
-        self.height = len(lines)
-
-        self.map = list("".join(lines))
+    #   self.height: number of rows
+    #   self.filename: the .maz file the maze was loaded from
+    #   self.revision: incremented every time set_floor changes a cell, so cached
+    #     data derived from the map can tell it is out of date
+
+    def __init__(self, mazefilename, use_cache=False):
+        # the loader memory-maps the file and parses the rows straight into a byte grid;
+        #  with use_cache, it also reads/writes a binary sidecar (see maze_loader.py)
+        self.filename = mazefilename
+        self.width, self.height, self.map, self.robotloc = load_maze_data(mazefilename, use_cache)
+        self.revision = 0
 
     def index(self, x, y):
         return (self.height - y - 1) * self.width + x
@@ -69,7 +54,17 @@ class Maze:
         if y < 0 or y >= self.height:
             return False
 
-        return self.map[self.index(x, y)] == "."
+        return self.map[self.index(x, y)] == FLOOR
+
+    # turns a cell into floor (floor=True) or wall (floor=False), e.g. when a door closes
+    def set_floor(self, x, y, floor=True):
+        if x < 0 or x >= self.width or y < 0 or y >= self.height:
+            raise IndexError("cell ({:d}, {:d}) is outside the maze".format(x, y))
+
+        value = FLOOR if floor else WALL
+        if self.map[self.index(x, y)] != value:
+            self.map[self.index(x, y)] = value
+            self.revision += 1
 
     def has_robot(self, x, y):
         if x < 0 or x >= self.width:
@@ -90,7 +85,7 @@ class Maze:
     #  that they will need to be printed out in.
     def create_render_list(self):
         # print(self.robotloc)
-        renderlist = list(self.map)
+        renderlist = list(self.map.decode("ascii"))
 
         robot_number = 0
         for index in range(0, len(self.robotloc), 2):
@@ -102,22 +97,18 @@ class Maze:
 
         return renderlist
 
-    def __str__(self):
-
-        # render robot locations into the map
+    # the rendered maze as a list of row strings, top row first
+    def render_rows(self):
         renderlist = self.create_render_list()
 
-        # use the renderlist to construct a string, by
-        #  adding newlines appropriately
-
-        s = ""
-        for y in range(self.height - 1, -1, -1):
-            for x in range(self.width):
-                s += renderlist[self.index(x, y)]
+        # the render list is already in row order (top row first), so each row is one slice
+        return ["".join(renderlist[row * self.width:(row + 1) * self.width]) for row in range(self.height)]
 
-            s += "\n"
+    def __str__(self):
 
-        return s
+        # render robot locations into the map, and join the rows with newlines
+        #  (one join, rather than adding characters to a string one at a time)
+        return "".join(row + "\n" for row in self.render_rows())
 
 
 def robotchar(robot_number):
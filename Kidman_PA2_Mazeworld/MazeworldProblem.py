@@ -5,7 +5,7 @@
 import math
 
 from Maze import Maze
-from time import sleep
+from maze_renderer import animate_robots
 
 
 class MazeworldProblem:
@@ -37,21 +37,17 @@ class MazeworldProblem:
         # given a sequence of states (including robot turn), modify the maze and print it out.
         #  (Be careful, this does modify the maze!)
 
-    def animate_path(self, path):
+    def animate_path(self, path, fps=1, out=None, record_file=None):
         """
-        Summary: "Animate" the path taken by the robots through the maze
+        Summary: "Animate" the path taken by the robots through the maze. On a terminal, each frame only
+        redraws the cells that changed (see maze_renderer.py)
 
         :param path: A list of states representing the path the robots took to their goal states
+        :param fps: Frames per second; 0 shows the path as fast as possible
+        :param out: The stream to draw on (default: standard output)
+        :param record_file: If given, every frame is also written to this file, for maze_renderer.py replay
         """
-        # reset the robot locations in the maze
-        self.maze.robotloc = tuple(self.start_state[1:])
-
-        for state in path:
-            print(str(self))
-            self.maze.robotloc = tuple(state[1:])
-            sleep(1)
-
-            print(str(self.maze))
+        animate_robots(self, [state[1:] for state in path], fps, out, record_file)
 
     # Manhattan heuristic only allows horizontal and vertical movement, like in a grid
     def manhattan_heuristic(self, state):
@@ -0,0 +1,303 @@
+# Author: Lauren Kidman
+# Date: 19 October 2026
+# COSC 76: Artificial Intelligence 24F
+
+import math
+import struct
+from array import array
+from collections import deque
+
+from Maze import Maze
+from LandmarkTable import bfs_distances
+from maze_loader import FLOOR, source_signature, sidecar_path, write_atomically
+
+# Sidecar layout (little-endian), one file per goal pair, e.g. maze6.maz.pdb-1-1-6-1:
+#    header: magic "PDB2", version, cost typecode, width, height, source mtime_ns, source size,
+#            number of floor cells F
+#    costs:  F * F joint costs, indexed by floor_index(robot a) * F + floor_index(robot b)
+PDB_MAGIC = b"PDB2"
+PDB_VERSION = 1
+PDB_HEADER = struct.Struct("<4sHcxIIqqI")
+
+# joint tables grow with the square of the floor area
+MAX_PDB_ENTRIES = 64 * 1024 * 1024
+
+
+def floor_cells(maze):
+    """
+    Summary: Number the floor cells of a maze, in Maze.map order
+
+    :param maze: the Maze
+    :return: (index_of, neighbors) -- index_of maps a Maze.map index to its floor number (or -1), and
+        neighbors[f] lists the floor numbers next to floor cell f
+    """
+    width, height, grid = maze.width, maze.height, maze.map
+    index_of = array("i", [-1]) * (width * height)
+    count = 0
+    for index in range(width * height):
+        if grid[index] == FLOOR:
+            index_of[index] = count
+            count += 1
+
+    neighbors = [[] for _ in range(count)]
+    for index in range(width * height):
+        f = index_of[index]
+        if f < 0:
+            continue
+        row, col = divmod(index, width)
+        for neighbor, ok in ((index - 1, col > 0), (index + 1, col < width - 1),
+                             (index - width, row > 0), (index + width, row < height - 1)):
+            if ok and index_of[neighbor] >= 0:
+                neighbors[f].append(index_of[neighbor])
+    return index_of, neighbors
+
+
+class PatternDatabase:
+    """
+    Summary: Exact joint cost for two robots to reach a pair of goal cells, from every pair of positions.
+    Built by a backward breadth-first search over the two-robot state space, where either robot may move
+    into a free neighboring floor cell at cost 1 (waiting is free in Mazeworld, so turn order does not
+    matter). Ignoring every other robot can only make the pair's job easier, so the table is a lower
+    bound on what those two robots must spend in the full problem.
+
+    Attributes:
+        maze: the Maze the table belongs to
+        goal_a, goal_b: the goal cells of the two robots
+        index_of: Maze.map index -> floor number (-1 for walls)
+        num_floor: the number of floor cells, F
+        costs: compact array of F * F joint costs
+        unreachable: the value stored in costs for positions that cannot reach the goals
+    """
+    def __init__(self, maze, goal_a, goal_b, index_of, costs):
+        self.maze = maze
+        self.goal_a = tuple(goal_a)
+        self.goal_b = tuple(goal_b)
+        self.index_of = index_of
+        self.num_floor = int(math.isqrt(len(costs)))
+        self.costs = costs
+        self.unreachable = (1 << (8 * costs.itemsize)) - 1
+
+    @staticmethod
+    def build(maze, goal_a, goal_b, index_of=None, neighbors=None):
+        """
+        Summary: Backward search from the goal pair over all two-robot positions
+
+        :param maze: the Maze
+        :param goal_a: goal (x, y) of the first robot
+        :param goal_b: goal (x, y) of the second robot
+        :param index_of, neighbors: the result of floor_cells(maze), if already computed
+        :return: a new PatternDatabase
+        """
+        if index_of is None:
+            index_of, neighbors = floor_cells(maze)
+        num_floor = len(neighbors)
+        if num_floor * num_floor > MAX_PDB_ENTRIES:
+            raise ValueError("maze has {:d} floor cells, too many for a pairwise pattern database"
+                             .format(num_floor))
+
+        costs = array("H", [0xFFFF]) * (num_floor * num_floor)
+        start = index_of[maze.index(*goal_a)] * num_floor + index_of[maze.index(*goal_b)]
+        costs[start] = 0
+        queue = deque([start])
+
+        # every move is reversible and costs 1, so the backward search is a plain BFS
+        while queue:
+            joint = queue.popleft()
+            a, b = divmod(joint, num_floor)
+            next_cost = costs[joint] + 1
+            if next_cost >= 0xFFFF:
+                raise ValueError("joint costs do not fit in 16 bits")
+            for na in neighbors[a]:
+                if na != b:
+                    child = na * num_floor + b
+                    if costs[child] == 0xFFFF:
+                        costs[child] = next_cost
+                        queue.append(child)
+            for nb in neighbors[b]:
+                if nb != a:
+                    child = joint - b + nb
+                    if costs[child] == 0xFFFF:
+                        costs[child] = next_cost
+                        queue.append(child)
+
+        return PatternDatabase(maze, goal_a, goal_b, index_of, costs)
+
+    @staticmethod
+    def sidecar_filename(maze, goal_a, goal_b):
+        return sidecar_path(maze.filename, ".pdb-{:d}-{:d}-{:d}-{:d}".format(*goal_a, *goal_b))
+
+    @staticmethod
+    def load_or_build(maze, goal_a, goal_b, index_of=None, neighbors=None):
+        """
+        Summary: Load the table for this goal pair saved alongside the maze file, or build and save it.
+        A maze edited in memory (revision > 0) no longer matches its file, so its table is built from
+        scratch and never saved.
+
+        :return: a PatternDatabase
+        """
+        if index_of is None:
+            index_of, neighbors = floor_cells(maze)
+        if maze.revision != 0:
+            return PatternDatabase.build(maze, goal_a, goal_b, index_of, neighbors)
+
+        filename = PatternDatabase.sidecar_filename(maze, goal_a, goal_b)
+        signature = source_signature(maze.filename)
+
+        pdb = PatternDatabase.load(maze, goal_a, goal_b, index_of, filename, signature)
+        if pdb is None:
+            pdb = PatternDatabase.build(maze, goal_a, goal_b, index_of, neighbors)
+            try:
+                pdb.save(filename, signature)
+            except OSError:
+                pass
+        return pdb
+
+    @staticmethod
+    def load(maze, goal_a, goal_b, index_of, filename, signature):
+        """
+        Summary: Read a saved table in a single read
+
+        :return: a PatternDatabase, or None if the file is missing or out of date
+        """
+        try:
+            with open(filename, "rb") as f:
+                data = f.read()
+        except OSError:
+            return None
+
+        if len(data) < PDB_HEADER.size:
+            return None
+        magic, version, typecode, width, height, mtime_ns, size, num_floor = PDB_HEADER.unpack_from(data)
+        if (magic != PDB_MAGIC or version != PDB_VERSION or (mtime_ns, size) != signature
+                or (width, height) != (maze.width, maze.height)):
+            return None
+
+        costs = array(typecode.decode("ascii"))
+        if len(data) != PDB_HEADER.size + num_floor * num_floor * costs.itemsize:
+            return None
+        costs.frombytes(data[PDB_HEADER.size:])
+        return PatternDatabase(maze, goal_a, goal_b, index_of, costs)
+
+    def save(self, filename, signature):
+        header = PDB_HEADER.pack(PDB_MAGIC, PDB_VERSION, self.costs.typecode.encode("ascii"), self.maze.width,
+                                 self.maze.height, signature[0], signature[1], self.num_floor)
+        write_atomically(filename, [header, self.costs.tobytes()])
+
+    def cost(self, xa, ya, xb, yb):
+        """
+        Summary: Exact joint cost for the two robots from (xa, ya) and (xb, yb), ignoring other robots
+
+        :return: the number of moves, or math.inf if the goals cannot be reached
+        """
+        a = self.index_of[self.maze.index(xa, ya)]
+        b = self.index_of[self.maze.index(xb, yb)]
+        value = self.costs[a * self.num_floor + b]
+        return math.inf if value == self.unreachable else value
+
+
+def matchings(robots):
+    """
+    Summary: Every way to split the robots into disjoint pairs, with at most one robot left over
+
+    :param robots: a list of robot numbers
+    :return: a list of (pairs, singles) tuples
+    """
+    if len(robots) < 2:
+        return [([], list(robots))]
+
+    first, rest = robots[0], robots[1:]
+    result = []
+    for i, partner in enumerate(rest):
+        for pairs, singles in matchings(rest[:i] + rest[i + 1:]):
+            result.append(([(first, partner)] + pairs, singles))
+    # with an odd number of robots, the first robot may be the one left over
+    if len(robots) % 2 == 1:
+        for pairs, singles in matchings(rest):
+            if not singles:
+                result.append((pairs, [first]))
+    return result
+
+
+class PairwiseHeuristic:
+    """
+    Summary: Pattern-database heuristics for multi-robot MazeworldProblems. Summing per-robot distances
+    ignores that robots may not share a cell; the pair tables capture exactly that interaction.
+
+    Two ways to combine them, both admissible because each robot's moves are counted at most once:
+        max_heuristic:      the best single pair table plus exact distances for every other robot
+        additive_heuristic: the best split of the robots into disjoint pairs, summing their tables
+
+    Attributes:
+        maze: the Maze
+        goal_locations: the goal coordinates, x1, y1, x2, y2, ... as given to MazeworldProblem
+        pdbs: (i, j) -> PatternDatabase for robots i < j
+        single: per robot, BFS distances from its goal (indexed like Maze.map)
+    """
+    def __init__(self, maze, goal_locations, use_disk_cache=True):
+        self.maze = maze
+        self.goal_locations = tuple(goal_locations)
+        num_robots = len(self.goal_locations) // 2
+        goals = [self.goal_locations[2 * i:2 * i + 2] for i in range(num_robots)]
+
+        self.single = [bfs_distances(maze, *goal) for goal in goals]
+
+        index_of, neighbors = floor_cells(maze)
+        make = PatternDatabase.load_or_build if use_disk_cache else PatternDatabase.build
+        self.pdbs = {}
+        for i in range(num_robots):
+            for j in range(i + 1, num_robots):
+                self.pdbs[i, j] = make(maze, goals[i], goals[j], index_of, neighbors)
+
+        self.matchings = matchings(list(range(num_robots)))
+
+    def single_costs(self, state):
+        costs = []
+        for robot, distances in enumerate(self.single):
+            distance = distances[self.maze.index(state[2 * robot + 1], state[2 * robot + 2])]
+            costs.append(math.inf if distance is None else distance)
+        return costs
+
+    def pair_cost(self, state, i, j):
+        return self.pdbs[i, j].cost(state[2 * i + 1], state[2 * i + 2], state[2 * j + 1], state[2 * j + 2])
+
+    def max_heuristic(self, state):
+        """
+        Summary: Max over robot pairs of (pair table + exact distances of the remaining robots)
+
+        :param state: a MazeworldProblem state (turn indicator first)
+        :return: an admissible estimate of the remaining cost
+        """
+        singles = self.single_costs(state)
+        total = sum(singles)
+        best = total
+        for (i, j) in self.pdbs:
+            best = max(best, total - singles[i] - singles[j] + self.pair_cost(state, i, j))
+        return best
+
+    def additive_heuristic(self, state):
+        """
+        Summary: Max over splits of the robots into disjoint pairs of the summed pair tables
+
+        :param state: a MazeworldProblem state (turn indicator first)
+        :return: an admissible estimate of the remaining cost
+        """
+        singles = self.single_costs(state)
+        pair_costs = {pair: self.pair_cost(state, *pair) for pair in self.pdbs}
+        best = 0
+        for pairs, leftover in self.matchings:
+            best = max(best, sum(pair_costs[pair] for pair in pairs) + sum(singles[i] for i in leftover))
+        return best
+
+
+if __name__ == "__main__":
+    from MazeworldProblem import MazeworldProblem
+    from astar_search import astar_search
+
+    # A tricky corridor maze, where robots constantly get in each other's way
+    test_maze6 = Maze("maze6.maz")
+    test_mp6 = MazeworldProblem(test_maze6, (1, 1, 6, 1, 6, 6))
+    pairwise = PairwiseHeuristic(test_maze6, test_mp6.goal_state)
+
+    print(astar_search(test_mp6, test_mp6.manhattan_heuristic))
+    print(astar_search(test_mp6, pairwise.max_heuristic))
+    print(astar_search(test_mp6, pairwise.additive_heuristic))
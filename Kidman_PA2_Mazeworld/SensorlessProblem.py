@@ -3,7 +3,7 @@
 # COSC 76: Artificial Intelligence 24F
 
 from Maze import Maze
-from time import sleep
+from maze_renderer import animate_robots
 
 
 class SensorlessProblem:
@@ -38,21 +38,17 @@ class SensorlessProblem:
         # given a sequence of states (including robot turn), modify the maze and print it out.
         #  (Be careful, this does modify the maze!)
 
-    def animate_path(self, path):
+    def animate_path(self, path, fps=1, out=None, record_file=None):
         """
-        Summary: "Animate" the path taken by the robots through the maze
+        Summary: "Animate" the path taken by the robots through the maze. On a terminal, each frame only
+        redraws the cells that changed (see maze_renderer.py)
 
         :param path: A list of states representing the path the robots took to their goal states
+        :param fps: Frames per second; 0 shows the path as fast as possible
+        :param out: The stream to draw on (default: standard output)
+        :param record_file: If given, every frame is also written to this file, for maze_renderer.py replay
         """
-        # reset the robot locations in the maze
-        self.maze.robotloc = tuple(self.start_state)
-
-        for state in path:
-            print(str(self))
-            self.maze.robotloc = tuple(state)
-            sleep(1)
-
-            print(str(self.maze))
+        animate_robots(self, [state for state in path], fps, out, record_file)
 
     # For this maze problem, especially as mazes get large, we want the minimum path length
     def h1_min_manhattan(self, state):
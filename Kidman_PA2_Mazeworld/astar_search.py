@@ -2,7 +2,8 @@
 # Date: 18 October 2024
 # COSC 76: Artificial Intelligence 24F
 from SearchSolution import SearchSolution
-from heapq import heappush, heappop
+from heapq import heappush, heappop, nsmallest
+from search_checkpoint import save_search, load_search
 
 
 class AstarNode:
@@ -54,12 +55,22 @@ def backchain(node):
     return result
 
 
-def astar_search(search_problem, heuristic_fn):
+def astar_search(search_problem, heuristic_fn, checkpoint=None, visited=None, observer=None, max_open=None,
+                 max_nodes=None):
     """
     Summary: Performs A* search on the given search problem using the specified heuristic function
 
     :param search_problem: An instance of the MazeworldProblem containing the maze and the goal locations
     :param heuristic_fn: A function that computes the heuristic value for a given state, which guides the search
+    :param checkpoint: Optional search_checkpoint.Checkpointer; the search is saved to its path whenever a
+    checkpoint is due, and can be continued later with resume_astar_search
+    :param visited: Optional empty mapping from state to best cost, used in place of a dict; pass a
+    DiskHashTable.DiskCostMap to keep a very large search's costs on disk instead of in memory
+    :param observer: Optional search_events.SearchObserver, told about every expansion, generated node and goal
+    :param max_open: Optional cap on the open list; past it, the worst nodes are dropped. The search then
+    stays within a fixed memory budget, but is no longer guaranteed to find the optimal (or any) solution
+    :param max_nodes: Optional node budget; the search gives up (with no path, and budget_exceeded set on the
+    solution) once it has visited this many nodes without reaching the goal
     :return: An instance of SearchSolution containing the path to the goal, total cost, and number of nodes visited
     """
     # I'll get you started:
@@ -68,12 +79,86 @@ def astar_search(search_problem, heuristic_fn):
     heappush(pqueue, start_node)
 
     solution = SearchSolution(search_problem, "Astar with heuristic " + heuristic_fn.__name__)
+    if max_open is not None:
+        solution.search_method += ", open list capped at {:d}".format(max_open)
 
-    visited_cost = {}
+    visited_cost = {} if visited is None else visited
     visited_cost[start_node.state] = 0
 
+    return astar_loop(search_problem, heuristic_fn, pqueue, visited_cost, solution, checkpoint, observer, max_open,
+                      max_nodes)
+
+
+def resume_astar_search(search_problem, heuristic_fn, checkpoint_path, checkpoint=None, visited=None,
+                        observer=None, max_open=None, max_nodes=None):
+    """
+    Summary: Continues an A* search from a checkpoint written by astar_search
+
+    :param search_problem: The same search problem the checkpointed search was solving
+    :param heuristic_fn: The same heuristic function (only used for nodes generated from now on)
+    :param checkpoint_path: The checkpoint file to resume from
+    :param checkpoint: Optional Checkpointer for further checkpoints (may point at the same file)
+    :param visited: Optional empty mapping from state to best cost, as for astar_search
+    :param observer: Optional search_events.SearchObserver, as for astar_search
+    :param max_open: Optional cap on the open list, as for astar_search (give the checkpointed search's cap
+    again to keep it)
+    :param max_nodes: Optional node budget, as for astar_search (counting the nodes visited before the checkpoint)
+    :return: An instance of SearchSolution, as from astar_search; nodes_visited includes the nodes
+    visited before the checkpoint
+    """
+    saved = load_search(checkpoint_path, "astar")
+
+    # Parents come before their children in the checkpoint, so the chains can be relinked in one pass
+    nodes = []
+    for state, parent, cost, heuristic in saved["nodes"]:
+        nodes.append(AstarNode(state, heuristic, nodes[parent] if parent >= 0 else None, cost))
+
+    # The open list was saved in heap order, so it is still a valid heap
+    pqueue = [nodes[index] for index in saved["open"]]
+    visited_cost = {} if visited is None else visited
+    visited_cost.update(saved["visited"])
+
+    solution = SearchSolution(search_problem, saved["search_method"])
+    solution.nodes_visited = saved["nodes_visited"]
+
+    return astar_loop(search_problem, heuristic_fn, pqueue, visited_cost, solution, checkpoint, observer,
+                      max_open, max_nodes)
+
+
+def astar_loop(search_problem, heuristic_fn, pqueue, visited_cost, solution, checkpoint=None, observer=None,
+               max_open=None, max_nodes=None):
+    """
+    Summary: The main A* loop, shared by astar_search and resume_astar_search
+
+    :param search_problem: The search problem
+    :param heuristic_fn: The heuristic function
+    :param pqueue: The frontier, a heap of AstarNodes
+    :param visited_cost: The best known cost of every state generated so far
+    :param solution: The SearchSolution to fill in
+    :param checkpoint: Optional Checkpointer
+    :param observer: Optional SearchObserver
+    :param max_open: Optional cap on the open list (solution.nodes_dropped counts the nodes dropped)
+    :param max_nodes: Optional node budget (solution.budget_exceeded tells whether the search ran out of it)
+    :return: solution
+    """
+    if checkpoint is not None:
+        checkpoint.start(solution.nodes_visited)
+    if max_open is not None:
+        solution.nodes_dropped = 0
+    if max_nodes is not None:
+        solution.budget_exceeded = False
+
     # you write the rest:
     while pqueue:
+        if max_nodes is not None and solution.nodes_visited >= max_nodes:
+            solution.budget_exceeded = True
+            break
+
+        # Checkpoint between expansions, so the saved open list and costs are consistent
+        if checkpoint is not None and checkpoint.due(solution.nodes_visited):
+            save_search(checkpoint.path, "astar", solution, pqueue, visited_cost.items())
+            checkpoint.written(solution.nodes_visited)
+
         current_node = heappop(pqueue)
         current_state = current_node.state
 
@@ -84,10 +169,13 @@ def astar_search(search_problem, heuristic_fn):
             solution.path = backchain(current_node)
             solution.cost = current_node.cost
 
+            if observer is not None:
+                observer.goal(current_state, current_node.cost)
             return solution
 
         # Now following the pseudocode from Lecture 6:
-        for child_state in search_problem.get_successors(current_state):
+        successors = search_problem.get_successors(current_state)
+        for child_state in successors:
             child_transition_cost = search_problem.get_cost(current_state, child_state) + current_node.cost
 
             # If child not in explored or child is in frontier with higher f
@@ -101,4 +189,118 @@ def astar_search(search_problem, heuristic_fn):
                 # Add the node to the frontier
                 heappush(pqueue, child_node)
 
+                if observer is not None:
+                    observer.generate(child_state, child_transition_cost, child_node.heuristic)
+
+        if observer is not None:
+            observer.expand(current_state, current_node.cost, current_node.heuristic, len(successors))
+
+        # Over the cap: keep the best three quarters, so trimming only happens once in a while
+        if max_open is not None and len(pqueue) > max_open:
+            keep = max(1, max_open - max_open // 4)
+            solution.nodes_dropped += len(pqueue) - keep
+            # (among nodes with equal f, keep the ones closest to the goal)
+            kept = nsmallest(keep, pqueue, key=lambda node: (node.priority(), node.heuristic))
+            kept_ids = set(id(node) for node in kept)
+            # Forget the dropped states, so they can be reached again later
+            for node in pqueue:
+                if id(node) not in kept_ids and visited_cost.get(node.state) == node.cost:
+                    del visited_cost[node.state]
+            # A sorted list is already a valid heap
+            pqueue[:] = kept
+
+    return solution
+
+
+def beam_astar_search(search_problem, heuristic_fn, beam_width, layer="depth"):
+    """
+    Summary: Beam search, a variant of A* search that keeps only the best beam_width nodes per layer, so its
+    memory and time are bounded by the beam width. The solution is not guaranteed to be optimal, and a narrow
+    beam can miss the goal altogether.
+
+    :param search_problem: The search problem
+    :param heuristic_fn: A function that computes the heuristic value for a given state
+    :param beam_width: The number of nodes kept per layer
+    :param layer: "depth" to keep the best beam_width nodes (by cost + heuristic) of each depth of the search
+    tree, or "f" to expand, for each f-value in turn, only the beam_width nodes with that f-value closest to
+    the goal (by heuristic)
+    :return: An instance of SearchSolution, with nodes_dropped counting the nodes cut from the beam
+    """
+    solution = SearchSolution(search_problem, "Beam search ({:s} layers, width {:d}) with heuristic {:s}".format(
+        layer, beam_width, heuristic_fn.__name__))
+    solution.nodes_dropped = 0
+
+    start_node = AstarNode(search_problem.start_state, heuristic_fn(search_problem.start_state))
+    visited_cost = {start_node.state: 0}
+
+    if layer == "f":
+        # One bucket per f-value, each a heap ordered by heuristic (closest to the goal first); an f-layer
+        #  stops after beam_width expansions, and whatever is left in it is dropped
+        buckets = {start_node.priority(): [(start_node.heuristic, 0, start_node)]}
+        counter = 1   # tie-breaker, so the heaps never compare nodes
+
+        while buckets:
+            f = min(buckets)
+            bucket = buckets.pop(f)
+            expanded = 0
+            while bucket and expanded < beam_width:
+                current_node = heappop(bucket)[2]
+                if current_node.cost > visited_cost[current_node.state]:
+                    continue   # a cheaper copy was found later
+                expanded += 1
+                solution.nodes_visited += 1
+
+                if search_problem.goal_test(current_node.state):
+                    solution.path = backchain(current_node)
+                    solution.cost = current_node.cost
+                    return solution
+
+                for child_state in search_problem.get_successors(current_node.state):
+                    child_cost = search_problem.get_cost(current_node.state, child_state) + current_node.cost
+                    if child_state in visited_cost and child_cost >= visited_cost[child_state]:
+                        continue
+                    visited_cost[child_state] = child_cost
+                    child_node = AstarNode(child_state, heuristic_fn(child_state), current_node, child_cost)
+
+                    # Children in the same f-layer (zero-cost moves, or the heuristic dropping by the step
+                    #  cost) join the layer being expanded
+                    target = bucket if child_node.priority() == f else buckets.setdefault(child_node.priority(), [])
+                    heappush(target, (child_node.heuristic, counter, child_node))
+                    counter += 1
+
+            solution.nodes_dropped += len(bucket)
+
+        return solution
+
+    if layer != "depth":
+        raise ValueError("layer must be \"depth\" or \"f\"")
+
+    beam = [start_node]
+    while beam:
+        # Goal test the whole layer first, and take the cheapest goal in it
+        goal_node = None
+        for node in beam:
+            solution.nodes_visited += 1
+            if search_problem.goal_test(node.state) and (goal_node is None or node.cost < goal_node.cost):
+                goal_node = node
+        if goal_node is not None:
+            solution.path = backchain(goal_node)
+            solution.cost = goal_node.cost
+            return solution
+
+        # The next layer: every child not already reached more cheaply, best copy of each state only
+        children = {}
+        for node in beam:
+            for child_state in search_problem.get_successors(node.state):
+                child_cost = search_problem.get_cost(node.state, child_state) + node.cost
+                if child_state in visited_cost and child_cost >= visited_cost[child_state]:
+                    continue
+                if child_state not in children or child_cost < children[child_state].cost:
+                    children[child_state] = AstarNode(child_state, heuristic_fn(child_state), node, child_cost)
+
+        beam = nsmallest(beam_width, children.values())
+        solution.nodes_dropped += len(children) - len(beam)
+        for node in beam:
+            visited_cost[node.state] = node.cost
+
     return solution
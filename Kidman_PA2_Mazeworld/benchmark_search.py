@@ -0,0 +1,382 @@
+# Author: Lauren Kidman
+# Date: 19 October 2026
+# COSC 76: Artificial Intelligence 24F
+
+# benchmark_search.py
+#  Benchmark runner for the search code. The "scaling" suite generates mazes with maze_generator
+#  and sweeps maze style, maze size, robot count and heuristic across astar_search and bfs_search,
+#  on both MazeworldProblem and SensorlessProblem. Every run is recorded (nodes visited, wall time,
+#  nodes per second, peak memory) in a JSON file, so changes to the search code can be compared
+#  run against run.
+#
+#  The "visited" suite runs the same multi-robot searches with the visited/explored table kept in
+#  memory (dict/set) and on disk (DiskHashTable), and also times raw inserts and lookups, to show
+#  what the disk-backed table costs in throughput.
+#
+#  The "beam" suite shows the trade-off between beam width (or open list cap), solution cost and
+#  time for beam_astar_search and capped astar_search on the maze5 and maze6 problems from
+#  test_mazeworld.py, against plain A* as the optimal reference.
+#
+#  Example:
+#    python benchmark_search.py scaling --sizes 10 20 40 --robots 1 2 --out bench.json
+#    python benchmark_search.py visited --sizes 40 --robots 2 3 --no-memory
+#    python benchmark_search.py beam --beam-widths 1 10 100 --open-caps 100 1000 --no-memory
+
+import argparse
+import json
+import os
+import platform
+import random
+import tempfile
+import time
+import tracemalloc
+
+from Maze import Maze
+from MazeworldProblem import MazeworldProblem
+from SensorlessProblem import SensorlessProblem
+from astar_search import astar_search, beam_astar_search
+from uninformed_search import bfs_search
+from DiskHashTable import DiskCostMap, DiskStateSet
+from maze_generator import STYLES, generate_maze, write_maze, largest_component, pick_cells
+
+
+# null heuristic, useful for testing astar search without heuristic (uniform cost search).
+def null_heuristic(state):
+    return 0
+
+
+class NodeBudgetExceeded(Exception):
+    pass
+
+
+class NodeBudgetProblem:
+    """
+    Summary: Wraps a search problem and stops the search once it has expanded max_nodes nodes.
+    Every search calls goal_test exactly once per node it visits, so that is where we count.
+
+    Attributes:
+        problem: the wrapped search problem
+        max_nodes: the node budget
+        expanded: the number of nodes expanded so far
+    """
+    def __init__(self, problem, max_nodes):
+        self.problem = problem
+        self.max_nodes = max_nodes
+        self.expanded = 0
+
+    def __getattr__(self, name):
+        return getattr(self.problem, name)
+
+    def __str__(self):
+        return str(self.problem)
+
+    def goal_test(self, state):
+        self.expanded += 1
+        if self.expanded > self.max_nodes:
+            raise NodeBudgetExceeded()
+        return self.problem.goal_test(state)
+
+
+def heuristics_for(problem):
+    """
+    Summary: The heuristics we sweep for each kind of problem
+
+    :return: a dict of name -> heuristic function
+    """
+    if isinstance(problem, SensorlessProblem):
+        return {"null": null_heuristic, "min_manhattan": problem.h1_min_manhattan}
+    return {"null": null_heuristic, "manhattan": problem.manhattan_heuristic,
+            "euclidian": problem.euclidian_heuristic}
+
+
+def run_search(problem, algorithm, heuristic_fn, max_nodes, measure_memory, backend="memory", options=None):
+    """
+    Summary: Run one search under a node budget and collect its measurements
+
+    :param problem: the search problem
+    :param algorithm: "astar", "beam" or "bfs"
+    :param heuristic_fn: the heuristic for astar and beam (ignored for bfs)
+    :param max_nodes: node budget
+    :param measure_memory: if True, repeat the run under tracemalloc to find the peak memory
+    :param backend: "memory" for the usual dict/set of visited states, "disk" for a DiskHashTable
+    :param options: extra keyword arguments for the search function (e.g. max_open, beam_width)
+    :return: a dict of measurements
+    """
+    def search():
+        budgeted = NodeBudgetProblem(problem, max_nodes)
+        table = None
+        if backend == "disk":
+            table = DiskCostMap() if algorithm == "astar" else DiskStateSet()
+        try:
+            if algorithm == "astar":
+                solution = astar_search(budgeted, heuristic_fn, visited=table, **(options or {}))
+            elif algorithm == "beam":
+                solution = beam_astar_search(budgeted, heuristic_fn, **options)
+            else:
+                solution = bfs_search(budgeted, explored=table)
+        except NodeBudgetExceeded:
+            solution = None
+        finally:
+            if table is not None:
+                table.close()
+        return solution, budgeted.expanded
+
+    start = time.perf_counter()
+    solution, expanded = search()
+    elapsed = time.perf_counter() - start
+
+    record = {
+        "nodes": min(expanded, max_nodes),
+        "solved": bool(solution is not None and solution.path),
+        "budget_exhausted": solution is None,
+        "cost": solution.cost if solution is not None and solution.path else None,
+        "path_length": len(solution.path) if solution is not None else 0,
+        "nodes_dropped": getattr(solution, "nodes_dropped", None),
+        "wall_time_s": elapsed,
+        "nodes_per_s": min(expanded, max_nodes) / elapsed if elapsed > 0 else None,
+        "peak_memory_bytes": None,
+    }
+
+    # tracemalloc slows the search down, so memory gets its own run
+    if measure_memory:
+        tracemalloc.start()
+        try:
+            search()
+            record["peak_memory_bytes"] = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    return record
+
+
+def make_maze(maze_dir, style, size, num_robots, seed):
+    """
+    Summary: Generate (or reuse) a maze file for the given parameters and load it
+
+    :return: the loaded Maze
+    """
+    filename = os.path.join(maze_dir, "{:s}_{:d}_{:d}r_s{:d}.maz".format(style, size, num_robots, seed))
+    if not os.path.exists(filename):
+        grid, robotloc = generate_maze(style, size, size, num_robots, seed)
+        write_maze(filename, grid, size, size, robotloc)
+    return Maze(filename)
+
+
+def run_scaling_suite(args):
+    """
+    Summary: Sweep maze style, size, robot count, heuristic and search algorithm
+
+    :param args: parsed command line arguments
+    :return: a list of result records
+    """
+    results = []
+    maze_dir = args.maze_dir or tempfile.mkdtemp(prefix="mazes_")
+
+    for style in args.styles:
+        for size in args.sizes:
+            for num_robots in args.robots:
+                maze = make_maze(maze_dir, style, size, num_robots, args.seed)
+                rng = random.Random(args.seed)
+                region = largest_component(maze.map, maze.width, maze.height)
+                goals = tuple(pick_cells(region, num_robots, rng))
+
+                problems = [("mazeworld", MazeworldProblem(maze, goals))]
+                # the blind robot only makes sense once per maze; its state ignores robot count
+                if num_robots == args.robots[0] and size <= args.max_sensorless_size:
+                    problems.append(("sensorless", SensorlessProblem(maze, goals[:2])))
+
+                for problem_name, problem in problems:
+                    runs = [("astar", name, fn) for name, fn in heuristics_for(problem).items()]
+                    runs.append(("bfs", None, None))
+
+                    for algorithm, heuristic_name, heuristic_fn in runs:
+                        record = {
+                            "suite": "scaling",
+                            "problem": problem_name,
+                            "style": style,
+                            "size": size,
+                            "robots": num_robots if problem_name == "mazeworld" else 1,
+                            "algorithm": algorithm,
+                            "heuristic": heuristic_name,
+                        }
+                        record.update(run_search(problem, algorithm, heuristic_fn,
+                                                 args.max_nodes, not args.no_memory))
+                        results.append(record)
+                        if not args.quiet:
+                            print("{problem:10s} {style:8s} {size:5d} r={robots:d} {algorithm:5s} "
+                                  "{heuristic!s:13s} nodes={nodes:8d} t={wall_time_s:8.3f}s "
+                                  "solved={solved}".format(**record))
+    return results
+
+
+def time_table_operations(backend, states):
+    """
+    Summary: Time raw inserts and lookups (half hits, half misses) on a visited table
+
+    :param backend: "memory" or "disk"
+    :param states: the distinct states to insert
+    :return: a dict of operation rates
+    """
+    table = DiskCostMap() if backend == "disk" else {}
+    misses = [state + (-1,) for state in states]
+    try:
+        start = time.perf_counter()
+        for cost, state in enumerate(states):
+            table[state] = cost
+        insert_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        found = sum(1 for state in states if state in table) + sum(1 for state in misses if state in table)
+        lookup_time = time.perf_counter() - start
+    finally:
+        if backend == "disk":
+            table.close()
+
+    assert found == len(states)
+    return {
+        "operations": len(states),
+        "inserts_per_s": len(states) / insert_time if insert_time > 0 else None,
+        "lookups_per_s": 2 * len(states) / lookup_time if lookup_time > 0 else None,
+    }
+
+
+def run_visited_suite(args):
+    """
+    Summary: Compare in-memory and disk-backed visited tables, on raw operations and on full searches
+
+    :param args: parsed command line arguments
+    :return: a list of result records
+    """
+    results = []
+    maze_dir = args.maze_dir or tempfile.mkdtemp(prefix="mazes_")
+
+    # raw table throughput on MazeworldProblem-shaped states
+    rng = random.Random(args.seed)
+    states = list({(rng.randrange(3), rng.randrange(1000), rng.randrange(1000), rng.randrange(1000),
+                    rng.randrange(1000)) for _ in range(args.max_nodes)})
+    for backend in ("memory", "disk"):
+        record = {"suite": "visited", "problem": "table", "backend": backend}
+        record.update(time_table_operations(backend, states))
+        results.append(record)
+        if not args.quiet:
+            print("table      {backend:6s} inserts/s={inserts_per_s:10.0f} "
+                  "lookups/s={lookups_per_s:10.0f}".format(**record))
+
+    for style in args.styles:
+        for size in args.sizes:
+            for num_robots in args.robots:
+                maze = make_maze(maze_dir, style, size, num_robots, args.seed)
+                rng = random.Random(args.seed)
+                region = largest_component(maze.map, maze.width, maze.height)
+                problem = MazeworldProblem(maze, tuple(pick_cells(region, num_robots, rng)))
+
+                for algorithm, heuristic_name, heuristic_fn in (("astar", "manhattan", problem.manhattan_heuristic),
+                                                                 ("bfs", None, None)):
+                    for backend in ("memory", "disk"):
+                        record = {
+                            "suite": "visited",
+                            "problem": "mazeworld",
+                            "style": style,
+                            "size": size,
+                            "robots": num_robots,
+                            "algorithm": algorithm,
+                            "heuristic": heuristic_name,
+                            "backend": backend,
+                        }
+                        record.update(run_search(problem, algorithm, heuristic_fn, args.max_nodes,
+                                                 not args.no_memory, backend))
+                        results.append(record)
+                        if not args.quiet:
+                            print("{style:8s} {size:5d} r={robots:d} {algorithm:5s} {backend:6s} "
+                                  "nodes={nodes:8d} t={wall_time_s:8.3f}s nodes/s={nodes_per_s:10.0f}"
+                                  .format(**record))
+    return results
+
+
+def run_beam_suite(args):
+    """
+    Summary: Sweep beam width (depth and f layers) and open list cap on maze5 and maze6
+
+    :param args: parsed command line arguments
+    :return: a list of result records
+    """
+    results = []
+    here = os.path.dirname(os.path.abspath(__file__))
+    problems = [("maze5", MazeworldProblem(Maze(os.path.join(here, "maze5.maz")), (38, 22, 5, 31))),
+                ("maze6", MazeworldProblem(Maze(os.path.join(here, "maze6.maz")), (1, 1, 6, 1, 6, 6)))]
+
+    for maze_name, problem in problems:
+        runs = [("astar", "optimal", None, {})]
+        runs += [("beam", "depth", width, {"beam_width": width, "layer": "depth"}) for width in args.beam_widths]
+        runs += [("beam", "f", width, {"beam_width": width, "layer": "f"}) for width in args.beam_widths]
+        runs += [("astar", "open_cap", cap, {"max_open": cap}) for cap in args.open_caps]
+
+        optimal = None
+        for algorithm, mode, width, options in runs:
+            record = {
+                "suite": "beam",
+                "problem": "mazeworld",
+                "maze": maze_name,
+                "robots": problem.num_robots,
+                "algorithm": algorithm,
+                "heuristic": "manhattan",
+                "mode": mode,
+                "width": width,
+            }
+            record.update(run_search(problem, algorithm, problem.manhattan_heuristic, args.max_nodes,
+                                     not args.no_memory, options=options))
+            if mode == "optimal":
+                optimal = record["cost"]
+            record["cost_ratio"] = record["cost"] / optimal if record["cost"] is not None and optimal else None
+            results.append(record)
+            if not args.quiet:
+                print("{maze:6s} {mode:8s} {width!s:>6s} cost={cost!s:>5s} ratio={cost_ratio!s:.5s} "
+                      "nodes={nodes:8d} t={wall_time_s:8.3f}s".format(**record))
+    return results
+
+
+SUITES = {
+    "scaling": run_scaling_suite,
+    "visited": run_visited_suite,
+    "beam": run_beam_suite,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the Mazeworld search code")
+    parser.add_argument("suite", choices=sorted(SUITES))
+    parser.add_argument("--styles", nargs="+", choices=STYLES, default=list(STYLES))
+    parser.add_argument("--sizes", nargs="+", type=int, default=[10, 20, 40])
+    parser.add_argument("--robots", nargs="+", type=int, default=[1, 2])
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-nodes", type=int, default=100000,
+                        help="stop any single search after this many expanded nodes")
+    parser.add_argument("--max-sensorless-size", type=int, default=40,
+                        help="largest maze size for SensorlessProblem runs")
+    parser.add_argument("--beam-widths", nargs="+", type=int, default=[1, 2, 5, 10, 20, 50, 100, 200, 500],
+                        help="beam widths for the beam suite")
+    parser.add_argument("--open-caps", nargs="+", type=int, default=[100, 300, 1000, 3000, 10000],
+                        help="open list caps for the beam suite")
+    parser.add_argument("--maze-dir", help="where to keep generated mazes (default: a temp dir)")
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc runs")
+    parser.add_argument("--out", default="bench_output.json")
+    parser.add_argument("--quiet", action="store_true")
+    args = parser.parse_args()
+
+    results = SUITES[args.suite](args)
+
+    report = {
+        "suite": args.suite,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "arguments": vars(args),
+        "results": results,
+    }
+    with open(args.out, "w") as f:
+        json.dump(report, f, indent=1)
+    print("wrote {:d} results to {:s}".format(len(results), args.out))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+# Author: Lauren Kidman
+# Date: 19 October 2026
+# COSC 76: Artificial Intelligence 24F
+
+# bidirectional_search.py
+#  Bidirectional A* for single-robot MazeworldProblems: the MM algorithm (Holte, Felner, Sharon &
+#  Sturtevant 2016), which searches forward from the start and backward from the goal at the same
+#  time and is guaranteed to meet in the middle.
+#
+#  Each direction orders its open list by pr(n) = max(f(n), 2 g(n)), and the direction with the
+#  smaller minimum priority expands next. Whenever a node is generated that the other direction
+#  has already reached, the two half-paths give a candidate solution of cost U. The search stops
+#  once U can no longer be beaten:
+#    U <= max(C, fmin_forward, fmin_backward, gmin_forward + gmin_backward + 1)
+#  where C is the smaller minimum priority and 1 is the cheapest move, so the solution is optimal
+#  as long as the heuristics are admissible. Both directions use front-to-end Manhattan distance
+#  (to the goal going forward, to the start going backward).
+
+import math
+from heapq import heappush, heappop
+
+from SearchSolution import SearchSolution
+
+
+def predecessors(maze, x, y):
+    """
+    Summary: The cells a robot could have moved from to reach (x, y) in one step (the reverse successors)
+
+    :param maze: the Maze
+    :return: a list of (x, y) cells
+    """
+    if not maze.is_floor(x, y):
+        return []
+    return [(px, py) for px, py in ((x + 1, y), (x, y + 1), (x - 1, y), (x, y - 1)) if maze.is_floor(px, py)]
+
+
+class Frontier:
+    """
+    Summary: The open and closed lists of one direction of MM. The open list is kept in three heaps
+    (by priority, by f and by g) with lazy deletion: a heap entry only counts while its cell is still
+    open with that same g.
+
+    Attributes:
+        target: the cell this direction is searching towards (for its heuristic)
+        g: best known cost from this direction's root, for every cell reached
+        parent: the cell each reached cell was reached from
+        open: cell -> g, for the cells in the open list
+        expansions: number of cells expanded
+    """
+    def __init__(self, root, target):
+        self.target = target
+        self.g = {root: 0}
+        self.parent = {root: None}
+        self.open = {}
+        self.by_priority = []
+        self.by_f = []
+        self.by_g = []
+        self.expansions = 0
+        self.add(root, 0)
+
+    def heuristic(self, cell):
+        return abs(cell[0] - self.target[0]) + abs(cell[1] - self.target[1])
+
+    def add(self, cell, g):
+        f = g + self.heuristic(cell)
+        self.open[cell] = g
+        heappush(self.by_priority, (max(f, 2 * g), g, cell))
+        heappush(self.by_f, (f, cell, g))
+        heappush(self.by_g, (g, cell))
+
+    def top(self, heap, g_index, cell_index):
+        # drop stale entries until the smallest one is still open, then return its key
+        while heap:
+            entry = heap[0]
+            if self.open.get(entry[cell_index]) == entry[g_index]:
+                return entry[0]
+            heappop(heap)
+        return math.inf
+
+    def min_priority(self):
+        return self.top(self.by_priority, 1, 2)
+
+    def min_f(self):
+        return self.top(self.by_f, 2, 1)
+
+    def min_g(self):
+        return self.top(self.by_g, 0, 1)
+
+    def pop(self):
+        self.min_priority()
+        _, g, cell = heappop(self.by_priority)
+        del self.open[cell]
+        self.expansions += 1
+        return cell, g
+
+    def chain(self, cell):
+        # cells from cell back to this direction's root
+        cells = []
+        while cell is not None:
+            cells.append(cell)
+            cell = self.parent[cell]
+        return cells
+
+
+def bidirectional_astar_search(search_problem):
+    """
+    Summary: Performs bidirectional A* (MM) search on a single-robot MazeworldProblem
+
+    :param search_problem: a MazeworldProblem with one robot
+    :return: a SearchSolution with an optimal path in the problem's state format (turn, x, y), plus
+        forward_expansions and backward_expansions counts
+    """
+    if search_problem.num_robots != 1:
+        raise ValueError("bidirectional search needs a single-robot problem")
+
+    maze = search_problem.maze
+    start = tuple(search_problem.start_state[1:3])
+    goal = tuple(search_problem.goal_state[0:2])
+
+    solution = SearchSolution(search_problem, "Bidirectional A* (MM) with heuristic manhattan")
+    forward = Frontier(start, goal)
+    backward = Frontier(goal, start)
+
+    best_cost = 0 if start == goal else math.inf
+    meeting_cell = start if start == goal else None
+
+    while forward.open and backward.open:
+        priority_forward = forward.min_priority()
+        priority_backward = backward.min_priority()
+        smallest = min(priority_forward, priority_backward)
+
+        # nothing left in either open list can lead to a cheaper solution
+        if best_cost <= max(smallest, forward.min_f(), backward.min_f(), forward.min_g() + backward.min_g() + 1):
+            break
+
+        if priority_forward <= priority_backward:
+            frontier, other = forward, backward
+            cell, g = frontier.pop()
+            neighbors = [state[1:3] for state in search_problem.get_successors((0,) + cell)]
+        else:
+            frontier, other = backward, forward
+            cell, g = frontier.pop()
+            neighbors = predecessors(maze, *cell)
+
+        for neighbor in neighbors:
+            if neighbor == cell:
+                continue   # waiting in place never helps a single robot
+            child_g = g + 1
+            if neighbor in frontier.g and frontier.g[neighbor] <= child_g:
+                continue
+            frontier.g[neighbor] = child_g
+            frontier.parent[neighbor] = cell
+            frontier.add(neighbor, child_g)
+
+            # the other direction has been here: a complete path
+            if neighbor in other.g and child_g + other.g[neighbor] < best_cost:
+                best_cost = child_g + other.g[neighbor]
+                meeting_cell = neighbor
+
+    solution.forward_expansions = forward.expansions
+    solution.backward_expansions = backward.expansions
+    solution.nodes_visited = forward.expansions + backward.expansions
+
+    if meeting_cell is not None:
+        cells = list(reversed(forward.chain(meeting_cell))) + backward.chain(meeting_cell)[1:]
+        solution.path = [(0,) + cell for cell in cells]
+        solution.cost = best_cost
+    return solution
+
+
+if __name__ == "__main__":
+    from Maze import Maze
+    from MazeworldProblem import MazeworldProblem
+    from astar_search import astar_search
+
+    test_maze5 = Maze("maze5.maz")
+    test_mp5 = MazeworldProblem(test_maze5, (38, 22))
+    test_mp5.start_state = (0, 4, 12)
+
+    print(astar_search(test_mp5, test_mp5.manhattan_heuristic))
+    result = bidirectional_astar_search(test_mp5)
+    print(result)
+    print("forward expansions:", result.forward_expansions, "backward expansions:", result.backward_expansions)
@@ -0,0 +1,272 @@
+# Author: Lauren Kidman
+# Date: 19 October 2026
+# COSC 76: Artificial Intelligence 24F
+
+# hierarchical_search.py
+#  Hierarchical path-finding (HPA*) for single-robot Mazeworld problems on large mazes.
+#
+#  The maze is cut into square clusters. Wherever two neighboring clusters share an open border,
+#  we place entrance cells on both sides; inside each cluster, the distances between its entrances
+#  are precomputed with a small BFS. A query then:
+#    1. connects the start and goal cells to the entrances of their own clusters,
+#    2. runs A* over this small abstract graph of entrances,
+#    3. refines only the chosen corridor, cluster by cluster, into ordinary maze moves.
+#
+#  The abstraction is built once per maze (and cluster size) and cached until the maze changes
+#  (see Maze.set_floor). Paths are near-optimal rather than optimal: they always pass through
+#  entrance cells.
+
+import weakref
+from collections import deque
+from heapq import heappush, heappop
+
+from SearchSolution import SearchSolution
+
+# entrances wider than this get one transition at each end instead of one in the middle
+WIDE_ENTRANCE = 6
+
+# maze -> (maze revision, {cluster_size: MazeAbstraction})
+_abstraction_cache = weakref.WeakKeyDictionary()
+
+
+class MazeAbstraction:
+    """
+    Summary: The abstract graph of cluster entrances for one maze
+
+    Attributes:
+        maze: the Maze being abstracted
+        cluster_size: side length of the square clusters
+        edges: abstract node (x, y) -> list of (neighbor, cost); intra-cluster edges are precomputed
+            BFS distances, inter-cluster edges join the two cells of a transition with cost 1
+        entrances: cluster (cx, cy) -> list of its entrance cells
+    """
+    def __init__(self, maze, cluster_size=10):
+        self.maze = maze
+        self.cluster_size = cluster_size
+        self.edges = {}
+        self.entrances = {}
+
+        self.find_entrances()
+        for cluster, cells in self.entrances.items():
+            for cell in cells:
+                distances, _ = self.cluster_bfs(cell)
+                for other in cells:
+                    if other != cell and other in distances:
+                        self.edges[cell].append((other, distances[other]))
+
+    def cluster_of(self, x, y):
+        return x // self.cluster_size, y // self.cluster_size
+
+    def cluster_bounds(self, cluster):
+        cx, cy = cluster
+        size = self.cluster_size
+        return (cx * size, cy * size,
+                min((cx + 1) * size, self.maze.width), min((cy + 1) * size, self.maze.height))
+
+    def add_transition(self, cell_a, cell_b):
+        # the two cells on either side of a cluster border, joined by a single move
+        for cell in (cell_a, cell_b):
+            if cell not in self.edges:
+                self.edges[cell] = []
+                self.entrances.setdefault(self.cluster_of(*cell), []).append(cell)
+        self.edges[cell_a].append((cell_b, 1))
+        self.edges[cell_b].append((cell_a, 1))
+
+    def add_entrance(self, run):
+        # run is a list of (cell_a, cell_b) pairs along one border, all open on both sides
+        if len(run) < WIDE_ENTRANCE:
+            self.add_transition(*run[len(run) // 2])
+        else:
+            self.add_transition(*run[0])
+            self.add_transition(*run[-1])
+
+    def find_entrances(self):
+        """
+        Summary: Scan every border between neighboring clusters for maximal open runs, and turn each
+        run into one or two transitions
+        """
+        maze = self.maze
+        size = self.cluster_size
+
+        # vertical borders: cell (x, y) on the left, (x + 1, y) on the right
+        for x in range(size - 1, maze.width - 1, size):
+            for y_start in range(0, maze.height, size):
+                run = []
+                for y in range(y_start, min(y_start + size, maze.height)):
+                    if maze.is_floor(x, y) and maze.is_floor(x + 1, y):
+                        run.append(((x, y), (x + 1, y)))
+                    elif run:
+                        self.add_entrance(run)
+                        run = []
+                if run:
+                    self.add_entrance(run)
+
+        # horizontal borders: cell (x, y) below, (x, y + 1) above
+        for y in range(size - 1, maze.height - 1, size):
+            for x_start in range(0, maze.width, size):
+                run = []
+                for x in range(x_start, min(x_start + size, maze.width)):
+                    if maze.is_floor(x, y) and maze.is_floor(x, y + 1):
+                        run.append(((x, y), (x, y + 1)))
+                    elif run:
+                        self.add_entrance(run)
+                        run = []
+                if run:
+                    self.add_entrance(run)
+
+    def cluster_bfs(self, start, goal=None):
+        """
+        Summary: Breadth-first search that never leaves the cluster containing start
+
+        :param start: the (x, y) cell to search from
+        :param goal: optional cell at which to stop early
+        :return: (distances, parents) dicts over the cells reached
+        """
+        left, bottom, right, top = self.cluster_bounds(self.cluster_of(*start))
+        is_floor = self.maze.is_floor
+
+        distances = {start: 0}
+        parents = {start: None}
+        queue = deque([start])
+        while queue:
+            cell = queue.popleft()
+            if cell == goal:
+                break
+            x, y = cell
+            for neighbor in ((x + 1, y), (x, y + 1), (x - 1, y), (x, y - 1)):
+                nx, ny = neighbor
+                if (left <= nx < right and bottom <= ny < top and neighbor not in distances
+                        and is_floor(nx, ny)):
+                    distances[neighbor] = distances[cell] + 1
+                    parents[neighbor] = cell
+                    queue.append(neighbor)
+        return distances, parents
+
+    def refine(self, cell_a, cell_b):
+        """
+        Summary: Turn one abstract edge into concrete cells
+
+        :return: the cells after cell_a up to and including cell_b, and the number of nodes expanded
+        """
+        if abs(cell_a[0] - cell_b[0]) + abs(cell_a[1] - cell_b[1]) == 1:
+            return [cell_b], 0
+
+        distances, parents = self.cluster_bfs(cell_a, cell_b)
+        cells = []
+        cell = cell_b
+        while cell != cell_a:
+            cells.append(cell)
+            cell = parents[cell]
+        cells.reverse()
+        return cells, len(distances)
+
+
+def abstraction_for(maze, cluster_size=10):
+    """
+    Summary: The cached abstraction of a maze, built on first use and rebuilt after the maze changes
+
+    :param maze: the Maze
+    :param cluster_size: side length of the square clusters
+    :return: a MazeAbstraction
+    """
+    revision, per_maze = _abstraction_cache.get(maze, (None, None))
+    if revision != maze.revision:
+        per_maze = {}
+        _abstraction_cache[maze] = (maze.revision, per_maze)
+    if cluster_size not in per_maze:
+        per_maze[cluster_size] = MazeAbstraction(maze, cluster_size)
+    return per_maze[cluster_size]
+
+
+def hpa_search(search_problem, cluster_size=10):
+    """
+    Summary: Hierarchical A* for a single-robot MazeworldProblem
+
+    :param search_problem: a MazeworldProblem with exactly one robot
+    :param cluster_size: side length of the square clusters
+    :return: a SearchSolution whose path uses the MazeworldProblem state format (turn, x, y)
+    """
+    solution = SearchSolution(search_problem, "HPA* with cluster size {:d}".format(cluster_size))
+    if search_problem.num_robots != 1:
+        raise ValueError("hpa_search only handles single-robot problems")
+
+    abstraction = abstraction_for(search_problem.maze, cluster_size)
+    start = tuple(search_problem.start_state[1:3])
+    goal = tuple(search_problem.goal_state[0:2])
+
+    # connect start and goal to the entrances of their clusters (without changing the cached graph)
+    start_distances, _ = abstraction.cluster_bfs(start)
+    goal_distances, _ = abstraction.cluster_bfs(goal)
+    solution.nodes_visited += len(start_distances) + len(goal_distances)
+
+    start_edges = [(cell, start_distances[cell])
+                   for cell in abstraction.entrances.get(abstraction.cluster_of(*start), [])
+                   if cell in start_distances]
+    goal_edges = {cell: goal_distances[cell]
+                  for cell in abstraction.entrances.get(abstraction.cluster_of(*goal), [])
+                  if cell in goal_distances}
+    if goal in start_distances:
+        start_edges.append((goal, start_distances[goal]))
+
+    def heuristic(cell):
+        return abs(goal[0] - cell[0]) + abs(goal[1] - cell[1])
+
+    # A* over the abstract graph
+    best_cost = {start: 0}
+    parents = {start: None}
+    pqueue = [(heuristic(start), 0, start)]
+    found = False
+    while pqueue:
+        _, cost, cell = heappop(pqueue)
+        if cost > best_cost[cell]:
+            continue
+        solution.nodes_visited += 1
+        if cell == goal:
+            found = True
+            break
+
+        neighbors = abstraction.edges.get(cell, [])
+        if cell == start:
+            neighbors = neighbors + start_edges
+        if cell in goal_edges:
+            neighbors = neighbors + [(goal, goal_edges[cell])]
+        for neighbor, edge_cost in neighbors:
+            new_cost = cost + edge_cost
+            if neighbor not in best_cost or new_cost < best_cost[neighbor]:
+                best_cost[neighbor] = new_cost
+                parents[neighbor] = cell
+                heappush(pqueue, (new_cost + heuristic(neighbor), new_cost, neighbor))
+
+    if not found:
+        return solution
+
+    abstract_path = []
+    cell = goal
+    while cell is not None:
+        abstract_path.append(cell)
+        cell = parents[cell]
+    abstract_path.reverse()
+
+    # refine only the chosen corridor
+    cells = [start]
+    for cell_a, cell_b in zip(abstract_path, abstract_path[1:]):
+        refined, expanded = abstraction.refine(cell_a, cell_b)
+        cells.extend(refined)
+        solution.nodes_visited += expanded
+
+    solution.path = [(0, x, y) for x, y in cells]
+    solution.cost = len(cells) - 1
+    return solution
+
+
+if __name__ == "__main__":
+    from Maze import Maze
+    from MazeworldProblem import MazeworldProblem
+    from astar_search import astar_search
+
+    test_maze5 = Maze("maze5.maz")
+    test_maze5.robotloc = [4, 12]
+    test_mp5 = MazeworldProblem(test_maze5, (38, 22))
+
+    print(astar_search(test_mp5, test_mp5.manhattan_heuristic))
+    print(hpa_search(test_mp5, 10))
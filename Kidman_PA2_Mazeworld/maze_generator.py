@@ -0,0 +1,305 @@
+# Author: Lauren Kidman
+# Date: 19 October 2026
+# COSC 76: Artificial Intelligence 24F
+
+# maze_generator.py
+#  Seeded procedural generation of .maz files, so the search code can be tried on mazes much
+#  larger than the hand-made ones (anything from 10x10 up to 1000x1000).
+#
+#  Styles:
+#    open      - an open field with scattered single-cell obstacles
+#    rooms     - rectangular rooms joined by one-cell-wide corridors
+#    diagonal  - long diagonal walls with gaps, like maze5.maz
+#    narrow    - a carved labyrinth of one-cell-wide passages (with a few loops)
+#
+#  Grids are bytearrays in the same order as Maze.map (top row first), so row r of the grid
+#  is y = height - 1 - r in maze coordinates.
+
+import argparse
+import random
+from collections import deque
+
+from maze_loader import FLOOR, WALL
+
+STYLES = ("open", "rooms", "diagonal", "narrow")
+
+
+def generate_open_field(width, height, rng, density=0.12):
+    """
+    Summary: An open field where each cell is independently a wall with the given probability
+
+    :param width: number of columns
+    :param height: number of rows
+    :param rng: a random.Random instance
+    :param density: fraction of cells that become walls
+    :return: the grid as a bytearray
+    """
+    grid = bytearray([FLOOR]) * (width * height)
+    for index in range(width * height):
+        if rng.random() < density:
+            grid[index] = WALL
+    return grid
+
+
+def generate_rooms(width, height, rng, min_room=3, max_room=10):
+    """
+    Summary: Rectangular rooms carved out of solid rock. The maze is split into blocks with one room
+    each; every room is joined to the room on its right, and rooms in the first column (plus a random
+    half of the others) to the room below, so the whole maze is connected by short corridors
+
+    :param width: number of columns
+    :param height: number of rows
+    :param rng: a random.Random instance
+    :param min_room: smallest room side length
+    :param max_room: largest room side length
+    :return: the grid as a bytearray
+    """
+    grid = bytearray([WALL]) * (width * height)
+    block = max_room + 3
+    block_cols = max(1, width // block)
+    block_rows = max(1, height // block)
+    block_w = width // block_cols
+    block_h = height // block_rows
+
+    def carve(x, row):
+        grid[row * width + x] = FLOOR
+
+    # one room per block, at a random size and offset inside it
+    centers = {}
+    for brow in range(block_rows):
+        for bcol in range(block_cols):
+            room_w = rng.randint(min(min_room, block_w), max(1, min(max_room, block_w - 1)))
+            room_h = rng.randint(min(min_room, block_h), max(1, min(max_room, block_h - 1)))
+            left = bcol * block_w + rng.randint(0, block_w - room_w)
+            top = brow * block_h + rng.randint(0, block_h - room_h)
+            for row in range(top, top + room_h):
+                grid[row * width + left:row * width + left + room_w] = bytes([FLOOR]) * room_w
+            centers[bcol, brow] = (left + room_w // 2, top + room_h // 2)
+
+    # L-shaped corridors: horizontal leg first, then vertical
+    for (bcol, brow), (x1, r1) in centers.items():
+        neighbors = [(bcol + 1, brow)]
+        if bcol == 0 or rng.random() < 0.5:
+            neighbors.append((bcol, brow + 1))
+        for neighbor in neighbors:
+            if neighbor not in centers:
+                continue
+            x2, r2 = centers[neighbor]
+            for x in range(min(x1, x2), max(x1, x2) + 1):
+                carve(x, r1)
+            for row in range(min(r1, r2), max(r1, r2) + 1):
+                carve(x2, row)
+
+    return grid
+
+
+def generate_diagonal(width, height, rng, wall_fraction=0.06, gap_every=9):
+    """
+    Summary: An open field crossed by diagonal walls with regular gaps, in the spirit of maze5.maz
+
+    :param width: number of columns
+    :param height: number of rows
+    :param rng: a random.Random instance
+    :param wall_fraction: approximate fraction of cells covered by walls
+    :param gap_every: leave a one-cell gap after this many wall cells
+    :return: the grid as a bytearray
+    """
+    grid = bytearray([FLOOR]) * (width * height)
+    max_length = max(4, min(width, height) // 3)
+    num_walls = max(2, int(wall_fraction * width * height / ((3 + max_length) / 2)))
+
+    for _ in range(num_walls):
+        x = rng.randrange(width)
+        row = rng.randrange(height)
+        dx = rng.choice((-1, 1))
+        for step in range(rng.randint(3, max_length)):
+            if not (0 <= x < width and 0 <= row < height):
+                break
+            if step % gap_every != gap_every - 1:
+                grid[row * width + x] = WALL
+            x += dx
+            row += 1
+
+    return grid
+
+
+def generate_narrow(width, height, rng, loop_fraction=0.05):
+    """
+    Summary: A labyrinth of one-cell-wide passages carved by randomized depth-first search; a few
+    extra walls are knocked out afterwards so that robots have somewhere to pass each other
+
+    :param width: number of columns
+    :param height: number of rows
+    :param rng: a random.Random instance
+    :param loop_fraction: fraction of the remaining interior walls to remove
+    :return: the grid as a bytearray
+    """
+    grid = bytearray([WALL]) * (width * height)
+
+    # passages live on even (column, row) cells, walls in between
+    start = (0, 0)
+    grid[0] = FLOOR
+    stack = [start]
+    while stack:
+        x, row = stack[-1]
+        neighbors = [(x + dx, row + dr) for dx, dr in ((2, 0), (-2, 0), (0, 2), (0, -2))
+                     if 0 <= x + dx < width and 0 <= row + dr < height
+                     and grid[(row + dr) * width + x + dx] == WALL]
+        if not neighbors:
+            stack.pop()
+            continue
+        nx, nrow = rng.choice(neighbors)
+        grid[((row + nrow) // 2) * width + (x + nx) // 2] = FLOOR
+        grid[nrow * width + nx] = FLOOR
+        stack.append((nx, nrow))
+
+    # knock out walls that separate two passages (makes loops)
+    for row in range(height):
+        for x in range(width):
+            index = row * width + x
+            if grid[index] != WALL or rng.random() >= loop_fraction:
+                continue
+            horizontal = 0 < x < width - 1 and grid[index - 1] == FLOOR and grid[index + 1] == FLOOR
+            vertical = 0 < row < height - 1 and grid[index - width] == FLOOR and grid[index + width] == FLOOR
+            if horizontal or vertical:
+                grid[index] = FLOOR
+
+    return grid
+
+
+GENERATORS = {
+    "open": generate_open_field,
+    "rooms": generate_rooms,
+    "diagonal": generate_diagonal,
+    "narrow": generate_narrow,
+}
+
+
+def _flood(grid, width, height, start, seen):
+    # breadth-first flood fill over floor cells; marks them in seen and returns their indices
+    seen[start] = 1
+    queue = deque([start])
+    indices = []
+    while queue:
+        index = queue.popleft()
+        indices.append(index)
+        row, col = divmod(index, width)
+        for neighbor, ok in ((index - 1, col > 0), (index + 1, col < width - 1),
+                             (index - width, row > 0), (index + width, row < height - 1)):
+            if ok and not seen[neighbor] and grid[neighbor] == FLOOR:
+                seen[neighbor] = 1
+                queue.append(neighbor)
+    return indices
+
+
+def _to_cells(indices, width, height):
+    return [(index % width, height - index // width - 1) for index in indices]
+
+
+def floor_component(grid, width, height, x, y):
+    """
+    Summary: All floor cells reachable from (x, y) by north/south/east/west moves
+
+    :param grid: the grid as a bytearray (Maze.map order)
+    :param width: number of columns
+    :param height: number of rows
+    :param x: starting column
+    :param y: starting row, counted from the bottom as in Maze
+    :return: a list of (x, y) tuples, in breadth-first order
+    """
+    start = (height - y - 1) * width + x
+    if grid[start] != FLOOR:
+        return []
+    return _to_cells(_flood(grid, width, height, start, bytearray(width * height)), width, height)
+
+
+def largest_component(grid, width, height):
+    """
+    Summary: The largest set of mutually reachable floor cells
+
+    :param grid: the grid as a bytearray (Maze.map order)
+    :param width: number of columns
+    :param height: number of rows
+    :return: a list of (x, y) tuples (empty if the maze has no floor)
+    """
+    seen = bytearray(width * height)
+    best = []
+    index = grid.find(FLOOR)
+    while index != -1:
+        if not seen[index]:
+            indices = _flood(grid, width, height, index, seen)
+            if len(indices) > len(best):
+                best = indices
+        index = grid.find(FLOOR, index + 1)
+    return _to_cells(best, width, height)
+
+
+def pick_cells(cells, count, rng, exclude=()):
+    """
+    Summary: Choose distinct cells at random
+
+    :param cells: candidate (x, y) cells
+    :param count: how many to choose
+    :param rng: a random.Random instance
+    :param exclude: cells that must not be chosen
+    :return: a flat list x0, y0, x1, y1, ... (the format of Maze.robotloc)
+    """
+    excluded = set(exclude)
+    candidates = [cell for cell in cells if cell not in excluded]
+    if len(candidates) < count:
+        raise ValueError("maze has only {:d} free cells, {:d} requested".format(len(candidates), count))
+    return [coord for cell in rng.sample(candidates, count) for coord in cell]
+
+
+def generate_maze(style, width, height, num_robots=1, seed=0):
+    """
+    Summary: Generate a maze and place robots in its largest connected region
+
+    :param style: one of STYLES
+    :param width: number of columns
+    :param height: number of rows
+    :param num_robots: number of \\robot lines to add
+    :param seed: random seed; the same arguments always give the same maze
+    :return: (grid, robotloc)
+    """
+    rng = random.Random("{:s}-{:d}-{:d}-{:d}".format(style, width, height, seed))
+    grid = GENERATORS[style](width, height, rng)
+    robotloc = pick_cells(largest_component(grid, width, height), num_robots, rng)
+    return grid, robotloc
+
+
+def maze_text(grid, width, height, robotloc):
+    """
+    Summary: Format a grid and robot list in the .maz file format
+
+    :return: the file contents as a string
+    """
+    lines = [grid[row * width:(row + 1) * width].decode("ascii") for row in range(height)]
+    for i in range(0, len(robotloc), 2):
+        lines.append("\\robot {:d} {:d}".format(robotloc[i], robotloc[i + 1]))
+    return "\n".join(lines) + "\n"
+
+
+def write_maze(filename, grid, width, height, robotloc):
+    """
+    Summary: Write a generated maze to a .maz file that Maze can load
+    """
+    with open(filename, "w") as f:
+        f.write(maze_text(grid, width, height, robotloc))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate a .maz file")
+    parser.add_argument("style", choices=STYLES)
+    parser.add_argument("width", type=int)
+    parser.add_argument("height", type=int)
+    parser.add_argument("--robots", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", help="output file (prints the maze if omitted)")
+    args = parser.parse_args()
+
+    maze_grid, robots = generate_maze(args.style, args.width, args.height, args.robots, args.seed)
+    if args.out:
+        write_maze(args.out, maze_grid, args.width, args.height, robots)
+    else:
+        print(maze_text(maze_grid, args.width, args.height, robots), end="")
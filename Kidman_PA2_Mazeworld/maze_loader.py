@@ -0,0 +1,206 @@
+# Author: Lauren Kidman
+# Date: 19 October 2026
+# COSC 76: Artificial Intelligence 24F
+
+# maze_loader.py
+#  Fast loading of .maz files for very large mazes. The text file is memory-mapped and its rows
+#  are copied straight into a single bytearray (one byte per cell, same row order as Maze.map),
+#  so we never build a list of one-character strings.
+#
+#  Optionally, the parsed maze is also written to a compact binary sidecar next to the source
+#  file (maze5.maz -> maze5.maz.mazc). The sidecar is read back in a single read, and is ignored
+#  (and rewritten) whenever the source file's mtime or size no longer match.
+#
+# Sidecar layout (little-endian):
+#    header: magic "MAZC", version, width, height, source mtime_ns, source size, robot count
+#    robots: 2 * robot count signed 32-bit ints (x0, y0, x1, y1, ...)
+#    walls:  one bit per cell (1 = wall), row-major in Maze.map order, padded to a whole byte
+
+import mmap
+import os
+import struct
+from array import array
+
+FLOOR = ord(".")
+WALL = ord("#")
+
+CACHE_SUFFIX = ".mazc"
+CACHE_MAGIC = b"MAZC"
+CACHE_VERSION = 1
+CACHE_HEADER = struct.Struct("<4sHHIIqqI")
+
+# byte translations used to turn the grid into a bit string and back
+_GRID_TO_BITS = bytes(0x30 if i == FLOOR else 0x31 for i in range(256))
+_BITS_TO_GRID = bytes.maketrans(b"01", b".#")
+
+
+def source_signature(filename):
+    """
+    Summary: Identify the current version of a source file, used to invalidate sidecar caches
+
+    :param filename: path of the source file
+    :return: a (mtime_ns, size) tuple
+    """
+    stat = os.stat(filename)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def sidecar_path(filename, suffix):
+    """
+    Summary: Path of a cache file stored alongside a maze file (e.g. maze5.maz -> maze5.maz.mazc)
+
+    :param filename: path of the .maz file
+    :param suffix: the suffix for this kind of cache
+    :return: the sidecar path
+    """
+    return filename + suffix
+
+
+def write_atomically(path, data):
+    """
+    Summary: Write bytes to a file so that other processes never see a half-written cache
+
+    :param path: destination path
+    :param data: the bytes (or bytes-like objects, in order) to write
+    """
+    temp_path = "{:s}.{:d}.tmp".format(path, os.getpid())
+    with open(temp_path, "wb") as f:
+        if isinstance(data, (list, tuple)):
+            for chunk in data:
+                f.write(chunk)
+        else:
+            f.write(data)
+    os.replace(temp_path, path)
+
+
+def parse_maze_text(filename):
+    """
+    Summary: Parse a .maz text file by memory-mapping it and copying each row into a byte grid
+
+    :param filename: path of the .maz file
+    :return: (width, height, grid, robotloc) where grid is a bytearray of the map rows, top row first
+    """
+    grid = bytearray()
+    robotloc = []
+    width = 0
+    height = 0
+
+    with open(filename, "rb") as f:
+        try:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # empty files cannot be mapped
+            data = None
+
+        if data is not None:
+            try:
+                for line in iter(data.readline, b""):
+                    line = line.strip()
+                    # ignore blank lines
+                    if len(line) == 0:
+                        continue
+                    # there's only one command, \robot, so assume it is that
+                    if line[:1] == b"\\":
+                        parms = line.split()
+                        robotloc.append(int(parms[1]))
+                        robotloc.append(int(parms[2]))
+                    else:
+                        if height == 0:
+                            width = len(line)
+                        grid += line
+                        height += 1
+            finally:
+                data.close()
+
+    return width, height, grid, robotloc
+
+
+def write_maze_cache(cache_filename, signature, width, height, grid, robotloc):
+    """
+    Summary: Write the compact binary sidecar for a parsed maze
+
+    :param cache_filename: where to write the sidecar
+    :param signature: (mtime_ns, size) of the source .maz file
+    :param width: number of columns
+    :param height: number of rows
+    :param grid: the byte grid from parse_maze_text
+    :param robotloc: flat list of robot coordinates
+    """
+    num_cells = width * height
+    padded = (num_cells + 7) // 8 * 8
+
+    # every non-floor byte becomes '1', so the whole grid converts to one integer in base 2
+    bits = bytes(grid).translate(_GRID_TO_BITS)
+    bits += b"0" * (padded - num_cells)
+    bitmap = int(bits, 2).to_bytes(padded // 8, "big") if padded else b""
+
+    header = CACHE_HEADER.pack(CACHE_MAGIC, CACHE_VERSION, 0, width, height,
+                               signature[0], signature[1], len(robotloc) // 2)
+    write_atomically(cache_filename, [header, array("i", robotloc).tobytes(), bitmap])
+
+
+def read_maze_cache(cache_filename, signature):
+    """
+    Summary: Read a maze sidecar in a single read, if it exists and matches the source file
+
+    :param cache_filename: path of the sidecar
+    :param signature: (mtime_ns, size) of the source .maz file
+    :return: (width, height, grid, robotloc), or None if the cache is missing or stale
+    """
+    try:
+        with open(cache_filename, "rb") as f:
+            data = f.read()
+    except OSError:
+        return None
+
+    if len(data) < CACHE_HEADER.size:
+        return None
+    magic, version, _, width, height, mtime_ns, size, robot_count = CACHE_HEADER.unpack_from(data)
+    if magic != CACHE_MAGIC or version != CACHE_VERSION or (mtime_ns, size) != signature:
+        return None
+
+    num_cells = width * height
+    padded = (num_cells + 7) // 8 * 8
+    robots_start = CACHE_HEADER.size
+    bitmap_start = robots_start + robot_count * 2 * 4
+    if len(data) != bitmap_start + padded // 8:
+        return None
+
+    robots = array("i")
+    robots.frombytes(data[robots_start:bitmap_start])
+
+    if num_cells:
+        value = int.from_bytes(data[bitmap_start:], "big")
+        bits = format(value, "0{:d}b".format(padded)).encode("ascii")
+        grid = bytearray(bits[:num_cells].translate(_BITS_TO_GRID))
+    else:
+        grid = bytearray()
+
+    return width, height, grid, robots.tolist()
+
+
+def load_maze_data(filename, use_cache=True):
+    """
+    Summary: Load the contents of a .maz file, going through the binary sidecar when allowed
+
+    :param filename: path of the .maz file
+    :param use_cache: if True, read the sidecar when it is fresh and (re)write it otherwise
+    :return: (width, height, grid, robotloc)
+    """
+    if not use_cache:
+        return parse_maze_text(filename)
+
+    signature = source_signature(filename)
+    cache_filename = sidecar_path(filename, CACHE_SUFFIX)
+
+    loaded = read_maze_cache(cache_filename, signature)
+    if loaded is not None:
+        return loaded
+
+    width, height, grid, robotloc = parse_maze_text(filename)
+    try:
+        write_maze_cache(cache_filename, signature, width, height, grid, robotloc)
+    except OSError:
+        # a read-only directory just means no cache; the parsed maze is still good
+        pass
+    return width, height, grid, robotloc
@@ -0,0 +1,184 @@
+# Author: Lauren Kidman
+# Date: 19 October 2026
+# COSC 76: Artificial Intelligence 24F
+
+# maze_renderer.py
+#  Terminal rendering for animate_path. Each frame is a list of text lines (a title line, then the
+#  maze rows). On a terminal only the characters that changed since the previous frame are redrawn,
+#  using ANSI cursor moves, so a long path on a big maze animates smoothly; anywhere else (a file, a
+#  pipe) each frame is written out in full.
+#
+#  Frames can also be recorded to a file, one frame after another with a form feed line between
+#  them, and replayed later:
+#    python maze_renderer.py replay frames.txt --fps 10
+
+import argparse
+import sys
+import time
+
+# a line holding only a form feed separates recorded frames
+FRAME_SEPARATOR = "\f\n"
+
+
+class FrameRenderer:
+    """
+    Summary: Draws a sequence of text frames at a fixed frame rate, redrawing only what changed
+
+    Attributes:
+        fps: frames per second; 0 draws as fast as possible
+        out: the stream to draw on
+        ansi: True to redraw frames in place with ANSI cursor moves, False to write every frame in full
+        record: an open file every frame is also written to (or None)
+        frames: number of frames drawn
+    """
+    def __init__(self, fps=1, out=None, record_file=None, ansi=None):
+        self.fps = fps
+        self.out = sys.stdout if out is None else out
+        if ansi is None:
+            ansi = hasattr(self.out, "isatty") and self.out.isatty()
+        self.ansi = ansi
+        self.record = open(record_file, "w") if record_file is not None else None
+        self.previous = None
+        self.next_time = None
+        self.frames = 0
+
+    def close(self):
+        if self.record is not None:
+            self.record.close()
+            self.record = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def wait(self):
+        # keep a steady rate: sleep only for whatever is left of this frame's time slot
+        if self.fps <= 0:
+            return
+        now = time.monotonic()
+        if self.next_time is not None and self.next_time > now:
+            time.sleep(self.next_time - now)
+            now = self.next_time
+        self.next_time = now + 1 / self.fps
+
+    def draw(self, lines):
+        """
+        Summary: Draw one frame
+
+        :param lines: the frame, a list of strings without newlines
+        """
+        self.wait()
+        if self.ansi and self.previous is not None and len(self.previous) == len(lines):
+            text = self.diff(self.previous, lines)
+        else:
+            text = "".join(line + "\n" for line in lines)
+            if not self.ansi:
+                text += "\n"
+
+        self.out.write(text)
+        self.out.flush()
+        if self.record is not None:
+            self.record.write("".join(line + "\n" for line in lines) + FRAME_SEPARATOR)
+
+        self.previous = lines
+        self.frames += 1
+
+    @staticmethod
+    def diff(old, new):
+        """
+        Summary: ANSI escape sequences turning the frame just drawn into the next one. Assumes the
+        cursor sits at the start of the line below the old frame, and leaves it there.
+
+        :param old: the frame on screen
+        :param new: the next frame, with the same number of lines
+        :return: the text to write
+        """
+        # up to the first line of the frame
+        parts = ["\x1b[{:d}A".format(len(old))]
+        row = 0
+        for line_number, (old_line, new_line) in enumerate(zip(old, new)):
+            if old_line == new_line:
+                continue
+            if line_number > row:
+                parts.append("\x1b[{:d}B".format(line_number - row))
+                row = line_number
+
+            if len(old_line) != len(new_line):
+                # rewrite the whole line and clear whatever is left of the old one
+                parts.append("\r" + new_line + "\x1b[K")
+                continue
+
+            # rewrite each run of changed characters
+            column = 0
+            while column < len(new_line):
+                if old_line[column] == new_line[column]:
+                    column += 1
+                    continue
+                end = column + 1
+                while end < len(new_line) and old_line[end] != new_line[end]:
+                    end += 1
+                parts.append("\x1b[{:d}G".format(column + 1) + new_line[column:end])
+                column = end
+
+        # back down below the frame
+        parts.append("\x1b[{:d}B\r".format(len(old) - row) if len(old) > row else "\r")
+        return "".join(parts)
+
+
+def animate_robots(problem, robot_locations, fps=1, out=None, record_file=None):
+    """
+    Summary: Animate robots moving through a problem's maze. Used by the problems' animate_path.
+    (This modifies the maze's robot locations, leaving them at the last frame.)
+
+    :param problem: the search problem (its str() is the title line, its maze is drawn)
+    :param robot_locations: one robotloc tuple (x1, y1, x2, y2, ...) per frame
+    :param fps: frames per second; 0 for no delay at all
+    :param out: the stream to draw on (default: standard output)
+    :param record_file: if given, also write every frame to this file for replay
+    :return: the number of frames drawn
+    """
+    title = str(problem)
+    with FrameRenderer(fps, out, record_file) as renderer:
+        for robotloc in robot_locations:
+            problem.maze.robotloc = tuple(robotloc)
+            renderer.draw([title] + problem.maze.render_rows())
+        return renderer.frames
+
+
+def read_frames(filename):
+    """
+    Summary: Read the frames recorded by a FrameRenderer
+
+    :return: a list of frames, each a list of lines
+    """
+    with open(filename) as f:
+        chunks = f.read().split(FRAME_SEPARATOR)
+    return [chunk.splitlines() for chunk in chunks if chunk]
+
+
+def replay(filename, fps=10, out=None):
+    """
+    Summary: Play back a recorded animation
+
+    :param filename: the recording
+    :param fps: frames per second; 0 for no delay
+    :param out: the stream to draw on (default: standard output)
+    """
+    with FrameRenderer(fps, out) as renderer:
+        for lines in read_frames(filename):
+            renderer.draw(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay a recorded maze animation")
+    parser.add_argument("command", choices=["replay"])
+    parser.add_argument("filename")
+    parser.add_argument("--fps", type=float, default=10)
+    args = parser.parse_args()
+    replay(args.filename, args.fps)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,275 @@
+# Author: Lauren Kidman
+# Date: 19 October 2026
+# COSC 76: Artificial Intelligence 24F
+
+# parallel_astar.py
+#  Hash-distributed A* (HDA*, Kishimoto, Fukunaga & Botea 2009) across worker processes.
+#
+#  Every state has one owning worker, chosen by hashing the state. Each worker keeps its own open
+#  list and its own table of best costs, but only for the states it owns: when it generates a child
+#  owned by another worker, it sends the child through that worker's queue instead of pushing it.
+#
+#  Goals found by any worker lower a shared incumbent cost, and every worker discards nodes whose
+#  f-value cannot beat it. The search is over when every worker is idle (nothing left below the
+#  incumbent) and no child is still in a queue; the incumbent is then optimal, exactly as in
+#  astar_search, as long as the heuristic is admissible.
+#
+#  States must hash the same way in every process; the tuples of ints used by MazeworldProblem and
+#  SensorlessProblem do.
+
+import math
+import multiprocessing
+import time
+from heapq import heappush, heappop
+from queue import Empty
+
+from SearchSolution import SearchSolution
+
+# expand this many nodes between looking at the inbox and flushing outgoing children
+EXPANSION_BATCH = 64
+# how long an idle worker waits on its inbox before checking for the stop signal again
+IDLE_WAIT = 0.005
+
+
+def owner_of(state, num_workers):
+    return hash(state) % num_workers
+
+
+class _Shared:
+    """
+    Summary: The shared-memory bookkeeping used for incumbent updates and termination detection
+
+    Attributes:
+        incumbent: the cost of the best goal found so far (infinity until one is found)
+        goals_found: number of goal reports sent to the main process
+        idle: per worker, 1 while it has nothing to expand and an empty inbox
+        sent, received: per worker, number of child batches sent to / taken from the queues
+        activity: per worker, incremented whenever it does any work (used to spot changes between checks)
+        stop: set by the main process when the search is over
+    """
+    def __init__(self, context, num_workers):
+        self.incumbent = context.Value("d", math.inf)
+        self.goals_found = context.Value("q", 0)
+        self.idle = context.Array("b", num_workers)
+        self.sent = context.Array("q", num_workers)
+        self.received = context.Array("q", num_workers)
+        self.activity = context.Array("q", num_workers)
+        self.stop = context.Event()
+
+    def snapshot(self):
+        return (all(self.idle[:]), sum(self.sent[:]), sum(self.received[:]), tuple(self.activity[:]))
+
+
+def _worker(worker_id, search_problem, heuristic_fn, inboxes, results, shared):
+    """
+    Summary: One HDA* worker: expands the states it owns and forwards children it does not own
+    """
+    num_workers = len(inboxes)
+    inbox = inboxes[worker_id]
+
+    pqueue = []
+    best_cost = {}
+    parents = {}
+    expanded = 0
+    counter = 0   # last tie-breaker, so the heap never compares states
+    outgoing = [[] for _ in range(num_workers)]
+
+    def add(state, cost, parent):
+        nonlocal counter
+        if state in best_cost and best_cost[state] <= cost:
+            return
+        f = cost + heuristic_fn(state)
+        if f >= shared.incumbent.value:
+            return
+        best_cost[state] = cost
+        parents[state] = parent
+        counter += 1
+        # among equal f, deepest (largest cost) first: on open mazes very many nodes share the optimal
+        #  f, and going deep reaches the goal after expanding only a few of them
+        heappush(pqueue, (f, -cost, counter, state))
+
+    def handle(message):
+        kind = message[0]
+        if kind == "nodes":
+            shared.idle[worker_id] = 0
+            shared.received[worker_id] += 1
+            shared.activity[worker_id] += 1
+            for state, cost, parent in message[1]:
+                add(state, cost, parent)
+        elif kind == "trace":
+            results.put(("parent", message[1], parents.get(message[1])))
+
+    if owner_of(search_problem.start_state, num_workers) == worker_id:
+        add(search_problem.start_state, 0, None)
+
+    while not shared.stop.is_set():
+        # take everything that has arrived
+        while True:
+            try:
+                handle(inbox.get_nowait())
+            except Empty:
+                break
+
+        # nothing left that could beat the incumbent: wait for children from the other workers
+        if not pqueue or pqueue[0][0] >= shared.incumbent.value:
+            pqueue = []
+            shared.idle[worker_id] = 1
+            try:
+                handle(inbox.get(timeout=IDLE_WAIT))
+            except Empty:
+                pass
+            continue
+
+        shared.idle[worker_id] = 0
+        shared.activity[worker_id] += 1
+        for _ in range(EXPANSION_BATCH):
+            if not pqueue:
+                break
+            f, negative_cost, _, state = heappop(pqueue)
+            cost = -negative_cost
+            if cost > best_cost[state]:
+                continue   # a cheaper copy was pushed later
+            if f >= shared.incumbent.value:
+                pqueue = []
+                break
+            expanded += 1
+
+            if search_problem.goal_test(state):
+                with shared.incumbent.get_lock():
+                    if cost < shared.incumbent.value:
+                        shared.incumbent.value = cost
+                        with shared.goals_found.get_lock():
+                            shared.goals_found.value += 1
+                        results.put(("goal", cost, state))
+                continue
+
+            for child in search_problem.get_successors(state):
+                child_cost = cost + search_problem.get_cost(state, child)
+                owner = owner_of(child, num_workers)
+                if owner == worker_id:
+                    add(child, child_cost, state)
+                else:
+                    outgoing[owner].append((child, child_cost, state))
+
+        # send children in one batch per destination
+        for owner in range(num_workers):
+            if outgoing[owner]:
+                shared.sent[worker_id] += 1
+                inboxes[owner].put(("nodes", outgoing[owner]))
+                outgoing[owner] = []
+
+    results.put(("stats", worker_id, expanded))
+
+
+def parallel_astar_search(search_problem, heuristic_fn, num_workers=4):
+    """
+    Summary: Performs hash-distributed parallel A* search on the given search problem
+
+    :param search_problem: the search problem (start_state, get_successors, get_cost, goal_test)
+    :param heuristic_fn: an admissible heuristic, as for astar_search
+    :param num_workers: number of worker processes
+    :return: a SearchSolution, with a worker_expansions list of per-worker expansion counts
+    """
+    solution = SearchSolution(search_problem, "HDA* with heuristic {:s}, {:d} workers".format(
+        heuristic_fn.__name__, num_workers))
+
+    methods = multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context("fork" if "fork" in methods else None)
+    shared = _Shared(context, num_workers)
+    inboxes = [context.Queue() for _ in range(num_workers)]
+    results = context.Queue()
+
+    workers = [context.Process(target=_worker,
+                               args=(i, search_problem, heuristic_fn, inboxes, results, shared),
+                               daemon=True)
+               for i in range(num_workers)]
+    for worker in workers:
+        worker.start()
+
+    best_goal = None
+    goals_received = 0
+
+    def take_results(timeout):
+        nonlocal best_goal, goals_received
+        try:
+            message = results.get(timeout=timeout)
+        except Empty:
+            return None
+        if message[0] == "goal":
+            goals_received += 1
+            if best_goal is None or message[1] < best_goal[0]:
+                best_goal = (message[1], message[2])
+            return None
+        return message
+
+    try:
+        # terminated when two checks in a row see every worker idle, every sent batch received,
+        #  and no worker doing anything in between
+        previous = None
+        while True:
+            take_results(IDLE_WAIT)
+            current = shared.snapshot()
+            if current[0] and current[1] == current[2] and current == previous:
+                break
+            previous = current
+
+        while goals_received < shared.goals_found.value:
+            take_results(IDLE_WAIT)
+
+        # walk the parent links back from the goal, asking each state's owner in turn
+        if best_goal is not None:
+            solution.cost = best_goal[0]
+            path = [best_goal[1]]
+            while True:
+                inboxes[owner_of(path[-1], num_workers)].put(("trace", path[-1]))
+                message = None
+                while message is None:
+                    message = take_results(IDLE_WAIT)
+                if message[2] is None:
+                    break
+                path.append(message[2])
+            path.reverse()
+            solution.path = path
+    finally:
+        shared.stop.set()
+
+    solution.worker_expansions = [0] * num_workers
+    deadline = time.monotonic() + 5.0
+    stats_received = 0
+    while stats_received < num_workers and time.monotonic() < deadline:
+        message = take_results(IDLE_WAIT)
+        if message is not None and message[0] == "stats":
+            solution.worker_expansions[message[1]] = message[2]
+            stats_received += 1
+    solution.nodes_visited = sum(solution.worker_expansions)
+
+    for worker in workers:
+        worker.join(timeout=1.0)
+        if worker.is_alive():
+            worker.terminate()
+
+    return solution
+
+
+if __name__ == "__main__":
+    from Maze import Maze
+    from MazeworldProblem import MazeworldProblem
+    from astar_search import astar_search
+
+    test_maze4 = Maze("maze4.maz")
+    test_mp4 = MazeworldProblem(test_maze4, (5, 5, 4, 5, 6, 5))
+
+    start = time.perf_counter()
+    serial = astar_search(test_mp4, test_mp4.manhattan_heuristic)
+    serial_time = time.perf_counter() - start
+    print(serial, "time:", serial_time)
+
+    for num_workers in (1, 2, 4):
+        start = time.perf_counter()
+        parallel = parallel_astar_search(test_mp4, test_mp4.manhattan_heuristic, num_workers)
+        parallel_time = time.perf_counter() - start
+        # compare the speedup with the expansion ratio: fewer expansions is less work, not parallelism
+        print("{:d} workers: cost {:d}, {:d} expansions ({:.2f}x serial A*), {:.3f}s, speedup {:.2f}".format(
+            num_workers, parallel.cost, parallel.nodes_visited, parallel.nodes_visited / serial.nodes_visited,
+            parallel_time, serial_time / parallel_time))
+        print("expansions per worker:", parallel.worker_expansions)
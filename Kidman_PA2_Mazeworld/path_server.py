@@ -0,0 +1,523 @@
+# Author: Lauren Kidman
+# Date: 19 October 2026
+# COSC 76: Artificial Intelligence 24F
+
+# path_server.py
+#  A long-running local path-planning service, so that Mazeworld queries stop paying for a new
+#  process, maze parsing and heuristic setup every time.
+#
+#  Requests and responses are JSON objects, one per line, over stdin/stdout (the default) or a unix
+#  socket (--socket PATH). A query names a maze file and the goals, and optionally the algorithm,
+#  the heuristic and the robots' start locations (default: the \robot lines of the maze file):
+#
+#    {"id": 1, "maze": "maze4.maz", "goals": [5, 5, 4, 5, 6, 5], "heuristic": "alt"}
+#    {"id": 1, "ok": true, "cost": 26, "nodes_visited": 7120, "path": [...], "latency_ms": 41.7, ...}
+#
+#  algorithm: "astar" (default) or "hpa" (one robot only)
+#  heuristic: "manhattan" (default), "euclidian", "alt", "pairwise_max", "pairwise_additive" or "null"
+#             (uniform cost search, the optimal stand-in for bfs_search)
+#
+#  Every A* query runs under a node budget, --max-nodes by default or the query's own "max_nodes", so
+#  that a query whose goals cannot all be reached together (which makes A* expand the whole joint
+#  state space) cannot tie a worker up indefinitely; it is answered with "node budget exceeded".
+#
+#  Maze names must name a file inside --maze-dir; anything that resolves outside it is refused.
+#
+#  {"op": "metrics"} returns queue depth, batch sizes, cache hits and query latency percentiles
+#  (p50/p90/p99, in milliseconds); {"op": "ping"} just answers.
+#
+#  Queries that arrive within a short window (--batch-window-ms) are batched: they are grouped by
+#  maze, identical queries are solved once, and each group goes to a worker process as one job.
+#  Workers keep loaded Mazes, landmark tables, pattern databases and HPA* abstractions in memory
+#  between jobs, so repeated queries on the same maze only pay for the search itself.
+#
+#  Example:
+#    python path_server.py --workers 4 < queries.jsonl > answers.jsonl
+
+import argparse
+import asyncio
+import json
+import math
+import multiprocessing
+import os
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from Maze import Maze
+from MazeworldProblem import MazeworldProblem
+from LandmarkTable import LandmarkTable
+from PatternDatabase import PairwiseHeuristic
+from astar_search import astar_search
+from hierarchical_search import hpa_search
+from maze_loader import source_signature
+
+ALGORITHMS = ("astar", "hpa")
+HEURISTICS = ("manhattan", "euclidian", "alt", "pairwise_max", "pairwise_additive", "null")
+
+# the node budget of an A* query that does not give its own
+DEFAULT_MAX_NODES = 200000
+
+# latency percentiles are taken over this many of the most recent queries
+LATENCY_WINDOW = 10000
+
+
+# Per-process caches, filled in by the worker processes as they solve queries
+_mazes = {}        # maze filename -> (file signature, Maze)
+_landmarks = {}    # maze filename -> LandmarkTable
+_pairwise = {}     # (maze filename, goals) -> PairwiseHeuristic
+
+
+# null heuristic, useful for testing astar search without heuristic (uniform cost search).
+def null_heuristic(state):
+    return 0
+
+
+def warm_maze(filename):
+    """
+    Summary: The cached Maze for a file, reloaded (and its derived tables dropped) if the file changed
+
+    :return: (maze, True if it was already cached)
+    """
+    signature = source_signature(filename)
+    cached = _mazes.get(filename)
+    if cached is not None and cached[0] == signature:
+        return cached[1], True
+
+    maze = Maze(filename, use_cache=True)
+    _mazes[filename] = (signature, maze)
+    _landmarks.pop(filename, None)
+    for key in [key for key in _pairwise if key[0] == filename]:
+        del _pairwise[key]
+    return maze, False
+
+
+def heuristic_for(filename, maze, problem, name):
+    """
+    Summary: Look up (or build and cache) the heuristic function a query asked for
+
+    :return: a heuristic function of a MazeworldProblem state
+    """
+    if name == "manhattan":
+        return problem.manhattan_heuristic
+    if name == "euclidian":
+        return problem.euclidian_heuristic
+    if name == "null":
+        return null_heuristic
+    if name == "alt":
+        if filename not in _landmarks:
+            _landmarks[filename] = LandmarkTable.load_or_build(maze)
+        return _landmarks[filename].make_heuristic(problem.goal_state)
+
+    key = (filename, problem.goal_state)
+    if key not in _pairwise:
+        _pairwise[key] = PairwiseHeuristic(maze, problem.goal_state)
+    if name == "pairwise_max":
+        return _pairwise[key].max_heuristic
+    return _pairwise[key].additive_heuristic
+
+
+def solve_query(filename, maze, query):
+    """
+    Summary: Run the search for one query on an already loaded maze
+
+    :return: a response dict (without the id)
+    """
+    goals = tuple(query["goals"])
+    start = query.get("start", maze.robotloc)
+    if len(goals) != len(start) or len(goals) % 2 != 0:
+        raise ValueError("need one x, y goal per robot")
+    for i in range(0, len(goals), 2):
+        if not maze.is_floor(goals[i], goals[i + 1]) or not maze.is_floor(start[i], start[i + 1]):
+            raise ValueError("start and goal cells must be floor")
+
+    problem = MazeworldProblem(maze, goals)
+    problem.start_state = tuple([0] + list(start))
+
+    algorithm = query.get("algorithm", "astar")
+    if algorithm == "astar":
+        solution = astar_search(problem, heuristic_for(filename, maze, problem, query.get("heuristic", "manhattan")),
+                                max_nodes=query.get("max_nodes"))
+        if solution.budget_exceeded:
+            return {"ok": False, "error": "node budget exceeded", "nodes_visited": solution.nodes_visited}
+    else:
+        solution = hpa_search(problem)
+
+    return {
+        "ok": True,
+        "solved": bool(solution.path),
+        "cost": solution.cost if solution.path else None,
+        "nodes_visited": solution.nodes_visited,
+        "path": [list(state) for state in solution.path],
+    }
+
+
+def solve_batch(filename, queries):
+    """
+    Summary: Solve a group of queries on the same maze; runs in a worker process
+
+    :param filename: the maze file
+    :param queries: a list of query dicts
+    :return: a list of response dicts, one per query, each with search_ms and warm (cache hit) fields
+    """
+    try:
+        maze, warm = warm_maze(filename)
+    except (OSError, ValueError) as e:
+        return [{"ok": False, "error": "cannot load maze: {:s}".format(str(e))} for _ in queries]
+
+    responses = []
+    for query in queries:
+        start = time.perf_counter()
+        try:
+            response = solve_query(filename, maze, query)
+        except (KeyError, TypeError, ValueError, IndexError) as e:
+            response = {"ok": False, "error": str(e)}
+        response["search_ms"] = 1000 * (time.perf_counter() - start)
+        response["warm"] = warm
+        responses.append(response)
+        # later queries in the same batch find everything loaded
+        warm = True
+    return responses
+
+
+def percentile(values, p):
+    """
+    Summary: Nearest-rank percentile
+
+    :param values: a list of numbers
+    :param p: the percentile, 0 to 100
+    :return: the percentile, or None for an empty list
+    """
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, math.ceil(p / 100 * len(ordered)) - 1))]
+
+
+class PathServer:
+    """
+    Summary: Accepts queries, batches them, runs the batches in a process pool and keeps metrics
+
+    Attributes:
+        workers: the number of worker processes
+        maze_dir: maze names in queries are resolved relative to this directory, and must stay inside it
+        batch_window: how long (seconds) to wait for more queries after the first of a batch
+        max_batch: the largest number of queries in one batch
+        max_nodes: the node budget of an A* query that does not set its own
+        searches: the number of distinct queries actually searched (identical queries in a batch share one)
+        pending: queue of (maze file, query, future, arrival time) waiting to be batched
+        in_flight: number of queries handed to the worker processes and not answered yet
+        latencies: response times (milliseconds) of the most recent queries
+    """
+    def __init__(self, maze_dir=".", workers=None, batch_window=0.002, max_batch=64, max_nodes=DEFAULT_MAX_NODES):
+        self.maze_dir = maze_dir
+        self.max_nodes = max_nodes
+        self.batch_window = batch_window
+        self.max_batch = max_batch
+        self.workers = workers or os.cpu_count() or 1
+        self.pool = self.start_pool()
+        self.pool_restarts = 0
+        self.pending = asyncio.Queue()
+        self.in_flight = 0
+
+        self.started = time.monotonic()
+        self.received = 0
+        self.answered = 0
+        self.failed = 0
+        self.budget_exceeded = 0
+        self.batches = 0
+        self.batched_queries = 0
+        self.searches = 0
+        self.warm_searches = 0
+        self.max_queue_depth = 0
+        self.latencies = deque(maxlen=LATENCY_WINDOW)
+
+    def start_pool(self):
+        # forking while the stdin reader thread holds stdin's lock would hang the worker as it starts,
+        #  so workers start from a clean forkserver (or spawn) process instead
+        methods = multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+        return ProcessPoolExecutor(max_workers=self.workers, mp_context=context)
+
+    def close(self):
+        self.pool.shutdown(wait=False, cancel_futures=True)
+
+    def maze_path(self, name):
+        """
+        Summary: The maze file a query names, which must be inside the maze directory (so a query cannot
+        read, or fill the workers' caches with, any other file the server can open)
+
+        :param name: the maze name from the query
+        :return: the file's real path
+        """
+        maze_dir = os.path.realpath(self.maze_dir)
+        filename = os.path.realpath(os.path.join(maze_dir, name))
+        if os.path.commonpath([maze_dir, filename]) != maze_dir or filename == maze_dir:
+            raise ValueError("maze must be a file in the maze directory")
+        return filename
+
+    def queue_depth(self):
+        return self.pending.qsize() + self.in_flight
+
+    def metrics(self):
+        latencies = list(self.latencies)
+        return {
+            "ok": True,
+            "uptime_s": time.monotonic() - self.started,
+            "queue_depth": self.queue_depth(),
+            "waiting": self.pending.qsize(),
+            "in_flight": self.in_flight,
+            "max_queue_depth": self.max_queue_depth,
+            "received": self.received,
+            "answered": self.answered,
+            "failed": self.failed,
+            "pool_restarts": self.pool_restarts,
+            "budget_exceeded": self.budget_exceeded,
+            "batches": self.batches,
+            "searches": self.searches,
+            "mean_batch_size": self.batched_queries / self.batches if self.batches else None,
+            "warm_searches": self.warm_searches,
+            "query_latency_ms": {
+                "count": len(latencies),
+                "p50": percentile(latencies, 50),
+                "p90": percentile(latencies, 90),
+                "p99": percentile(latencies, 99),
+                "max": max(latencies) if latencies else None,
+            },
+        }
+
+    async def solve(self, query):
+        """
+        Summary: Queue a query and wait for its answer
+
+        :return: a response dict
+        """
+        if not isinstance(query.get("maze"), str) or not isinstance(query.get("goals"), list):
+            raise ValueError("a query needs a maze file name and a goals list")
+        if query.get("algorithm", "astar") not in ALGORITHMS:
+            raise ValueError("algorithm must be one of " + ", ".join(ALGORITHMS))
+        if query.get("heuristic", "manhattan") not in HEURISTICS:
+            raise ValueError("heuristic must be one of " + ", ".join(HEURISTICS))
+        max_nodes = query.get("max_nodes", self.max_nodes)
+        if isinstance(max_nodes, bool) or not isinstance(max_nodes, int) or max_nodes <= 0:
+            raise ValueError("max_nodes must be a positive integer")
+        query["max_nodes"] = max_nodes
+        filename = self.maze_path(query["maze"])
+
+        future = asyncio.get_running_loop().create_future()
+        await self.pending.put((filename, query, future, time.perf_counter()))
+        self.max_queue_depth = max(self.max_queue_depth, self.queue_depth())
+        return await future
+
+    async def batcher(self):
+        """
+        Summary: Forever collect queries into batches and hand each maze's share to the process pool
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self.pending.get()]
+            deadline = loop.time() + self.batch_window
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self.pending.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            # group by maze, and solve identical queries only once
+            groups = {}
+            for filename, query, future, arrived in batch:
+                key = json.dumps([query.get("algorithm", "astar"), query.get("heuristic", "manhattan"),
+                                  query["goals"], query.get("start"), query["max_nodes"]])
+                groups.setdefault(filename, {}).setdefault(key, []).append((query, future, arrived))
+
+            self.batches += 1
+            self.batched_queries += len(batch)
+            self.in_flight += len(batch)
+            for filename, queries in groups.items():
+                # spread a busy maze over all the workers; each job still loads the maze once
+                queries = list(queries.values())
+                chunk = -(-len(queries) // self.workers)
+                for i in range(0, len(queries), chunk):
+                    loop.create_task(self.run_group(filename, queries[i:i + chunk]))
+
+    async def run_group(self, filename, waiting):
+        """
+        Summary: Solve one maze's queries in a worker process and answer everyone waiting on them
+
+        :param filename: the maze file
+        :param waiting: one list of (query, future, arrival time) per distinct query
+        """
+        queries = [entries[0][0] for entries in waiting]
+        loop = asyncio.get_running_loop()
+        pool = self.pool
+        try:
+            responses = await loop.run_in_executor(pool, solve_batch, filename, queries)
+        except BrokenProcessPool as e:
+            # a worker died, which breaks the whole pool; start a new one for the queries still to come
+            #  (only once, however many groups were caught up in the same breakage)
+            if self.pool is pool:
+                self.pool = self.start_pool()
+                self.pool_restarts += 1
+                pool.shutdown(wait=False, cancel_futures=True)
+            responses = [{"ok": False, "error": "worker failed: {:s}".format(repr(e))} for _ in queries]
+        except Exception as e:
+            responses = [{"ok": False, "error": "worker failed: {:s}".format(repr(e))} for _ in queries]
+
+        self.searches += len(queries)
+        now = time.perf_counter()
+        for entries, response in zip(waiting, responses):
+            if response.get("warm"):
+                self.warm_searches += 1
+            if response.get("error") == "node budget exceeded":
+                self.budget_exceeded += len(entries)
+            for _, future, arrived in entries:
+                self.in_flight -= 1
+                self.latencies.append(1000 * (now - arrived))
+                if not future.done():
+                    future.set_result(dict(response))
+
+    async def handle_line(self, line):
+        """
+        Summary: Answer one request line
+
+        :return: the response dict (with the request's id, if it had one)
+        """
+        start = time.perf_counter()
+        request_id = None
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError("a request must be a JSON object")
+            request_id = request.get("id")
+            self.received += 1
+            op = request.get("op", "solve")
+            if op == "metrics":
+                response = self.metrics()
+            elif op == "ping":
+                response = {"ok": True}
+            elif op == "solve":
+                response = await self.solve(request)
+            else:
+                raise ValueError("unknown op {!r}".format(op))
+        except ValueError as e:
+            response = {"ok": False, "error": str(e)}
+
+        if response.get("ok"):
+            self.answered += 1
+        else:
+            self.failed += 1
+        response["id"] = request_id
+        response["latency_ms"] = 1000 * (time.perf_counter() - start)
+        return response
+
+
+async def serve_lines(server, read_line, write_line):
+    """
+    Summary: Answer request lines until read_line returns an empty string. Requests are answered
+    concurrently, so responses can come back out of order; match them up by id.
+
+    :param server: the PathServer
+    :param read_line: coroutine function returning the next line ("" at end of input)
+    :param write_line: coroutine function writing one response line
+    """
+    tasks = set()
+
+    async def answer(line):
+        response = await server.handle_line(line)
+        await write_line(json.dumps(response) + "\n")
+
+    while True:
+        line = await read_line()
+        if not line:
+            break
+        if line.strip():
+            task = asyncio.create_task(answer(line))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+
+    if tasks:
+        await asyncio.gather(*tasks)
+
+
+async def serve_stdio(server):
+    loop = asyncio.get_running_loop()
+    lines = asyncio.Queue()
+
+    # a reader thread works for pipes, files and terminals alike, and keeps reading while the
+    #  event loop is busy, so a burst of queries reaches the batcher together
+    def reader():
+        try:
+            for line in sys.stdin:
+                loop.call_soon_threadsafe(lines.put_nowait, line)
+        finally:
+            loop.call_soon_threadsafe(lines.put_nowait, "")
+
+    threading.Thread(target=reader, daemon=True).start()
+
+    async def write_line(text):
+        sys.stdout.write(text)
+        sys.stdout.flush()
+
+    await serve_lines(server, lines.get, write_line)
+
+
+async def serve_socket(server, path):
+    async def client(reader, writer):
+        async def read_line():
+            return (await reader.readline()).decode("utf-8")
+
+        async def write_line(text):
+            writer.write(text.encode("utf-8"))
+            await writer.drain()
+
+        try:
+            await serve_lines(server, read_line, write_line)
+        finally:
+            writer.close()
+
+    if os.path.exists(path):
+        os.remove(path)
+    unix_server = await asyncio.start_unix_server(client, path=path)
+    async with unix_server:
+        await unix_server.serve_forever()
+
+
+async def run(args):
+    server = PathServer(args.maze_dir, args.workers, args.batch_window_ms / 1000, args.max_batch, args.max_nodes)
+    batcher = asyncio.create_task(server.batcher())
+    try:
+        if args.socket:
+            await serve_socket(server, args.socket)
+        else:
+            await serve_stdio(server)
+    finally:
+        batcher.cancel()
+        server.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local Mazeworld path-planning server (JSON lines)")
+    parser.add_argument("--socket", help="listen on this unix socket instead of stdin/stdout")
+    parser.add_argument("--maze-dir", default=".", help="directory maze names are relative to")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: one per CPU)")
+    parser.add_argument("--batch-window-ms", type=float, default=2.0,
+                        help="how long to wait for more queries to batch with the first one")
+    parser.add_argument("--max-batch", type=int, default=64)
+    parser.add_argument("--max-nodes", type=int, default=DEFAULT_MAX_NODES,
+                        help="node budget of an A* query that does not give its own max_nodes")
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(run(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,267 @@
+# Author: Lauren Kidman
+# Date: 19 October 2026
+# COSC 76: Artificial Intelligence 24F
+
+# search_checkpoint.py
+#  Periodic checkpoints for long-running astar_search and bfs_search runs, so a search that dies
+#  after hours can carry on from its last checkpoint instead of starting over.
+#
+#  A checkpoint holds the open list (frontier), the visited costs (A*) or explored set (BFS), the
+#  search nodes the open list still needs for backchaining, and the node counter. States are packed
+#  into one flat integer array plus a length array, using 16-bit integers whenever they fit, and the
+#  whole file is zlib-compressed.
+#
+#  The visited costs / explored set can be far bigger than memory (a DiskCostMap or DiskStateSet), so
+#  they are never held whole: save_search streams them into the file in chunks of VISITED_CHUNK
+#  states, and load_search hands them back as a generator that reads the file chunk by chunk. Only
+#  the open list and its ancestors are kept in memory.
+#
+# File layout: magic "SCKP", version, then a zlib stream of sections, each a typecode byte, an
+#  unsigned 64-bit item count and the raw array bytes:
+#    kind, search method (both utf-8 bytes), counters (nodes_visited),
+#    node state lengths, node state values, node parents, node costs, node heuristics,
+#    open list node ids,
+#  then, until the end of the stream, one (state lengths, state values, values) triple per chunk of
+#  visited states
+#  (costs, heuristics and visited values are 64-bit ints when every value is an int, else doubles;
+#  BFS leaves the cost, heuristic and value sections empty)
+
+import os
+import struct
+import time
+import zlib
+from array import array
+from itertools import islice
+
+CHECKPOINT_MAGIC = b"SCKP"
+CHECKPOINT_VERSION = 2
+SECTION_HEADER = struct.Struct("<cQ")
+
+# visited states are written and read this many at a time
+VISITED_CHUNK = 1 << 16
+# bytes of the compressed file read at a time
+READ_SIZE = 1 << 20
+
+
+class Checkpointer:
+    """
+    Summary: Decides when a running search should write a checkpoint, and where
+
+    Attributes:
+        path: the checkpoint file (rewritten in place each time)
+        every_nodes: checkpoint after this many more nodes have been visited (None to disable)
+        every_seconds: checkpoint after this much more wall-clock time (None to disable)
+        checkpoints_written: how many checkpoints have been written so far
+    """
+    def __init__(self, path, every_nodes=None, every_seconds=None):
+        self.path = path
+        self.every_nodes = every_nodes
+        self.every_seconds = every_seconds
+        self.checkpoints_written = 0
+        self.last_nodes = 0
+        self.last_time = time.monotonic()
+
+    def start(self, nodes_visited):
+        # a resumed search counts nodes from where it left off
+        self.last_nodes = nodes_visited
+        self.last_time = time.monotonic()
+
+    def due(self, nodes_visited):
+        if self.every_nodes is not None and nodes_visited - self.last_nodes >= self.every_nodes:
+            return True
+        return self.every_seconds is not None and time.monotonic() - self.last_time >= self.every_seconds
+
+    def written(self, nodes_visited):
+        self.checkpoints_written += 1
+        self.start(nodes_visited)
+
+
+def pack_states(states):
+    """
+    Summary: Pack a list of states (tuples of ints) into a length array and one flat value array
+
+    :return: (lengths, values) arrays
+    """
+    lengths = array("I", [len(state) for state in states])
+    flat = [value for state in states for value in state]
+    typecode = "h" if all(-32768 <= value <= 32767 for value in flat) else "q"
+    return lengths, array(typecode, flat)
+
+
+def unpack_states(lengths, values):
+    """
+    Summary: Undo pack_states
+
+    :return: a list of state tuples
+    """
+    states = []
+    offset = 0
+    for length in lengths:
+        states.append(tuple(values[offset:offset + length]))
+        offset += length
+    return states
+
+
+def _numbers(values):
+    # keep integer costs as integers (SearchSolution prints the cost with {:d})
+    values = list(values)
+    return array("q" if all(isinstance(value, int) for value in values) else "d", values)
+
+
+def _write_section(f, compressor, section):
+    header = SECTION_HEADER.pack(section.typecode.encode("ascii"), len(section))
+    f.write(compressor.compress(header + section.tobytes()))
+
+
+def _read_sections(f):
+    """
+    Summary: Read the sections of an open checkpoint file one at a time, decompressing as it goes
+
+    :param f: the checkpoint file, positioned just after the magic and version
+    :return: a generator of arrays
+    """
+    decompressor = zlib.decompressobj()
+    buffer = bytearray()
+
+    def take(size):
+        # the next size bytes of the decompressed stream, or None at its end
+        while len(buffer) < size:
+            data = f.read(READ_SIZE)
+            if not data:
+                if not decompressor.eof:
+                    buffer.extend(decompressor.flush())
+                if len(buffer) < size:
+                    if buffer:
+                        raise ValueError("truncated search checkpoint")
+                    return None
+                break
+            buffer.extend(decompressor.decompress(data))
+        chunk = bytes(buffer[:size])
+        del buffer[:size]
+        return chunk
+
+    while True:
+        header = take(SECTION_HEADER.size)
+        if header is None:
+            return
+        typecode, count = SECTION_HEADER.unpack(header)
+        section = array(typecode.decode("ascii"))
+        if count:
+            section.frombytes(take(count * section.itemsize))
+        yield section
+
+
+def save_search(path, kind, solution, open_nodes, visited):
+    """
+    Summary: Write a checkpoint of a running search
+
+    :param path: the checkpoint file
+    :param kind: "astar" or "bfs"
+    :param solution: the SearchSolution being filled in (for its method name and node counter)
+    :param open_nodes: the frontier, in order (heap order for A*, queue order for BFS)
+    :param visited: A*, an iterable of (state, best cost) pairs; BFS, an iterable of explored states.
+        It is read once, a chunk at a time, so it can be a disk-backed table bigger than memory
+    """
+    # every node the frontier can backchain through, parents always before their children
+    node_ids = {}
+    nodes = []
+    for node in open_nodes:
+        chain = []
+        while node is not None and id(node) not in node_ids:
+            chain.append(node)
+            node = node.parent
+        for ancestor in reversed(chain):
+            node_ids[id(ancestor)] = len(nodes)
+            nodes.append(ancestor)
+
+    has_costs = kind == "astar"
+    node_lengths, node_values = pack_states([node.state for node in nodes])
+    sections = [
+        array("B", kind.encode("utf-8")),
+        array("B", solution.search_method.encode("utf-8")),
+        array("q", [solution.nodes_visited]),
+        node_lengths,
+        node_values,
+        array("q", [-1 if node.parent is None else node_ids[id(node.parent)] for node in nodes]),
+        _numbers(node.cost for node in nodes) if has_costs else array("d"),
+        _numbers(node.heuristic for node in nodes) if has_costs else array("d"),
+        array("I", [node_ids[id(node)] for node in open_nodes]),
+    ]
+
+    temp_path = "{:s}.{:d}.tmp".format(path, os.getpid())
+    with open(temp_path, "wb") as f:
+        f.write(CHECKPOINT_MAGIC + struct.pack("<H", CHECKPOINT_VERSION))
+        compressor = zlib.compressobj(1)
+        for section in sections:
+            _write_section(f, compressor, section)
+
+        visited = iter(visited)
+        while True:
+            chunk = list(islice(visited, VISITED_CHUNK))
+            if not chunk:
+                break
+            if has_costs:
+                lengths, values = pack_states([state for state, _ in chunk])
+                costs = _numbers(cost for _, cost in chunk)
+            else:
+                lengths, values = pack_states(chunk)
+                costs = array("d")
+            for section in (lengths, values, costs):
+                _write_section(f, compressor, section)
+        f.write(compressor.flush())
+    # replace the old checkpoint only once the new one is complete
+    os.replace(temp_path, path)
+
+
+def load_search(path, kind):
+    """
+    Summary: Read a checkpoint written by save_search
+
+    :param path: the checkpoint file
+    :param kind: "astar" or "bfs"; must match the search that wrote the checkpoint
+    :return: a dict with search_method, nodes_visited, nodes (a list of (state, parent index, cost,
+        heuristic) with parents before children), open (node indices) and visited (a generator of
+        (state, value) pairs, value None for BFS, read from the file as it is consumed; consume it once)
+    """
+    f = open(path, "rb")
+    try:
+        if f.read(4) != CHECKPOINT_MAGIC or struct.unpack("<H", f.read(2))[0] != CHECKPOINT_VERSION:
+            raise ValueError("{:s} is not a search checkpoint (of this version)".format(path))
+        sections = _read_sections(f)
+        (saved_kind, method, counters, lengths, values, node_parents,
+         node_costs, node_heuristics, open_ids) = islice(sections, 9)
+    except Exception:
+        f.close()
+        raise
+
+    saved_kind = saved_kind.tobytes().decode("utf-8")
+    if saved_kind != kind:
+        f.close()
+        raise ValueError("checkpoint is for a {:s} search, not {:s}".format(saved_kind, kind))
+
+    states = unpack_states(lengths, values)
+    has_costs = len(node_costs) == len(states)
+    nodes = [(states[i], node_parents[i],
+              node_costs[i] if has_costs else 0, node_heuristics[i] if has_costs else 0)
+             for i in range(len(states))]
+
+    def visited():
+        with f:
+            while True:
+                chunk = list(islice(sections, 3))
+                if not chunk:
+                    return
+                chunk_lengths, chunk_values, chunk_costs = chunk
+                chunk_states = unpack_states(chunk_lengths, chunk_values)
+                if len(chunk_costs) == len(chunk_states):
+                    yield from zip(chunk_states, chunk_costs)
+                else:
+                    yield from ((state, None) for state in chunk_states)
+
+    return {
+        "search_method": method.tobytes().decode("utf-8"),
+        "nodes_visited": counters[0],
+        "nodes": nodes,
+        "open": open_ids.tolist(),
+        "visited": visited(),
+    }
@@ -0,0 +1,163 @@
+# Author: Lauren Kidman
+# Date: 19 October 2026
+# COSC 76: Artificial Intelligence 24F
+
+# search_events.py
+#  Observers for watching a search as it runs. astar_search, bfs_search, dfs_search and ids_search
+#  take an optional observer and call it at three points:
+#    expand(state, cost, heuristic, children)  a node was expanded; children is how many successors
+#                                              get_successors returned (the branching factor)
+#    generate(state, cost, heuristic)          a new search node was put on the frontier
+#    goal(state, cost)                         the goal was reached
+#  For bfs_search, dfs_search and ids_search, cost is the depth of the node and heuristic is always
+#  NaN.
+#
+#  Without an observer the searches only pay for one "is not None" test per node.
+#
+#  TraceRecorder writes the events to a compact binary file; trace_summary.py turns a trace into
+#  histograms of f-values and branching factors.
+
+import math
+import struct
+
+EXPAND = 0
+GENERATE = 1
+GOAL = 2
+EVENT_NAMES = ("expand", "generate", "goal")
+
+# Trace layout (little-endian): header magic "STRC", version, sampling interval, length of the search
+#  method name, the name (utf-8); then one 16-byte record per recorded event:
+#    event kind, children (expand only), sequence number of the event among events of its kind,
+#    cost and heuristic as 32-bit floats
+TRACE_MAGIC = b"STRC"
+TRACE_VERSION = 1
+TRACE_HEADER = struct.Struct("<4sHIH")
+TRACE_RECORD = struct.Struct("<BxHIff")
+
+# write the buffered records out once they reach this many bytes
+TRACE_BUFFER = 1 << 16
+
+
+class SearchObserver:
+    """
+    Summary: Base class for search observers; every event is ignored. Subclasses override the events
+    they care about.
+    """
+    def expand(self, state, cost, heuristic, children):
+        pass
+
+    def generate(self, state, cost, heuristic):
+        pass
+
+    def goal(self, state, cost):
+        pass
+
+
+class SamplingObserver(SearchObserver):
+    """
+    Summary: Passes only every Nth event of each kind on to another observer
+
+    Attributes:
+        observer: the observer that receives the sampled events
+        every: the sampling interval
+        seen: per event kind, how many events have arrived
+    """
+    def __init__(self, observer, every=10):
+        self.observer = observer
+        self.every = every
+        self.seen = [0, 0, 0]
+
+    def expand(self, state, cost, heuristic, children):
+        self.seen[EXPAND] += 1
+        if self.seen[EXPAND] % self.every == 0:
+            self.observer.expand(state, cost, heuristic, children)
+
+    def generate(self, state, cost, heuristic):
+        self.seen[GENERATE] += 1
+        if self.seen[GENERATE] % self.every == 0:
+            self.observer.generate(state, cost, heuristic)
+
+    def goal(self, state, cost):
+        # there is only ever one goal event, so it is never sampled away
+        self.seen[GOAL] += 1
+        self.observer.goal(state, cost)
+
+
+class TraceRecorder(SearchObserver):
+    """
+    Summary: Records search events to a binary trace file (states themselves are not recorded)
+
+    Attributes:
+        filename: the trace file
+        every: record only every Nth event of each kind (goal events are always recorded)
+        seen: per event kind, how many events have arrived
+        recorded: number of records written
+    """
+    def __init__(self, filename, method="", every=1):
+        self.filename = filename
+        self.every = every
+        self.seen = [0, 0, 0]
+        self.recorded = 0
+        self.buffer = bytearray()
+
+        name = method.encode("utf-8")
+        self.file = open(filename, "wb")
+        self.file.write(TRACE_HEADER.pack(TRACE_MAGIC, TRACE_VERSION, every, len(name)) + name)
+
+    def record(self, kind, children, cost, heuristic):
+        sequence = self.seen[kind]
+        self.seen[kind] += 1
+        if sequence % self.every != 0 and kind != GOAL:
+            return
+        self.buffer += TRACE_RECORD.pack(kind, min(children, 0xFFFF), sequence & 0xFFFFFFFF,
+                                         math.nan if cost is None else cost,
+                                         math.nan if heuristic is None else heuristic)
+        self.recorded += 1
+        if len(self.buffer) >= TRACE_BUFFER:
+            self.file.write(self.buffer)
+            self.buffer = bytearray()
+
+    def expand(self, state, cost, heuristic, children):
+        self.record(EXPAND, children, cost, heuristic)
+
+    def generate(self, state, cost, heuristic):
+        self.record(GENERATE, 0, cost, heuristic)
+
+    def goal(self, state, cost):
+        self.record(GOAL, 0, cost, 0)
+
+    def close(self):
+        if self.file is not None:
+            self.file.write(self.buffer)
+            self.buffer = bytearray()
+            self.file.close()
+            self.file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def read_trace(filename):
+    """
+    Summary: Read a trace written by TraceRecorder
+
+    :param filename: the trace file
+    :return: (method, every, records) where records is a list of (kind, children, sequence, cost,
+        heuristic) tuples in the order they were recorded
+    """
+    with open(filename, "rb") as f:
+        data = f.read()
+    if len(data) < TRACE_HEADER.size:
+        raise ValueError("{:s} is not a search trace".format(filename))
+    magic, version, every, name_length = TRACE_HEADER.unpack_from(data)
+    if magic != TRACE_MAGIC or version != TRACE_VERSION:
+        raise ValueError("{:s} is not a search trace".format(filename))
+
+    offset = TRACE_HEADER.size + name_length
+    method = data[TRACE_HEADER.size:offset].decode("utf-8")
+    # a trace cut short (say, by a crash) still yields every complete record
+    end = offset + (len(data) - offset) // TRACE_RECORD.size * TRACE_RECORD.size
+    return method, every, list(TRACE_RECORD.iter_unpack(data[offset:end]))
@@ -55,3 +55,81 @@ result6 = astar_search(test_mp6, test_mp6.manhattan_heuristic)
 print(result6)
 #test_mp6.animate_path(result6.path)
 
+
+# -------------------------------------------------
+# Consistency checks: the other searches and heuristics must find paths as cheap as plain A*
+
+import os
+import tempfile
+
+from DStarLite import DStarLite
+from LandmarkTable import LandmarkTable
+from PatternDatabase import PairwiseHeuristic
+from bidirectional_search import bidirectional_astar_search
+from parallel_astar import parallel_astar_search
+from search_checkpoint import Checkpointer
+from astar_search import resume_astar_search
+from uninformed_search import bfs_search, resume_bfs_search
+
+
+def check_cost(label, result, expected_cost):
+    print("{:s}: cost {:d} (A*: {:d})".format(label, result.cost, expected_cost))
+    assert result.cost == expected_cost, label
+
+
+# ALT and pairwise pattern-database heuristics
+alt5 = LandmarkTable.load_or_build(test_maze5)
+check_cost("ALT, maze5", astar_search(test_mp5, alt5.make_heuristic(test_mp5.goal_state)), result5.cost)
+alt4 = LandmarkTable.load_or_build(test_maze4)
+check_cost("ALT, maze4", astar_search(test_mp4, alt4.make_heuristic(test_mp4.goal_state)), result4.cost)
+pairwise4 = PairwiseHeuristic(test_maze4, test_mp4.goal_state)
+check_cost("pairwise max, maze4", astar_search(test_mp4, pairwise4.max_heuristic), result4.cost)
+check_cost("pairwise additive, maze4", astar_search(test_mp4, pairwise4.additive_heuristic), result4.cost)
+
+# single robot on maze5, for bidirectional search and D* Lite
+single_mp5 = MazeworldProblem(test_maze5, (38, 22))
+single_mp5.start_state = (0, 4, 12)
+single5 = astar_search(single_mp5, single_mp5.manhattan_heuristic)
+check_cost("bidirectional A*, maze5", bidirectional_astar_search(single_mp5), single5.cost)
+
+# D* Lite on its own copy of maze5, since set_floor changes the maze
+dstar_maze5 = Maze("maze5.maz")
+planner = DStarLite(dstar_maze5, (4, 12), (38, 22))
+check_cost("D* Lite, maze5", planner.replan(), single5.cost)
+
+# walk a few steps, then block the cell just ahead of the robot and replan
+route = planner.path()
+planner.move_to(*route[5])
+planner.set_floor(*route[8], False)
+edited_mp5 = MazeworldProblem(dstar_maze5, (38, 22))
+edited_mp5.start_state = (0,) + tuple(route[5])
+edited5 = astar_search(edited_mp5, edited_mp5.manhattan_heuristic)
+check_cost("D* Lite after set_floor, maze5", planner.replan(), edited5.cost)
+# the edited maze must not reuse the landmark table saved for maze5.maz
+edited_alt5 = LandmarkTable.load_or_build(dstar_maze5)
+check_cost("ALT after set_floor, maze5",
+           astar_search(edited_mp5, edited_alt5.make_heuristic(edited_mp5.goal_state)), edited5.cost)
+
+# resuming from a checkpoint written partway through the search
+checkpoint_dir = tempfile.mkdtemp()
+astar_checkpoint = os.path.join(checkpoint_dir, "maze4.astar")
+astar_search(test_mp4, test_mp4.manhattan_heuristic, Checkpointer(astar_checkpoint, every_nodes=5000))
+check_cost("resumed A*, maze4", resume_astar_search(test_mp4, test_mp4.manhattan_heuristic, astar_checkpoint),
+           result4.cost)
+
+bfs_checkpoint = os.path.join(checkpoint_dir, "maze3.bfs")
+bfs_result = bfs_search(test_mp, Checkpointer(bfs_checkpoint, every_nodes=20000))
+resumed_bfs = resume_bfs_search(test_mp, bfs_checkpoint)
+print("resumed BFS, maze3: {:d} steps (BFS: {:d})".format(len(resumed_bfs.path) - 1, len(bfs_result.path) - 1))
+assert len(resumed_bfs.path) == len(bfs_result.path), "resumed BFS, maze3"
+os.remove(astar_checkpoint)
+os.remove(bfs_checkpoint)
+os.rmdir(checkpoint_dir)
+
+# hash-distributed parallel A* (guarded, since the workers are separate processes)
+if __name__ == "__main__":
+    for num_workers in (1, 2):
+        check_cost("HDA* with {:d} workers, maze4".format(num_workers),
+                   parallel_astar_search(test_mp4, test_mp4.manhattan_heuristic, num_workers), result4.cost)
+        check_cost("HDA* with {:d} workers, maze5".format(num_workers),
+                   parallel_astar_search(test_mp5, test_mp5.manhattan_heuristic, num_workers), result5.cost)
@@ -0,0 +1,117 @@
+# Author: Lauren Kidman
+# Date: 19 October 2026
+# COSC 76: Artificial Intelligence 24F
+
+# trace_summary.py
+#  Summarize a search trace recorded by search_events.TraceRecorder: event counts, a histogram of
+#  the f-values (cost + heuristic; just the depth for dfs_search and ids_search) of expanded nodes,
+#  how f progressed over the course of the search, and a histogram of branching factors.
+#
+#  Example:
+#    python trace_summary.py astar.trace --bins 20
+
+import argparse
+import math
+
+from search_events import read_trace, EXPAND, GENERATE, GOAL, EVENT_NAMES
+
+BAR_WIDTH = 50
+
+
+def histogram(values, bins):
+    """
+    Summary: Count values into bins; whole-number values get one bin each when there are few enough
+
+    :param values: a list of numbers
+    :param bins: the largest number of bins
+    :return: a list of (label, count)
+    """
+    if not values:
+        return []
+    low, high = min(values), max(values)
+    if all(value == int(value) for value in values) and high - low < bins:
+        counts = [0] * (int(high - low) + 1)
+        for value in values:
+            counts[int(value - low)] += 1
+        return [("{:g}".format(low + i), count) for i, count in enumerate(counts)]
+
+    width = (high - low) / bins or 1
+    counts = [0] * bins
+    for value in values:
+        counts[min(bins - 1, int((value - low) / width))] += 1
+    return [("{:.2f}-{:.2f}".format(low + i * width, low + (i + 1) * width), count)
+            for i, count in enumerate(counts)]
+
+
+def print_histogram(title, rows):
+    print(title)
+    if not rows:
+        print("  (no data)")
+        return
+    largest = max(count for _, count in rows) or 1
+    label_width = max(len(label) for label, _ in rows)
+    for label, count in rows:
+        print("  {:>{w}s} {:9d} {:s}".format(label, count, "#" * round(BAR_WIDTH * count / largest), w=label_width))
+
+
+def summarize(filename, bins=20, segments=10):
+    """
+    Summary: Print the summary of one trace
+
+    :param filename: the trace file
+    :param bins: the largest number of bins in the f-value histogram
+    :param segments: how many slices of the search to show the f-value progression over
+    """
+    method, every, records = read_trace(filename)
+    print("trace {:s}: {:s}".format(filename, method or "(unnamed search)"))
+    if every > 1:
+        print("sampled every {:d} events; counts below are of recorded events".format(every))
+
+    for kind in (EXPAND, GENERATE, GOAL):
+        recorded = [record for record in records if record[0] == kind]
+        total = recorded[-1][2] + 1 if recorded else 0
+        print("  {:8s} {:9d} recorded, of at least {:d} events".format(EVENT_NAMES[kind], len(recorded), total))
+
+    expansions = [record for record in records if record[0] == EXPAND]
+    # uninformed searches have no heuristic, so their f-value is just the depth (when known)
+    f_values = [cost + (0 if math.isnan(heuristic) else heuristic) for _, _, _, cost, heuristic in expansions
+                if not math.isnan(cost)]
+    print()
+    print_histogram("f-values of expanded nodes:", histogram(f_values, bins))
+
+    if f_values:
+        print()
+        print("f-value progression (slices of the search, in expansion order):")
+        size = max(1, -(-len(f_values) // segments))
+        for start in range(0, len(f_values), size):
+            part = f_values[start:start + size]
+            print("  expansions {:9d}-{:<9d} f min {:9.2f} mean {:9.2f} max {:9.2f}".format(
+                start * every, (start + len(part)) * every - 1, min(part), sum(part) / len(part), max(part)))
+
+    branching = [children for _, children, _, _, _ in expansions]
+    print()
+    print_histogram("branching factor (successors per expansion):", histogram(branching, bins))
+    if branching:
+        print("  mean branching factor {:.3f}".format(sum(branching) / len(branching)))
+
+    goals = [record for record in records if record[0] == GOAL]
+    if goals:
+        print()
+        print("goal reached at cost {:g}".format(goals[-1][3]))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Summarize search traces written by search_events.TraceRecorder")
+    parser.add_argument("traces", nargs="+")
+    parser.add_argument("--bins", type=int, default=20, help="most bins in the f-value histogram")
+    parser.add_argument("--segments", type=int, default=10, help="slices for the f-value progression")
+    args = parser.parse_args()
+
+    for i, filename in enumerate(args.traces):
+        if i > 0:
+            print()
+        summarize(filename, args.bins, args.segments)
+
+
+if __name__ == "__main__":
+    main()
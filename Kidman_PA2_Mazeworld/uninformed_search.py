@@ -2,7 +2,9 @@
 # Date: 4 October 2024
 # COSC 76: Artificial Intelligence 24F
 from collections import deque
+import math
 from SearchSolution import SearchSolution
+from search_checkpoint import save_search, load_search
 
 
 class SearchNode:
@@ -13,6 +15,7 @@ class SearchNode:
     Attributes:
         state: The state represented by the node.
         parent: The parent node that led to this state. The root node will have no parent (None).
+        depth: The number of moves from the root to this node.
     """
 
     # Each search node except the root has a parent node
@@ -20,6 +23,7 @@ class SearchNode:
     def __init__(self, state, parent=None):
         self.state = state
         self.parent = parent
+        self.depth = parent.depth + 1 if parent is not None else 0
 
 
 def backchain(search_node):
@@ -43,12 +47,17 @@ def backchain(search_node):
     return path[::-1]  # Reverse it to go from beginning to end
 
 
-def bfs_search(search_problem):
+def bfs_search(search_problem, checkpoint=None, explored=None, observer=None):
     """
     Summary: Performs a breadth-first search, utilizing memoization, on a given search problem
 
     :param search_problem: an object that contains a start state, a goal state, and a method to get successors
     from a given state
+    :param checkpoint: optional search_checkpoint.Checkpointer; the search is saved to its path whenever a
+    checkpoint is due, and can be continued later with resume_bfs_search
+    :param explored: optional empty set-like container of states, used in place of a set; pass a
+    DiskHashTable.DiskStateSet to keep a very large search's explored states on disk instead of in memory
+    :param observer: optional search_events.SearchObserver, told about every expansion, generated node and goal
 
     :return: an object SearchSolution that contains the method of finding the solution, the path from the start state
     to the goal state, and the number of nodes visited
@@ -59,10 +68,66 @@ def bfs_search(search_problem):
     root = SearchNode(search_problem.start_state, None)
 
     frontier = deque([root])  # Fringe is a FIFO queue
-    explored = set()  # Establish a set of visited nodes to ensure the same state is not explored more than once
+    if explored is None:
+        explored = set()  # Establish a set of visited nodes to ensure the same state is not explored more than once
     explored.add(root.state)
 
+    return bfs_loop(search_problem, frontier, explored, search_solution, checkpoint, observer)
+
+
+def resume_bfs_search(search_problem, checkpoint_path, checkpoint=None, explored=None, observer=None):
+    """
+    Summary: Continues a breadth-first search from a checkpoint written by bfs_search
+
+    :param search_problem: the same search problem the checkpointed search was solving
+    :param checkpoint_path: the checkpoint file to resume from
+    :param checkpoint: optional Checkpointer for further checkpoints (may point at the same file)
+    :param explored: optional empty set-like container of states, as for bfs_search
+    :param observer: optional search_events.SearchObserver, as for bfs_search
+
+    :return: an object SearchSolution, as from bfs_search; nodes_visited includes the nodes visited before
+    the checkpoint
+    """
+    saved = load_search(checkpoint_path, "bfs")
+
+    # Parents come before their children in the checkpoint, so the chains can be relinked in one pass
+    nodes = []
+    for state, parent, _, _ in saved["nodes"]:
+        nodes.append(SearchNode(state, nodes[parent] if parent >= 0 else None))
+
+    frontier = deque(nodes[index] for index in saved["open"])
+    if explored is None:
+        explored = set()
+    explored.update(state for state, _ in saved["visited"])
+
+    search_solution = SearchSolution(search_problem, saved["search_method"])
+    search_solution.nodes_visited = saved["nodes_visited"]
+
+    return bfs_loop(search_problem, frontier, explored, search_solution, checkpoint, observer)
+
+
+def bfs_loop(search_problem, frontier, explored, search_solution, checkpoint=None, observer=None):
+    """
+    Summary: The main breadth-first search loop, shared by bfs_search and resume_bfs_search
+
+    :param search_problem: the search problem
+    :param frontier: the FIFO queue of SearchNodes
+    :param explored: the set of states already seen
+    :param search_solution: the SearchSolution to fill in
+    :param checkpoint: optional Checkpointer
+    :param observer: optional SearchObserver (a node's cost is its depth)
+
+    :return: search_solution
+    """
+    if checkpoint is not None:
+        checkpoint.start(search_solution.nodes_visited)
+
     while frontier:
+        # Checkpoint between expansions, so the saved frontier and explored set are consistent
+        if checkpoint is not None and checkpoint.due(search_solution.nodes_visited):
+            save_search(checkpoint.path, "bfs", search_solution, list(frontier), explored)
+            checkpoint.written(search_solution.nodes_visited)
+
         search_solution.nodes_visited += 1
         current_node = frontier.popleft()  # Use popleft since standard pop pulls from the last element of the list
         current_state = current_node.state
@@ -71,12 +136,15 @@ def bfs_search(search_problem):
         if search_problem.goal_test(current_state):
             # Use backchain to extract the goal path from the tree:
             search_solution.path = backchain(current_node)
+            if observer is not None:
+                observer.goal(current_state, len(search_solution.path) - 1)
             return search_solution
 
         # Otherwise, continue progressing through node children and building the frontier
         else:
             # Look through the next *level* of child states (as BFS)
-            for child_state in search_problem.get_successors(current_state):
+            successors = search_problem.get_successors(current_state)
+            for child_state in successors:
                 # If the child has not already been visited, we add so it can be explored
                 if child_state not in explored:
                     # Pack child state into a node, with backpointer to current_node
@@ -84,17 +152,25 @@ def bfs_search(search_problem):
                     frontier.append(child_node)
                     explored.add(current_state)
 
+                    if observer is not None:
+                        observer.generate(child_state, child_node.depth, math.nan)
+
+            if observer is not None:
+                observer.expand(current_state, current_node.depth, math.nan, len(successors))
+
     return search_solution
 
 
 # =====================================================================================
 
-def dfs_search(search_problem, depth_limit=100, current_node=None, solution=None):
+def dfs_search(search_problem, depth_limit=100, current_node=None, solution=None, observer=None, depth=0):
     """
         Summary: Performs a path-checking depth-first search on a given search problem
 
         :param search_problem: an object that contains a start state, a goal state, and a method to get successors
         from a given state
+        :param observer: optional search_events.SearchObserver, told about every expansion, generated node and goal
+        (the depth parameter is the current node's depth, passed along by the recursion)
 
         :return: an object SearchSolution that contains the method of finding the solution, the path from the start state
         to the goal state, and the number of nodes visited
@@ -112,13 +188,21 @@ def dfs_search(search_problem, depth_limit=100, current_node=None, solution=None
         if search_problem.goal_test(current_state):
             # Use backchain to extract the goal path from the tree:
             solution.path = backchain(current_node)
+            if observer is not None:
+                observer.goal(current_state, depth)
             return solution
 
         # Rather than an explored set, check if successors have been visited with backchain
-        for child in search_problem.get_successors(current_state):
+        successors = search_problem.get_successors(current_state)
+        if observer is not None:
+            observer.expand(current_state, depth, math.nan, len(successors))
+
+        for child in successors:
             if child not in backchain(current_node):
                 child_node = SearchNode(child, current_node)
-                next_solution = dfs_search(search_problem, depth_limit - 1, child_node, solution)
+                if observer is not None:
+                    observer.generate(child, depth + 1, math.nan)
+                next_solution = dfs_search(search_problem, depth_limit - 1, child_node, solution, observer, depth + 1)
 
                 if next_solution.path:
                     return next_solution  # if exists, call recursion with the child node as the
@@ -130,12 +214,13 @@ def dfs_search(search_problem, depth_limit=100, current_node=None, solution=None
 
 # =====================================================================================
 
-def ids_search(search_problem, depth_limit=100):
+def ids_search(search_problem, depth_limit=100, observer=None):
     """
         Summary: Performs an iterative-deepening search on a given search problem
 
         :param search_problem: an object that contains a start state, a goal state, and a method to get successors
         from a given state
+        :param observer: optional search_events.SearchObserver, passed to every depth-first iteration
 
         :return: an object SearchSolution that contains the method of finding the solution, the path from the start state
         to the goal state, and the number of nodes visited
@@ -145,7 +230,7 @@ def ids_search(search_problem, depth_limit=100):
     # start new search until depth limit is reached, after which failure
 
     for curr_depth in range(1, depth_limit + 1):
-        iteration = dfs_search(search_problem, curr_depth)
+        iteration = dfs_search(search_problem, curr_depth, observer=observer)
         solution.nodes_visited += iteration.nodes_visited
 
         if iteration.path:
@@ -5,9 +5,36 @@
 import math
 import random
 import sys
+import time
 #from time import sleep
 import chess
 import math
+from TranspositionTable import position_key, EXACT, LOWER, UPPER, MATE_SCORE
+from IncrementalEvaluator import IncrementalEvaluator, EVALUATORS, PIECE_VALUES
+from MoveOrdering import mvv_lva, captured_piece_type
+from SearchClock import SearchClock, SearchTimeout
+
+# the piece values evaluate_material uses, for quiescence search's delta pruning
+MATERIAL_VALUES = {chess.PAWN: 1, chess.KNIGHT: 3, chess.BISHOP: 3, chess.ROOK: 5, chess.QUEEN: 9, chess.KING: 100000}
+
+# delta pruning skips a capture that would leave the score this many pawns short of alpha (or beta)
+DELTA_MARGIN = 2
+
+# null-move pruning: the null move is searched this much shallower (on top of the move itself), only
+#  at nodes at least NULL_MOVE_MIN_DEPTH deep; with this few pieces (not counting pawns and the king)
+#  zugzwang is likely enough that a null-move cutoff is checked by a normal reduced search first
+NULL_MOVE_REDUCTION = 2
+NULL_MOVE_MIN_DEPTH = 3
+NULL_MOVE_VERIFY_PIECES = 2
+
+# late move reductions: at nodes at least LMR_MIN_DEPTH deep, quiet moves after the first
+#  LMR_FULL_MOVES are searched one ply shallower, and again at full depth if they turn out good
+LMR_FULL_MOVES = 3
+LMR_MIN_DEPTH = 3
+
+# an aspiration window that keeps failing is doubled on that side until it is more than this many
+#  pawns wide, and then dropped for a full window
+ASPIRATION_LIMIT = 10
 
 
 class AlphaBetaAI:
@@ -16,45 +43,313 @@ class AlphaBetaAI:
     by eliminating unnecessary branches to improve efficiency (and still giving the same optimal moves)
 
     :param depth: The maximum search depth for Alpha-Beta pruning
+    :param transposition_table: a TranspositionTable to remember searched positions in (kept across
+        moves), or None to search without one
+    :param iterative_deepening: True to search depth 1, 2, ... up to depth, trying the previous
+        iteration's principal variation first at every ply; False to search only at depth
+    :param move_orderer: a MoveOrderer to sort the moves at each node, or None to search them in
+        random order (apart from the principal variation and table moves)
+    :param evaluator: "material" for the original material count, or "pst" for material plus
+        piece-square tables kept up to date incrementally as moves are made (in centipawns)
+    :param quiescence: True to keep searching captures and promotions past the depth limit until the
+        position is quiet, instead of evaluating in the middle of an exchange
+    :param check_evasions: True to also search every reply to check during quiescence search
+    :param time_budget: seconds to spend on each move (searching iteratively deeper, at most to depth,
+        until the time is nearly up), or None to always search to depth
+    :param verbose: True to print the search statistics after every move
+    :param null_move: True for null-move pruning: skip a node when even passing (a "null move") at a
+        reduced depth is still too good for the opponent to allow
+    :param late_move_reductions: True to search late quiet moves shallower, re-searching those that
+        turn out better than expected
+    :param principal_variation_search: True for principal variation search (NegaScout): every move
+        after the first is searched with a null window, only to prove it is no better than the first,
+        and searched again with the full window if it is
+    :param aspiration_window: with iterative deepening, search the root with a window this many pawns
+        either side of the previous iteration's score (widened and searched again when the score falls
+        outside it), or None for a full window
+    :param opening_book: an OpeningBook to play from while the game is still in it (searching once it
+        is out of book), or None to always search
     """
-    def __init__(self, depth):
+    def __init__(self, depth, transposition_table=None, iterative_deepening=False, move_orderer=None,
+                 evaluator="material", quiescence=False, check_evasions=False, time_budget=None, verbose=False,
+                 null_move=False, late_move_reductions=False, principal_variation_search=False,
+                 aspiration_window=None, opening_book=None):
+        if evaluator not in EVALUATORS:
+            raise ValueError("unknown evaluator {:s}".format(str(evaluator)))
         self.depth = depth
         self.player = None
         self.node_count = 0
+        self.table = transposition_table
+        self.iterative_deepening = iterative_deepening
+        self.orderer = move_orderer
+        self.evaluator_name = evaluator
+        self.evaluator = None  # the IncrementalEvaluator of the current search, for "pst"
+        self.quiescence = quiescence
+        self.check_evasions = check_evasions
+        self.quiescence_node_count = 0  # nodes searched by quiescence search (not counted in node_count)
+        self.time_budget = time_budget
+        self.verbose = verbose
+        self.clock = None  # the SearchClock of the current search, when it is timed
+        self.search_info = {}  # statistics of the last search
+        self.null_move = null_move
+        self.late_move_reductions = late_move_reductions
+        self.pvs = principal_variation_search
+        self.aspiration_window = aspiration_window
+        self.book = opening_book
+        self.null_move_cutoffs = 0
+        self.null_move_verifications = 0
+        self.reductions = 0
+        self.reduction_re_searches = 0
+        self.pvs_re_searches = 0
+        self.aspiration_re_searches = 0
+        self.root_ply = 0
+        self.pv_lines = {}  # ply -> best line found below the node being searched at that ply
+        self.principal_variation = []  # the best line of the last completed iteration
+
+    def draw_test(self, board):
+        """
+        Summary: Determines if the position is a draw by the rules (other than stalemate, which the search
+        sees when it finds no legal moves). Each check is only made when it could possibly apply: it
+        takes at least eight reversible moves for a position to come round three times, and there is
+        always enough material while there are pawns, rooks or queens.
 
-    def cutoff_test(self, board, depth):
+        :param board: the ChessGame board
+        :return: True if the game is drawn here
+        """
+        if board.halfmove_clock >= 8:
+            if board.is_fifty_moves() or board.is_repetition(3):
+                return True
+        if not (board.pawns | board.rooks | board.queens):
+            return board.is_insufficient_material()
+        return False
+
+    def no_moves_value(self, board, ply):
         """
-        Summary: Determines if the search should be cut off due to reaching a terminal state (a win or a draw)
-        or reaching the specified depth limit
+        Summary: The value of a position with no legal moves: checkmate, which is worse the sooner it
+        comes, or stalemate, a draw
 
         :param board: the ChessGame board
-        :param depth: the current depth of the search
-        :return: True if the search should stop, either because the depth is 0 or the game is over, otherwise False
+        :param ply: how many moves below the root this position is
+        :return: the score for the current player
         """
-        return depth == 0 or board.is_game_over()
+        if not board.is_check():
+            return 0
+        return -(MATE_SCORE - ply) if board.turn == self.player else MATE_SCORE - ply
 
-    def choose_move(self, board):
+    def choose_move(self, board, time_budget=None, remaining_time=None, increment=0.0):
         """
         Summary: Executes the Alpha-Beta search algorithm to choose the best move, starts by initializing alpha to
-        negative infinity and beta to positive infinity
+        negative infinity and beta to positive infinity. The statistics of the search are left in search_info.
 
         :param board: The current chess board state
+        :param time_budget: seconds for this move (overrides the engine's own time_budget)
+        :param remaining_time: seconds left on the game clock, to take a share of (when there is no time budget)
+        :param increment: seconds added to the game clock after each move
         :return: The optimal move based on the Alpha-Beta pruning algorithm
         """
-        # Following the pseudocode provided in the class textbook:
-        self.node_count = 0
-        self.player = board.turn
+        move = self.book_move(board)
+        if move is not None:
+            return move
 
-        value, move = self.max_value(board, self.depth, -math.inf, math.inf)
+        value, move = self.search(board, time_budget, remaining_time, increment)
 
         if board.is_game_over():
             print("Game Over:", board.outcome())
             sys.exit()
         else:
-            print("ALPHABETA Total nodes visited:", self.node_count)
+            if self.verbose:
+                print("ALPHABETA Total nodes visited:", self.node_count)
+                print("ALPHABETA Depth reached: {:d}{:s}".format(
+                    self.search_info["depth"], " (out of time)" if self.search_info["aborted"] else ""))
+                if self.quiescence:
+                    print("ALPHABETA Quiescence nodes visited:", self.quiescence_node_count)
+                if self.table is not None:
+                    print("ALPHABETA Transposition table hit rate: {:.1%}, cutoff rate: {:.1%}".format(
+                        self.table.hit_rate(), self.table.cutoff_rate()))
+                if self.book is not None:
+                    print("ALPHABETA Out of book (book hits: {:d} of {:d} positions)".format(
+                        self.book.hits, self.book.probes))
             return move
 
+    def book_move(self, board):
+        """
+        Summary: Looks the position up in the opening book, if there is one. A book move is played without
+        searching; search_info then describes the book move instead of a search.
+
+        :param board: The current chess board state
+        :return: a book move, or None if there is no book or the position is out of it
+        """
+        if self.book is None:
+            return None
+        start_time = time.perf_counter()
+        move = self.book.choose(board)
+        if move is None:
+            return None
+
+        self.node_count = 0
+        self.search_info = {
+            "depth": 0,
+            "aborted": False,
+            "value": None,
+            "move": move,
+            "nodes": 0,
+            "time_s": time.perf_counter() - start_time,
+            "book": True,
+            "book_hits": self.book.hits,
+        }
+        if self.verbose:
+            print("ALPHABETA Book move: {:s} (book hits: {:d} of {:d} positions)".format(
+                move.uci(), self.book.hits, self.book.probes))
+        return move
+
+    def search(self, board, time_budget=None, remaining_time=None, increment=0.0):
+        """
+        Summary: Runs the search (iteratively deepened if asked for, or if timed) without printing anything.
+        A timed search that runs out of time abandons the iteration it is in and returns the result of the
+        last iteration it finished.
+
+        :param board: The current chess board state
+        :param time_budget: seconds for this move (default: the engine's own time_budget)
+        :param remaining_time: seconds left on the game clock, to take a share of (when there is no time budget)
+        :param increment: seconds added to the game clock after each move
+        :return: The value of the position and the best move found
+        """
+        start_time = time.perf_counter()
+        if time_budget is None:
+            time_budget = self.time_budget
+        timed = time_budget is not None or remaining_time is not None
+        self.clock = SearchClock(time_budget, remaining_time, increment) if timed else None
+        root_length = len(board.move_stack)
+
+        # Following the pseudocode provided in the class textbook:
+        self.start_search(board)
+
+        value, move = None, None
+        completed_depth = 0
+        aborted = False
+        depths = range(1, self.depth + 1) if self.iterative_deepening or timed else [self.depth]
+        for depth in depths:
+            iteration_start = time.perf_counter()
+            try:
+                if self.aspiration_window is not None and value is not None:
+                    iteration_value, iteration_move = self.aspiration_search(board, depth, value)
+                else:
+                    iteration_value, iteration_move = self.max_value(board, depth, -math.inf, math.inf)
+            except SearchTimeout:
+                # unwind whatever moves the interrupted iteration had made
+                while len(board.move_stack) > root_length:
+                    board.pop()
+                aborted = True
+                break
+
+            value, move = iteration_value, iteration_move
+            completed_depth = depth
+            self.principal_variation = self.pv_lines.get(0, [])
+            if self.clock is not None:
+                self.clock.arm()
+                if not self.clock.start_next_iteration(time.perf_counter() - iteration_start):
+                    break
+
+        self.search_info = {
+            "depth": completed_depth,
+            "aborted": aborted,
+            "value": value,
+            "move": move,
+            "nodes": self.node_count,
+            "quiescence_nodes": self.quiescence_node_count,
+            "time_s": time.perf_counter() - start_time,
+            "allotted_s": self.clock.allotted if self.clock is not None else None,
+            "principal_variation": list(self.principal_variation),
+            "null_move_cutoffs": self.null_move_cutoffs,
+            "null_move_verifications": self.null_move_verifications,
+            "reductions": self.reductions,
+            "reduction_re_searches": self.reduction_re_searches,
+            "pvs_re_searches": self.pvs_re_searches,
+            "aspiration_re_searches": self.aspiration_re_searches,
+        }
+        if self.table is not None:
+            self.search_info["table"] = self.table.stats()
+        return value, move
+
+    def aspiration_search(self, board, depth, previous_value):
+        """
+        Summary: Searches the root with a narrow window around the previous iteration's score, which
+        prunes far more than a full window. A score outside the window is only a bound, so then the
+        window is widened on that side and the root searched again.
+
+        :param board: The current chess board state
+        :param depth: The depth to search to
+        :param previous_value: The score of the previous iteration
+        :return: The value of the position and the best move found
+        """
+        pawn = self.piece_value(chess.PAWN)
+        low_width = high_width = max(1, round(self.aspiration_window * pawn))
+        while True:
+            alpha = previous_value - low_width if low_width <= ASPIRATION_LIMIT * pawn else -math.inf
+            beta = previous_value + high_width if high_width <= ASPIRATION_LIMIT * pawn else math.inf
+            value, move = self.max_value(board, depth, alpha, beta)
+            if value <= alpha:
+                low_width *= 2
+            elif value >= beta:
+                high_width *= 2
+            else:
+                return value, move
+            self.aspiration_re_searches += 1
+
+    def start_search(self, board):
+        """
+        Summary: Resets the counters and per-search state for a new search from this root position
+
+        :param board: The current chess board state (the root)
+        """
+        self.node_count = 0
+        self.quiescence_node_count = 0
+        self.null_move_cutoffs = 0
+        self.null_move_verifications = 0
+        self.reductions = 0
+        self.reduction_re_searches = 0
+        self.pvs_re_searches = 0
+        self.aspiration_re_searches = 0
+        self.player = board.turn
+        self.root_ply = board.ply()
+        self.principal_variation = []
+        if self.table is not None:
+            self.table.new_search()
+        if self.orderer is not None:
+            self.orderer.new_search()
+        if self.evaluator_name == "pst":
+            self.evaluator = IncrementalEvaluator(board)
+
     def evaluate(self, board):
+        """
+        Summary: Scores a position for the current player with the chosen evaluator
+
+        :param board: the current board state
+        :return: a numeric score, higher when the position is better for the current player
+        """
+        if self.evaluator is not None:
+            return self.evaluator.evaluate(self.player)
+        return self.evaluate_material(board)
+
+    def push(self, board, move):
+        """
+        Summary: Makes a move during the search, keeping the incremental evaluator (if any) up to date
+        """
+        if self.evaluator is not None:
+            self.evaluator.push(board, move)
+        else:
+            board.push(move)
+
+    def pop(self, board):
+        """
+        Summary: Undoes the last move made with push
+        """
+        if self.evaluator is not None:
+            self.evaluator.pop(board)
+        else:
+            board.pop()
+
+    def evaluate_material(self, board):
         """
         Summary: Simple evaluation function that calculates the material advantage of the current player
         based on the number AND type of pieces on the board
@@ -80,6 +375,205 @@ class AlphaBetaAI:
 
         return evaluation
 
+    def probe_table(self, board, depth, alpha, beta, ply):
+        """
+        Summary: Look the position up in the transposition table (if there is one)
+
+        :param board: The current chess board state
+        :param depth: The depth about to be searched
+        :param alpha: The best value that the maximizing player has found so far
+        :param beta: The best value that the minimizing player has found so far
+        :param ply: how many moves below the root this node is
+        :return: (key, score, move): the position's key (None without a table), the stored score if it
+            settles this node (never at the root, which must come back with a move of its own) or None,
+            and the stored best move or None
+        """
+        if self.table is None:
+            return None, None, None
+        key = position_key(board)
+        score, move = self.table.probe(key, depth, alpha, beta, self.player == chess.WHITE, ply)
+        if ply == 0:
+            score = None
+        return key, score, move
+
+    def pv_move(self, board, ply):
+        """
+        Summary: The previous iteration's principal variation move at this ply, if the moves leading
+        here followed that principal variation
+
+        :param board: The current chess board state
+        :param ply: how many moves below the root this node is
+        :return: a move, or None
+        """
+        pv = self.principal_variation
+        if ply >= len(pv) or (ply > 0 and board.move_stack[-ply:] != pv[:ply]):
+            return None
+        return pv[ply]
+
+    def order_moves(self, board, moves, table_move, pv_move=None, ply=0):
+        """
+        Summary: The legal moves in the order to search them: sorted by the move orderer if there is one,
+        otherwise in random order except that the principal variation move and then the transposition
+        table's best move go first
+
+        :param board: The current chess board state
+        :param moves: the legal moves
+        :param table_move: the best move stored for this position, or None
+        :param pv_move: the previous iteration's principal variation move here, or None
+        :param ply: how many moves below the root this node is
+        :return: a list of moves
+        """
+        moves = list(moves)
+        random.shuffle(moves)  # This makes sure its not repeating the same move multiple times (stalemate)
+        if self.orderer is not None:
+            return self.orderer.order(board, moves, ply, (pv_move, table_move))
+        for first in (table_move, pv_move):
+            if first is not None and first in moves:
+                moves.remove(first)
+                moves.insert(0, first)
+        return moves
+
+    def piece_value(self, piece_type):
+        """
+        Summary: A piece's value on the current evaluator's scale (pawns, or centipawns for "pst")
+        """
+        return PIECE_VALUES[piece_type] if self.evaluator is not None else MATERIAL_VALUES[piece_type]
+
+    def quiescence_search(self, board, alpha, beta):
+        """
+        Summary: Searches only captures and promotions (and, with check_evasions, every reply to check)
+        until the position is quiet. The side to move may also "stand pat": decline every capture and
+        take the static evaluation, which is a bound on the score since it is never forced to capture.
+        Captures that cannot bring the score back to the window even after winning the piece (plus a
+        margin) are skipped: this is delta pruning.
+
+        :param board: The current chess board state
+        :param alpha: The best value that the maximizing player has found so far
+        :param beta: The best value that the minimizing player has found so far
+        :return: The value of the position
+        """
+        self.quiescence_node_count += 1
+        if self.clock is not None:
+            self.clock.check()
+        maximizing = board.turn == self.player
+
+        in_check = board.is_check()
+        if in_check and not any(board.legal_moves):
+            return self.no_moves_value(board, board.ply() - self.root_ply)
+
+        if self.check_evasions and in_check:
+            # no standing pat in check: every legal reply gets searched
+            moves = list(board.legal_moves)
+            v = -math.inf if maximizing else math.inf
+            stand_pat = None
+        else:
+            stand_pat = self.evaluate(board)
+            if maximizing:
+                if stand_pat >= beta:
+                    return stand_pat
+                alpha = max(alpha, stand_pat)
+            else:
+                if stand_pat <= alpha:
+                    return stand_pat
+                beta = min(beta, stand_pat)
+            v = stand_pat
+            moves = [move for move in board.legal_moves if move.promotion or board.is_capture(move)]
+            moves.sort(key=lambda move: mvv_lva(board, move), reverse=True)
+
+        margin = DELTA_MARGIN * self.piece_value(chess.PAWN)
+        for move in moves:
+            if stand_pat is not None:
+                # the most this capture could change the score
+                victim = captured_piece_type(board, move)
+                swing = (self.piece_value(victim) if victim else 0) + margin
+                if move.promotion:
+                    swing += self.piece_value(move.promotion) - self.piece_value(chess.PAWN)
+                if (maximizing and stand_pat + swing <= alpha) or (not maximizing and stand_pat - swing >= beta):
+                    continue
+
+            self.push(board, move)
+            v2 = self.quiescence_search(board, alpha, beta)
+            self.pop(board)
+
+            if maximizing:
+                v = max(v, v2)
+                if v >= beta:
+                    return v
+                alpha = max(alpha, v)
+            else:
+                v = min(v, v2)
+                if v <= alpha:
+                    return v
+                beta = min(beta, v)
+
+        return v
+
+    def null_move_cutoff(self, board, depth, alpha, beta, ply):
+        """
+        Summary: Null-move pruning. The side to move passes, and the opponent gets a search at reduced
+        depth: if the side to move is still doing too well (at least beta for the maximizing player, at
+        most alpha for the minimizing one), a real move would surely be even better, so the node is cut
+        off. Passing is not allowed in check, twice in a row, or with only pawns left (where zugzwang,
+        when every move makes things worse, is common); with few pieces a cutoff is only trusted after a
+        normal search at the reduced depth agrees.
+
+        :param board: The current chess board state
+        :param depth: The current depth of the search
+        :param alpha: The best value that the maximizing player has found so far
+        :param beta: The best value that the minimizing player has found so far
+        :param ply: how many moves below the root this node is
+        :return: True if the node can be cut off
+        """
+        if not self.null_move or ply == 0 or depth < NULL_MOVE_MIN_DEPTH or board.is_check():
+            return False
+        if board.move_stack and not board.move_stack[-1]:
+            return False
+        maximizing = board.turn == self.player
+        if (maximizing and beta == math.inf) or (not maximizing and alpha == -math.inf):
+            return False
+        pieces = sum(len(board.pieces(piece_type, board.turn))
+                     for piece_type in (chess.KNIGHT, chess.BISHOP, chess.ROOK, chess.QUEEN))
+        if pieces == 0:
+            return False
+
+        reduced = max(0, depth - 1 - NULL_MOVE_REDUCTION)
+        self.push(board, chess.Move.null())
+        if maximizing:
+            v, _ = self.min_value(board, reduced, beta - 1, beta)
+            cutoff = v >= beta
+        else:
+            v, _ = self.max_value(board, reduced, alpha, alpha + 1)
+            cutoff = v <= alpha
+        self.pop(board)
+
+        if cutoff and pieces <= NULL_MOVE_VERIFY_PIECES:
+            # verify with a real (reduced) search, with null moves turned off inside it
+            self.null_move_verifications += 1
+            self.null_move = False
+            try:
+                if maximizing:
+                    v, _ = self.max_value(board, reduced + 1, beta - 1, beta)
+                    cutoff = v >= beta
+                else:
+                    v, _ = self.min_value(board, reduced + 1, alpha, alpha + 1)
+                    cutoff = v <= alpha
+            finally:
+                self.null_move = True
+
+        if cutoff:
+            self.null_move_cutoffs += 1
+        return cutoff
+
+    def reducible(self, board, move, index, depth, in_check):
+        """
+        Summary: Whether late move reductions apply to a move: a quiet, non-checking move late in the
+        move order, at a node that is deep enough and not in check
+
+        :param index: the move's place in the move order (0 for the first)
+        """
+        return (self.late_move_reductions and index >= LMR_FULL_MOVES and depth >= LMR_MIN_DEPTH and not in_check
+                and not move.promotion and not board.is_capture(move) and not board.gives_check(move))
+
     def max_value(self, board, depth, alpha, beta):
         """
         Summary: The maximizing player evaluates the board to maximize the evaluation score --
@@ -93,29 +587,75 @@ class AlphaBetaAI:
         :return: The highest value and the corresponding move found for the maximizing player
         """
         self.node_count += 1
-
-        if self.cutoff_test(board, depth):
+        if self.clock is not None:
+            self.clock.check()
+        ply = board.ply() - self.root_ply
+        self.pv_lines[ply] = []
+
+        if depth == 0 and self.quiescence:
+            return self.quiescence_search(board, alpha, beta), None
+
+        if depth == 0:
+            # a leaf is only looked at for checkmate (cheap: just the positions in check); stalemate
+            #  at the horizon is left to the evaluation
+            if board.is_check() and not any(board.legal_moves):
+                return self.no_moves_value(board, ply), None
             return self.evaluate(board), None
+        if ply > 0 and self.draw_test(board):
+            return 0, None
+
+        key, score, table_move = self.probe_table(board, depth, alpha, beta, ply)
+        if score is not None:
+            return score, table_move
+        alpha_original = alpha
+
+        # the legal moves are generated once, for both the checkmate / stalemate test and the search
+        legal_moves = list(board.legal_moves)
+        if not legal_moves:
+            return self.no_moves_value(board, ply), None
+
+        if self.null_move_cutoff(board, depth, alpha, beta, ply):
+            return beta, None
 
         v = -math.inf  # v represents utility
         optimal_move = None
 
-        moves = list(board.legal_moves)
-        random.shuffle(moves)  # This makes sure its not repeating the same move multiple times (stalemate)
-
-        for move in moves:
-            board.push(move)  # Make the move
-            v2, move2 = self.min_value(board, depth - 1, alpha, beta)
+        moves = self.order_moves(board, legal_moves, table_move, self.pv_move(board, ply), ply)
+        in_check = self.late_move_reductions and board.is_check()
+
+        for index, move in enumerate(moves):
+            reduce = alpha > -math.inf and self.reducible(board, move, index, depth, in_check)
+            self.push(board, move)  # Make the move
+            if reduce or (self.pvs and index > 0 and alpha > -math.inf):
+                # a null window: all we want to know is whether the move beats alpha, and if it does it
+                # gets searched again properly (a late move is searched shallower first, too)
+                if reduce:
+                    self.reductions += 1
+                v2, move2 = self.min_value(board, depth - 2 if reduce else depth - 1, alpha, alpha + 1)
+                if v2 > alpha and reduce:
+                    self.reduction_re_searches += 1
+                    v2, move2 = self.min_value(board, depth - 1, alpha, alpha + 1 if self.pvs else beta)
+                if self.pvs and alpha < v2 < beta:
+                    self.pvs_re_searches += 1
+                    v2, move2 = self.min_value(board, depth - 1, alpha, beta)
+            else:
+                v2, move2 = self.min_value(board, depth - 1, alpha, beta)
 
             if v2 > v:
                 v, optimal_move = v2, move
+                self.pv_lines[ply] = [move] + self.pv_lines[ply + 1]
                 alpha = max(alpha, v)
 
-            board.pop()  # Undo the move for memory purposes
+            self.pop(board)  # Undo the move for memory purposes
 
             if v >= beta:  # Beta cutoff, so no need to explore further
-                return v, optimal_move
+                if self.orderer is not None:
+                    self.orderer.record_cutoff(board, move, ply, depth)
+                break
 
+        if key is not None:
+            bound = LOWER if v >= beta else UPPER if v <= alpha_original else EXACT
+            self.table.store(key, depth, v, bound, optimal_move, self.player == chess.WHITE, ply)
         return v, optimal_move
 
     def min_value(self, board, depth, alpha, beta):
@@ -131,27 +671,71 @@ class AlphaBetaAI:
         :return: The lowest value and the corresponding move found for the minimizing player
         """
         self.node_count += 1
-
-        if self.cutoff_test(board, depth):
+        if self.clock is not None:
+            self.clock.check()
+        ply = board.ply() - self.root_ply
+        self.pv_lines[ply] = []
+
+        if depth == 0 and self.quiescence:
+            return self.quiescence_search(board, alpha, beta), None
+
+        if depth == 0:
+            # a leaf is only looked at for checkmate (cheap: just the positions in check); stalemate
+            #  at the horizon is left to the evaluation
+            if board.is_check() and not any(board.legal_moves):
+                return self.no_moves_value(board, ply), None
             return self.evaluate(board), None
+        if ply > 0 and self.draw_test(board):
+            return 0, None
+
+        key, score, table_move = self.probe_table(board, depth, alpha, beta, ply)
+        if score is not None:
+            return score, table_move
+        beta_original = beta
+
+        # the legal moves are generated once, for both the checkmate / stalemate test and the search
+        legal_moves = list(board.legal_moves)
+        if not legal_moves:
+            return self.no_moves_value(board, ply), None
+
+        if self.null_move_cutoff(board, depth, alpha, beta, ply):
+            return alpha, None
 
         v = math.inf
         optimal_move = None
 
-        moves = list(board.legal_moves)
-        random.shuffle(moves)
-
-        for move in moves:
-            board.push(move)
-            v2, move2 = self.max_value(board, depth - 1, alpha, beta)
+        moves = self.order_moves(board, legal_moves, table_move, self.pv_move(board, ply), ply)
+        in_check = self.late_move_reductions and board.is_check()
+
+        for index, move in enumerate(moves):
+            reduce = beta < math.inf and self.reducible(board, move, index, depth, in_check)
+            self.push(board, move)
+            if reduce or (self.pvs and index > 0 and beta < math.inf):
+                if reduce:
+                    self.reductions += 1
+                v2, move2 = self.max_value(board, depth - 2 if reduce else depth - 1, beta - 1, beta)
+                if v2 < beta and reduce:
+                    self.reduction_re_searches += 1
+                    v2, move2 = self.max_value(board, depth - 1, beta - 1 if self.pvs else alpha, beta)
+                if self.pvs and alpha < v2 < beta:
+                    self.pvs_re_searches += 1
+                    v2, move2 = self.max_value(board, depth - 1, alpha, beta)
+            else:
+                v2, move2 = self.max_value(board, depth - 1, alpha, beta)
 
             if v2 < v:
                 v, optimal_move = v2, move
+                self.pv_lines[ply] = [move] + self.pv_lines[ply + 1]
                 beta = min(beta, v)
 
-            board.pop()
+            self.pop(board)
 
             if v <= alpha:
-                return v, optimal_move
+                if self.orderer is not None:
+                    self.orderer.record_cutoff(board, move, ply, depth)
+                break
 
+        if key is not None:
+            bound = UPPER if v <= alpha else LOWER if v >= beta_original else EXACT
+            self.table.store(key, depth, v, bound, optimal_move, self.player == chess.WHITE, ply)
         return v, optimal_move
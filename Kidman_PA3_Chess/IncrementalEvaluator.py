@@ -0,0 +1,176 @@
+# Author: Lauren Kidman
+# Date: 19 October 2026
+# COSC 76: Artificial Intelligence 24F
+
+# IncrementalEvaluator.py
+#  A material plus piece-square table evaluation that is kept up to date as the search makes and
+#  unmakes moves, so scoring a leaf is just reading a number. A move only changes the value of the
+#  squares it touches (from, to, a captured piece, the rook in castling), so each push works out that
+#  change before making the move and remembers it for the matching pop.
+#
+#  Piece values and tables are Tomasz Michniewski's "Simplified Evaluation Function", in centipawns,
+#  written from White's side with rank 8 at the top (the middlegame king table is used throughout).
+
+import chess
+
+EVALUATORS = ("material", "pst")
+
+PIECE_VALUES = {chess.PAWN: 100, chess.KNIGHT: 320, chess.BISHOP: 330,
+                chess.ROOK: 500, chess.QUEEN: 900, chess.KING: 20000}
+
+PIECE_SQUARE_TABLES = {
+    chess.PAWN: [
+        0, 0, 0, 0, 0, 0, 0, 0,
+        50, 50, 50, 50, 50, 50, 50, 50,
+        10, 10, 20, 30, 30, 20, 10, 10,
+        5, 5, 10, 25, 25, 10, 5, 5,
+        0, 0, 0, 20, 20, 0, 0, 0,
+        5, -5, -10, 0, 0, -10, -5, 5,
+        5, 10, 10, -20, -20, 10, 10, 5,
+        0, 0, 0, 0, 0, 0, 0, 0],
+    chess.KNIGHT: [
+        -50, -40, -30, -30, -30, -30, -40, -50,
+        -40, -20, 0, 0, 0, 0, -20, -40,
+        -30, 0, 10, 15, 15, 10, 0, -30,
+        -30, 5, 15, 20, 20, 15, 5, -30,
+        -30, 0, 15, 20, 20, 15, 0, -30,
+        -30, 5, 10, 15, 15, 10, 5, -30,
+        -40, -20, 0, 5, 5, 0, -20, -40,
+        -50, -40, -30, -30, -30, -30, -40, -50],
+    chess.BISHOP: [
+        -20, -10, -10, -10, -10, -10, -10, -20,
+        -10, 0, 0, 0, 0, 0, 0, -10,
+        -10, 0, 5, 10, 10, 5, 0, -10,
+        -10, 5, 5, 10, 10, 5, 5, -10,
+        -10, 0, 10, 10, 10, 10, 0, -10,
+        -10, 10, 10, 10, 10, 10, 10, -10,
+        -10, 5, 0, 0, 0, 0, 5, -10,
+        -20, -10, -10, -10, -10, -10, -10, -20],
+    chess.ROOK: [
+        0, 0, 0, 0, 0, 0, 0, 0,
+        5, 10, 10, 10, 10, 10, 10, 5,
+        -5, 0, 0, 0, 0, 0, 0, -5,
+        -5, 0, 0, 0, 0, 0, 0, -5,
+        -5, 0, 0, 0, 0, 0, 0, -5,
+        -5, 0, 0, 0, 0, 0, 0, -5,
+        -5, 0, 0, 0, 0, 0, 0, -5,
+        0, 0, 0, 5, 5, 0, 0, 0],
+    chess.QUEEN: [
+        -20, -10, -10, -5, -5, -10, -10, -20,
+        -10, 0, 0, 0, 0, 0, 0, -10,
+        -10, 0, 5, 5, 5, 5, 0, -10,
+        -5, 0, 5, 5, 5, 5, 0, -5,
+        0, 0, 5, 5, 5, 5, 0, -5,
+        -10, 5, 5, 5, 5, 5, 0, -10,
+        -10, 0, 5, 0, 0, 0, 0, -10,
+        -20, -10, -10, -5, -5, -10, -10, -20],
+    chess.KING: [
+        -30, -40, -40, -50, -50, -40, -40, -30,
+        -30, -40, -40, -50, -50, -40, -40, -30,
+        -30, -40, -40, -50, -50, -40, -40, -30,
+        -30, -40, -40, -50, -50, -40, -40, -30,
+        -20, -30, -30, -40, -40, -30, -30, -20,
+        -10, -20, -20, -20, -20, -20, -20, -10,
+        20, 20, 0, 0, 0, 0, 20, 20,
+        20, 30, 10, 0, 0, 10, 30, 20],
+}
+
+
+def build_square_values():
+    """
+    Summary: Material plus table value of every piece on every square, from its own side's point of view
+
+    :return: a dict (piece type, color) -> list of 64 values indexed by python-chess square (a1 = 0)
+    """
+    values = {}
+    for piece_type, table in PIECE_SQUARE_TABLES.items():
+        # the tables list rank 8 first, so White reads them mirrored and Black reads them as written
+        values[piece_type, chess.WHITE] = [PIECE_VALUES[piece_type] + table[chess.square_mirror(square)]
+                                           for square in chess.SQUARES]
+        values[piece_type, chess.BLACK] = [PIECE_VALUES[piece_type] + table[square] for square in chess.SQUARES]
+    return values
+
+
+SQUARE_VALUES = build_square_values()
+
+
+def evaluate_from_scratch(board):
+    """
+    Summary: The material plus piece-square score of a position, computed by looking at every piece
+
+    :param board: the board
+    :return: the score in centipawns, from White's point of view
+    """
+    score = 0
+    for square, piece in board.piece_map().items():
+        value = SQUARE_VALUES[piece.piece_type, piece.color][square]
+        score += value if piece.color == chess.WHITE else -value
+    return score
+
+
+class IncrementalEvaluator:
+    """
+    Summary: Keeps the material plus piece-square score of a board up to date; make and unmake moves
+    through push and pop instead of on the board directly
+
+    Attributes:
+        score: the current score in centipawns, from White's point of view
+        changes: the score change of each move pushed, for pop to undo
+    """
+    pawn_value = PIECE_VALUES[chess.PAWN]
+
+    def __init__(self, board):
+        self.score = evaluate_from_scratch(board)
+        self.changes = []
+
+    def move_change(self, board, move):
+        """
+        Summary: How much a move (not yet made) changes the score
+
+        :return: the change in centipawns, from White's point of view
+        """
+        if not move:
+            return 0   # a null move changes nothing
+
+        color = board.turn
+        piece_type = board.piece_type_at(move.from_square)
+        own = SQUARE_VALUES[move.promotion or piece_type, color][move.to_square] \
+            - SQUARE_VALUES[piece_type, color][move.from_square]
+
+        if board.is_castling(move):
+            rank = chess.square_rank(move.from_square)
+            if board.is_kingside_castling(move):
+                rook_from, rook_to = chess.square(7, rank), chess.square(5, rank)
+            else:
+                rook_from, rook_to = chess.square(0, rank), chess.square(3, rank)
+            own += SQUARE_VALUES[chess.ROOK, color][rook_to] - SQUARE_VALUES[chess.ROOK, color][rook_from]
+            theirs = 0
+        elif board.is_en_passant(move):
+            captured_square = chess.square(chess.square_file(move.to_square), chess.square_rank(move.from_square))
+            theirs = SQUARE_VALUES[chess.PAWN, not color][captured_square]
+        else:
+            captured = board.piece_type_at(move.to_square)
+            theirs = SQUARE_VALUES[captured, not color][move.to_square] if captured else 0
+
+        # gaining value for us and taking it away from them both help the side to move
+        change = own + theirs
+        return change if color == chess.WHITE else -change
+
+    def push(self, board, move):
+        change = self.move_change(board, move)
+        board.push(move)
+        self.changes.append(change)
+        self.score += change
+
+    def pop(self, board):
+        board.pop()
+        self.score -= self.changes.pop()
+
+    def evaluate(self, player):
+        """
+        Summary: The current score from one side's point of view
+
+        :param player: chess.WHITE or chess.BLACK
+        :return: the score in centipawns
+        """
+        return self.score if player == chess.WHITE else -self.score
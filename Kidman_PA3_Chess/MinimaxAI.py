@@ -5,7 +5,11 @@
 import math
 import random
 import sys
+import time
 import chess
+from TranspositionTable import position_key, EXACT, MATE_SCORE
+from IncrementalEvaluator import IncrementalEvaluator, EVALUATORS
+from SearchClock import SearchClock, SearchTimeout
 
 class MinimaxAI():
     """
@@ -13,52 +17,226 @@ class MinimaxAI():
             player, best move storage, and a node count tracker to count the visited nodes
 
         :param depth: the maximum depth to search in the minimax algorithm
+        :param transposition_table: a TranspositionTable to remember searched positions in (kept across
+            moves), or None to search without one
+        :param evaluator: "material" for the original material count, or "pst" for material plus
+            piece-square tables kept up to date incrementally as moves are made (in centipawns)
+        :param time_budget: seconds to spend on each move (searching deeper, at most to depth, until the
+            time is nearly up), or None to always search to depth
+        :param verbose: True to print the best move of every iteration and the search statistics
+        :param opening_book: an OpeningBook to play from while the game is still in it (searching once it
+            is out of book), or None to always search
     """
-    def __init__(self, depth):
+    def __init__(self, depth, transposition_table=None, evaluator="material", time_budget=None, verbose=False,
+                 opening_book=None):
+        if evaluator not in EVALUATORS:
+            raise ValueError("unknown evaluator {:s}".format(str(evaluator)))
         self.depth = depth
         self.player = None
         self.best_move = None
         self.node_count = 0
+        self.table = transposition_table
+        self.evaluator_name = evaluator
+        self.evaluator = None  # the IncrementalEvaluator of the current search, for "pst"
+        self.time_budget = time_budget
+        self.verbose = verbose
+        self.book = opening_book
+        self.clock = None  # the SearchClock of the current search, when it is timed
+        self.search_info = {}  # statistics of the last search
+        self.root_ply = 0
+
+    def draw_test(self, board):
+        """
+        Summary: Determines if the position is a draw by the rules (other than stalemate, which the search
+        sees when it finds no legal moves). Each check is only made when it could possibly apply: a
+        threefold repetition takes at least eight reversible moves, and there is always enough
+        material while there are pawns, rooks or queens.
 
-    def cutoff_test(self, board, depth):
+        :param board: the ChessGame board
+        :return: True if the game is drawn here
         """
-        Summary: Determines if the search should be cut off due to reaching a terminal state (a win or a draw)
-        or reaching the specified depth limit
+        if board.halfmove_clock >= 8:
+            if board.is_fifty_moves() or board.is_repetition(3):
+                return True
+        if not (board.pawns | board.rooks | board.queens):
+            return board.is_insufficient_material()
+        return False
+
+    def no_moves_value(self, board, ply):
+        """
+        Summary: The value of a position with no legal moves: checkmate (worse the sooner it comes) or
+        stalemate, a draw
 
         :param board: the ChessGame board
-        :param depth: the current depth of the search
-        :return: True if the search should stop, either because the depth is 0 or the game is over, otherwise False
+        :param ply: how many moves below the root this position is
+        :return: the score for the current player
         """
-        return depth == 0 or board.is_game_over()
+        if not board.is_check():
+            return 0
+        return -(MATE_SCORE - ply) if board.turn == self.player else MATE_SCORE - ply
 
     # Run your minimax search
-    def choose_move(self, board):
+    def choose_move(self, board, time_budget=None, remaining_time=None, increment=0.0):
         """
-        Summary: Executes the minimax search starting from depth 1 up to the specified maximum depth (utilizes IDS)
+        Summary: Executes the minimax search starting from depth 1 up to the specified maximum depth (utilizes IDS).
+        The statistics of the search are left in search_info.
 
         :param board: the current board state
+        :param time_budget: seconds for this move (overrides the engine's own time_budget)
+        :param remaining_time: seconds left on the game clock, to take a share of (when there is no time budget)
+        :param increment: seconds added to the game clock after each move
         :return: the best move, based on the minimax search up to the specified depth
         """
+        move = self.book_move(board)
+        if move is not None:
+            return move
+
+        value, move = self.search(board, time_budget, remaining_time, increment)
+
+        if board.is_game_over():
+            print("Game Over:", board.outcome())
+            sys.exit()
+        else:
+            if self.verbose:
+                print("MINIMAX Total nodes visited:", self.node_count)
+                print("MINIMAX Depth reached: {:d}{:s}".format(
+                    self.search_info["depth"], " (out of time)" if self.search_info["aborted"] else ""))
+                if self.table is not None:
+                    print("MINIMAX Transposition table hit rate: {:.1%}, cutoff rate: {:.1%}".format(
+                        self.table.hit_rate(), self.table.cutoff_rate()))
+                if self.book is not None:
+                    print("MINIMAX Out of book (book hits: {:d} of {:d} positions)".format(
+                        self.book.hits, self.book.probes))
+            return move
+
+    def book_move(self, board):
+        """
+        Summary: Looks the position up in the opening book, if there is one. A book move is played without
+        searching; search_info then describes the book move instead of a search.
+
+        :param board: the current board state
+        :return: a book move, or None if there is no book or the position is out of it
+        """
+        if self.book is None:
+            return None
+        start_time = time.perf_counter()
+        move = self.book.choose(board)
+        if move is None:
+            return None
+
+        self.node_count = 0
+        self.search_info = {
+            "depth": 0,
+            "aborted": False,
+            "value": None,
+            "move": move,
+            "nodes": 0,
+            "time_s": time.perf_counter() - start_time,
+            "book": True,
+            "book_hits": self.book.hits,
+        }
+        if self.verbose:
+            print("MINIMAX Book move: {:s} (book hits: {:d} of {:d} positions)".format(
+                move.uci(), self.book.hits, self.book.probes))
+        return move
+
+    def search(self, board, time_budget=None, remaining_time=None, increment=0.0):
+        """
+        Summary: Runs the iteratively deepened minimax search without printing anything (unless verbose).
+        A timed search that runs out of time abandons the iteration it is in and returns the result of the
+        last iteration it finished.
+
+        :param board: the current board state
+        :param time_budget: seconds for this move (default: the engine's own time_budget)
+        :param remaining_time: seconds left on the game clock, to take a share of (when there is no time budget)
+        :param increment: seconds added to the game clock after each move
+        :return: the value of the position and the best move found
+        """
+        start_time = time.perf_counter()
+        if time_budget is None:
+            time_budget = self.time_budget
+        timed = time_budget is not None or remaining_time is not None
+        self.clock = SearchClock(time_budget, remaining_time, increment) if timed else None
+        root_length = len(board.move_stack)
+
         # Following the pseudocode provided in the class textbook:
         self.node_count = 0
         self.player = board.turn
-
+        self.root_ply = board.ply()
+        if self.table is not None:
+            self.table.new_search()
+        if self.evaluator_name == "pst":
+            self.evaluator = IncrementalEvaluator(board)
+
+        value = None
+        completed_depth = 0
+        aborted = False
         for depth in range(1, self.depth+1, 1):
-            value, move = self.max_value(board, depth)
+            iteration_start = time.perf_counter()
+            try:
+                value, move = self.max_value(board, depth)
+            except SearchTimeout:
+                # unwind whatever moves the interrupted iteration had made
+                while len(board.move_stack) > root_length:
+                    board.pop()
+                aborted = True
+                break
+
             if move is not None:
                 self.best_move = move
+            completed_depth = depth
+
+            if self.verbose:
+                print("Best move:", self.best_move)
+            if self.clock is not None:
+                self.clock.arm()
+                if not self.clock.start_next_iteration(time.perf_counter() - iteration_start):
+                    break
+
+        self.search_info = {
+            "depth": completed_depth,
+            "aborted": aborted,
+            "value": value,
+            "move": self.best_move,
+            "nodes": self.node_count,
+            "time_s": time.perf_counter() - start_time,
+            "allotted_s": self.clock.allotted if self.clock is not None else None,
+        }
+        if self.table is not None:
+            self.search_info["table"] = self.table.stats()
+        return value, self.best_move
 
-            print("Best move:", self.best_move)
 
-        if board.is_game_over():
-            print("Game Over:", board.outcome())
-            sys.exit()
+    def evaluate(self, board):
+        """
+        Summary: Scores a position for the current player with the chosen evaluator
+
+        :param board: the current board state
+        :return: a numeric score, higher when the position is better for the current player
+        """
+        if self.evaluator is not None:
+            return self.evaluator.evaluate(self.player)
+        return self.evaluate_material(board)
+
+    def push(self, board, move):
+        """
+        Summary: Makes a move during the search, keeping the incremental evaluator (if any) up to date
+        """
+        if self.evaluator is not None:
+            self.evaluator.push(board, move)
         else:
-            print("MINIMAX Total nodes visited:", self.node_count)
-            return self.best_move
+            board.push(move)
 
+    def pop(self, board):
+        """
+        Summary: Undoes the last move made with push
+        """
+        if self.evaluator is not None:
+            self.evaluator.pop(board)
+        else:
+            board.pop()
 
-    def evaluate(self, board):
+    def evaluate_material(self, board):
         """
         Summary: Simple evaluation function that calculates the material advantage of the current player
         based on the number AND type of pieces on the board
@@ -84,6 +262,25 @@ class MinimaxAI():
 
         return evaluation
 
+    def probe_table(self, board, depth, ply):
+        """
+        Summary: Look the position up in the transposition table (if there is one). Minimax scores are
+        always exact, so any entry searched at least as deep settles the node.
+
+        :param board: the current board state
+        :param depth: the depth about to be searched
+        :param ply: how many moves below the root this node is
+        :return: (key, score, move): the position's key (None without a table), and the stored score and
+            best move if they settle this node (never at the root, which must search for its move), else None
+        """
+        if self.table is None:
+            return None, None, None
+        key = position_key(board)
+        score, move = self.table.probe(key, depth, -math.inf, math.inf, self.player == chess.WHITE, ply)
+        if score is None or ply == 0:
+            return key, None, None
+        return key, score, move
+
     def max_value(self, board, depth):
         """
         Summary: The maximizing function -- It simulates possible moves, evaluates the resulting board states,
@@ -94,25 +291,44 @@ class MinimaxAI():
         :return: the highest value and corresponding move found for the maximizing player
         """
         self.node_count += 1
-
-        if self.cutoff_test(board,depth):
+        if self.clock is not None:
+            self.clock.check()
+
+        ply = board.ply() - self.root_ply
+        if depth == 0:
+            # a leaf is only looked at for checkmate (cheap: just the positions in check); stalemate
+            #  at the horizon is left to the evaluation
+            if board.is_check() and not any(board.legal_moves):
+                return self.no_moves_value(board, ply), None
             return self.evaluate(board), None
+        if ply > 0 and self.draw_test(board):
+            return 0, None
+
+        key, score, table_move = self.probe_table(board, depth, ply)
+        if score is not None:
+            return score, table_move
+
+        # the legal moves are generated once, for both the checkmate / stalemate test and the search
+        moves = list(board.legal_moves)
+        if not moves:
+            return self.no_moves_value(board, ply), None
 
         v = -math.inf
         optimal_move = None
 
-        moves = list(board.legal_moves)
         random.shuffle(moves)  # This makes sure its not repeating the same move multiple times (stalemate)
 
         for move in moves:
-            board.push(move)
+            self.push(board, move)
             v2, move2 = self.min_value(board, depth-1)
 
             if v2 > v:
                 v, optimal_move = v2, move
 
-            board.pop()
+            self.pop(board)
 
+        if key is not None:
+            self.table.store(key, depth, v, EXACT, optimal_move, self.player == chess.WHITE, ply)
         return v, optimal_move
 
     def min_value(self, board, depth):
@@ -125,23 +341,42 @@ class MinimaxAI():
         :return: the lowest value and corresponding move found for the minimizing player
         """
         self.node_count += 1
-
-        if self.cutoff_test(board, depth):
+        if self.clock is not None:
+            self.clock.check()
+
+        ply = board.ply() - self.root_ply
+        if depth == 0:
+            # a leaf is only looked at for checkmate (cheap: just the positions in check); stalemate
+            #  at the horizon is left to the evaluation
+            if board.is_check() and not any(board.legal_moves):
+                return self.no_moves_value(board, ply), None
             return self.evaluate(board), None
+        if ply > 0 and self.draw_test(board):
+            return 0, None
+
+        key, score, table_move = self.probe_table(board, depth, ply)
+        if score is not None:
+            return score, table_move
+
+        # the legal moves are generated once, for both the checkmate / stalemate test and the search
+        moves = list(board.legal_moves)
+        if not moves:
+            return self.no_moves_value(board, ply), None
 
         v = math.inf
         optimal_move = None
 
-        moves = list(board.legal_moves)
         random.shuffle(moves)
 
         for move in moves:
-            board.push(move)
+            self.push(board, move)
             v2, move2 = self.max_value(board, depth - 1)
 
             if v2 < v:
                 v, optimal_move = v2, move
 
-            board.pop()
+            self.pop(board)
 
+        if key is not None:
+            self.table.store(key, depth, v, EXACT, optimal_move, self.player == chess.WHITE, ply)
         return v, optimal_move
@@ -0,0 +1,181 @@
+# Author: Lauren Kidman
+# Date: 19 October 2026
+# COSC 76: Artificial Intelligence 24F
+
+# MoveOrdering.py
+#  Move ordering for AlphaBetaAI. Alpha-beta prunes the most when the best move is searched first,
+#  so the moves at each node are sorted by how likely they are to be good:
+#    1. the hash move: the transposition table's best move, and the principal variation move from
+#       the previous iteration of iterative deepening
+#    2. captures (and promotions), by MVV-LVA (most valuable victim, least valuable attacker) or by
+#       static exchange evaluation (SEE), which puts captures that lose material at the very end
+#    3. the two killer moves of this ply: quiet moves that caused a beta cutoff in a sibling node
+#    4. the other quiet moves, by the history heuristic: how often (weighted by depth) each
+#       from/to square pair has caused a cutoff anywhere in the search
+#  Every stage can be turned off on its own, to measure what it is worth. Moves that tie keep the
+#  random order the engine shuffled them into.
+
+import chess
+
+HASH_SCORE = 1 << 30
+CAPTURE_SCORE = 1 << 28
+KILLER_SCORE = 1 << 27
+LOSING_CAPTURE_SCORE = -(1 << 20)
+HISTORY_LIMIT = 1 << 26  # the history table is halved when any entry gets this big
+
+CAPTURE_ORDERINGS = ("mvv_lva", "see")
+
+# piece values for static exchange evaluation (kings never get captured, but may capture last)
+SEE_VALUES = {chess.PAWN: 1, chess.KNIGHT: 3, chess.BISHOP: 3, chess.ROOK: 5, chess.QUEEN: 9, chess.KING: 1000}
+
+
+def captured_piece_type(board, move):
+    """
+    Summary: The type of the piece a capture takes (en passant takes a pawn from an empty square)
+
+    :return: a piece type, or None if the move is not a capture
+    """
+    if board.is_en_passant(move):
+        return chess.PAWN
+    return board.piece_type_at(move.to_square)
+
+
+def mvv_lva(board, move):
+    """
+    Summary: Most valuable victim, least valuable attacker: bigger for taking bigger pieces with smaller ones
+    """
+    victim = captured_piece_type(board, move) or 0
+    attacker = board.piece_type_at(move.from_square)
+    promotion = move.promotion or 0
+    return 8 * (victim + promotion) - attacker
+
+
+def static_exchange(board, move):
+    """
+    Summary: Static exchange evaluation: the material the side to move wins (or loses) if both sides
+    keep recapturing on the move's target square with their least valuable piece, each stopping
+    whenever carrying on would lose more. Pins are ignored.
+
+    :param board: the board (left as it was)
+    :param move: a capture
+    :return: the material balance in pawns, from the moving side's point of view
+    """
+    victim = captured_piece_type(board, move)
+    gain = SEE_VALUES[victim] if victim else 0
+    if move.promotion:
+        gain += SEE_VALUES[move.promotion] - SEE_VALUES[chess.PAWN]
+
+    board.push(move)
+    gain -= recapture_value(board, move.to_square)
+    board.pop()
+    return gain
+
+
+def recapture_value(board, square):
+    """
+    Summary: What the side to move gains by recapturing on square with its least valuable attacker
+    and carrying on the exchange, or 0 if it is better off not recapturing
+    """
+    attackers = board.attackers(board.turn, square)
+    if not attackers:
+        return 0
+    attacker = min(attackers, key=lambda attacker_square: SEE_VALUES[board.piece_type_at(attacker_square)])
+    victim = board.piece_type_at(square)
+
+    # pseudo-legal: the recapture may be illegal (a pin, or a king walking into check); SEE lives with that
+    board.push(chess.Move(attacker, square))
+    value = SEE_VALUES[victim] - recapture_value(board, square)
+    board.pop()
+    return max(0, value)
+
+
+class MoveOrderer:
+    """
+    Summary: Sorts moves for alpha-beta search, and learns killer moves and history from its cutoffs
+
+    Attributes:
+        hash_move: True to search the transposition table / principal variation move first
+        captures: "mvv_lva" or "see" to order captures ahead of quiet moves, None to treat them as quiet
+        killers: True to keep two killer moves per ply
+        history: True to order quiet moves by the history heuristic
+        killer_moves: ply -> the (up to) two most recent killer moves of that ply
+        history_table: cutoff scores, indexed by from_square * 64 + to_square
+    """
+    def __init__(self, hash_move=True, captures="mvv_lva", killers=True, history=True):
+        if captures is not None and captures not in CAPTURE_ORDERINGS:
+            raise ValueError("unknown capture ordering {:s}".format(str(captures)))
+        self.hash_move = hash_move
+        self.captures = captures
+        self.killers = killers
+        self.history = history
+        self.killer_moves = {}
+        self.history_table = [0] * (64 * 64)
+
+    def new_search(self):
+        """
+        Summary: Start a new search: the killers belonged to the old plies and are dropped; the history
+        is kept but halved, so it follows the game as it changes
+        """
+        self.killer_moves = {}
+        self.history_table = [value // 2 for value in self.history_table]
+
+    def score(self, board, move, ply, first_moves):
+        if self.hash_move and move in first_moves:
+            # the principal variation move comes before the table move
+            return HASH_SCORE + (1 if move == first_moves[0] else 0)
+
+        if self.captures is not None and (move.promotion or board.is_capture(move)):
+            if self.captures == "see":
+                exchange = static_exchange(board, move)
+                return CAPTURE_SCORE + exchange if exchange >= 0 else LOSING_CAPTURE_SCORE + exchange
+            return CAPTURE_SCORE + mvv_lva(board, move)
+
+        if self.killers:
+            killers = self.killer_moves.get(ply)
+            if killers:
+                if move == killers[0]:
+                    return KILLER_SCORE + 1
+                if len(killers) > 1 and move == killers[1]:
+                    return KILLER_SCORE
+
+        if self.history:
+            return self.history_table[move.from_square * 64 + move.to_square]
+        return 0
+
+    def order(self, board, moves, ply, first_moves=()):
+        """
+        Summary: Sort moves, best first
+
+        :param board: the position the moves are made from
+        :param moves: the legal moves (in the order ties should keep)
+        :param ply: how many moves below the root this node is
+        :param first_moves: the hash moves (principal variation move first, then the table move)
+        :return: a new, sorted list
+        """
+        first_moves = [move for move in first_moves if move is not None]
+        return sorted(moves, key=lambda move: self.score(board, move, ply, first_moves), reverse=True)
+
+    def record_cutoff(self, board, move, ply, depth):
+        """
+        Summary: Learn from a move that caused a beta cutoff. Only quiet moves become killers and get
+        history credit (captures are ordered well enough already).
+
+        :param board: the position the move was made from
+        :param move: the move
+        :param ply: how many moves below the root the node is
+        :param depth: the depth the node was searched to (deeper cutoffs count for more)
+        """
+        if move.promotion or board.is_capture(move):
+            return
+
+        if self.killers:
+            killers = self.killer_moves.setdefault(ply, [])
+            if move not in killers:
+                killers.insert(0, move)
+                del killers[2:]
+
+        if self.history:
+            index = move.from_square * 64 + move.to_square
+            self.history_table[index] += depth * depth
+            if self.history_table[index] >= HISTORY_LIMIT:
+                self.history_table = [value // 2 for value in self.history_table]
@@ -0,0 +1,67 @@
+# Author: Lauren Kidman
+# Date: 19 October 2026
+# COSC 76: Artificial Intelligence 24F
+
+# OpeningBook.py
+#  An optional opening book for the chess engines, read from a local Polyglot .bin file with
+#  chess.polyglot. A Polyglot book lists, for each position (keyed by the same Zobrist hash the
+#  transposition table uses), the moves played there and a weight for each. While the game is still
+#  in the book the engines play a book move straight away instead of searching, and once it leaves
+#  the book they search as usual.
+
+import chess.polyglot
+
+# "weighted" picks a book move at random in proportion to its weight (so the engine varies its
+#  openings); "best" always plays the move with the highest weight
+BOOK_SELECTIONS = ("weighted", "best")
+
+
+class OpeningBook:
+    """
+    Summary: A Polyglot opening book the engines look positions up in before searching
+
+    Attributes:
+        path: the .bin file
+        selection: "weighted" or "best"
+        reader: the open chess.polyglot reader
+        probes: number of positions looked up
+        hits: number of those that were in the book
+    """
+    def __init__(self, path, selection="weighted"):
+        if selection not in BOOK_SELECTIONS:
+            raise ValueError("unknown book selection {:s}".format(str(selection)))
+        self.path = path
+        self.selection = selection
+        self.reader = chess.polyglot.open_reader(path)
+        self.probes = 0
+        self.hits = 0
+
+    def choose(self, board):
+        """
+        Summary: A book move for the position, if it is in the book
+
+        :param board: The current chess board state
+        :return: a legal move, or None if the position is out of book
+        """
+        self.probes += 1
+        try:
+            if self.selection == "best":
+                entry = self.reader.find(board)
+            else:
+                entry = self.reader.weighted_choice(board)
+        except IndexError:
+            return None
+        self.hits += 1
+        return entry.move
+
+    def hit_rate(self):
+        return self.hits / self.probes if self.probes else 0.0
+
+    def close(self):
+        self.reader.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,185 @@
+# Author: Lauren Kidman
+# Date: 19 October 2026
+# COSC 76: Artificial Intelligence 24F
+
+# ParallelSearch.py
+#  Root-splitting alpha-beta search over worker processes. The root moves are shared out among the
+#  workers, each of which searches its moves with an AlphaBetaAI of its own (with its own
+#  transposition table and move orderer, kept for the whole game). The best score found so far at
+#  the root is kept in shared memory as alpha: a worker starting on a root move reads it, so later
+#  moves are searched with the tightest bound available and get cut off as early as possible.
+#
+#  The first (most promising) root move is searched on its own before the others are handed out
+#  ("young brothers wait"), so that there is a good alpha to share from the start. Iterative
+#  deepening reorders the root moves by their scores from the previous iteration.
+
+import math
+import multiprocessing
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from AlphaBetaAI import AlphaBetaAI
+from MoveOrdering import MoveOrderer
+from TranspositionTable import TranspositionTable
+
+# each worker process's engine and the shared root alpha (set up by init_worker)
+_engine = None
+_alpha = None
+
+
+def init_worker(depth, options, shared_alpha):
+    global _engine, _alpha
+    table_size = options.get("table_size")
+    _engine = AlphaBetaAI(depth, TranspositionTable(table_size) if table_size else None,
+                          move_orderer=MoveOrderer() if options.get("move_ordering") else None,
+                          evaluator=options.get("evaluator", "material"),
+                          quiescence=options.get("quiescence", False))
+    _alpha = shared_alpha
+
+
+def search_root_move(board, move, depth):
+    """
+    Summary: Search one root move in a worker process, starting from the shared alpha, and raise the
+    shared alpha if the move beats it
+
+    :param board: the root position
+    :param move: the root move to search
+    :param depth: the depth to search the root to
+    :return: (move, value, exact, nodes, quiescence nodes); exact is True when value beat the alpha the
+        search started from, and False when value is only an upper bound on the move's real score
+    """
+    _engine.start_search(board)
+    alpha = _alpha.value
+
+    _engine.push(board, move)
+    value, _ = _engine.min_value(board, depth - 1, alpha, math.inf)
+    _engine.pop(board)
+
+    if value > alpha:
+        with _alpha.get_lock():
+            if value > _alpha.value:
+                _alpha.value = value
+    return move, value, value > alpha, _engine.node_count, _engine.quiescence_node_count
+
+
+class ParallelAlphaBetaAI:
+    """
+    Summary: Alpha-beta search with the root moves split across worker processes. Plays like
+    AlphaBetaAI (choose_move returns a move) and reports its statistics in search_info.
+
+    Attributes:
+        depth: the search depth
+        workers: number of worker processes
+        iterative_deepening: True to search depth 1, 2, ... up to depth, reordering the root moves
+            by the previous iteration's scores
+        options: settings for the workers' engines: table_size (transposition table slots, or None),
+            move_ordering (True for a MoveOrderer), evaluator and quiescence
+        node_count: nodes searched by all the workers in the last search
+        search_info: statistics of the last search
+    """
+    def __init__(self, depth, workers=2, iterative_deepening=True, table_size=1 << 18, move_ordering=True,
+                 evaluator="pst", quiescence=False, verbose=False):
+        self.depth = depth
+        self.workers = workers
+        self.iterative_deepening = iterative_deepening
+        self.options = {"table_size": table_size, "move_ordering": move_ordering,
+                        "evaluator": evaluator, "quiescence": quiescence}
+        self.verbose = verbose
+        self.node_count = 0
+        self.quiescence_node_count = 0
+        self.search_info = {}
+        self.pool = None
+        self.shared_alpha = None
+
+    def start_pool(self):
+        """
+        Summary: Start the worker processes (done by the first search if not before)
+        """
+        if self.pool is not None:
+            return
+        # workers start from a clean forkserver (or spawn) process rather than a fork of this one
+        methods = multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+        self.shared_alpha = context.Value("d", -math.inf)
+        self.pool = ProcessPoolExecutor(max_workers=self.workers, mp_context=context, initializer=init_worker,
+                                        initargs=(self.depth, self.options, self.shared_alpha))
+        # processes are started on demand; keep them all busy for a moment so they all start now
+        for future in [self.pool.submit(time.sleep, 0.1) for _ in range(self.workers)]:
+            future.result()
+
+    def close(self):
+        if self.pool is not None:
+            self.pool.shutdown()
+            self.pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def choose_move(self, board):
+        """
+        Summary: Chooses a move with the parallel search
+
+        :param board: The current chess board state
+        :return: the best move found
+        """
+        value, move = self.search(board)
+
+        if board.is_game_over():
+            print("Game Over:", board.outcome())
+            sys.exit()
+        if self.verbose:
+            print("PARALLEL ALPHABETA Total nodes visited: {:d} ({:d} workers)".format(self.node_count, self.workers))
+        return move
+
+    def search(self, board):
+        """
+        Summary: Runs the root-split search
+
+        :param board: The current chess board state
+        :return: The value of the position and the best move found ((None, None) if there are no moves)
+        """
+        start_time = time.perf_counter()
+        self.start_pool()
+        self.node_count = 0
+        self.quiescence_node_count = 0
+
+        moves = MoveOrderer().order(board, list(board.legal_moves), 0)
+        value, best_move = None, None
+        depths = range(1, self.depth + 1) if self.iterative_deepening else [self.depth]
+        for depth in depths if moves else []:
+            self.shared_alpha.value = -math.inf
+            scores = {}
+
+            # the first move alone, to give the rest a real alpha to work with
+            first = self.pool.submit(search_root_move, board, moves[0], depth)
+            results = [first.result()]
+            futures = [self.pool.submit(search_root_move, board, move, depth) for move in moves[1:]]
+            results += [future.result() for future in as_completed(futures)]
+
+            # only a move whose score is exact can be best: a bound may equal the best score while the
+            #  move is really much worse
+            value, best_move = -math.inf, None
+            for move, move_value, exact, nodes, quiescence_nodes in results:
+                scores[move] = move_value
+                self.node_count += nodes
+                self.quiescence_node_count += quiescence_nodes
+                if exact and (move_value > value or best_move is None):
+                    value, best_move = move_value, move
+
+            # best first next time, then the rest by (at least roughly) how good they looked
+            moves.sort(key=lambda move: (move == best_move, scores[move]), reverse=True)
+
+        self.search_info = {
+            "depth": self.depth,
+            "value": value,
+            "move": best_move,
+            "nodes": self.node_count,
+            "quiescence_nodes": self.quiescence_node_count,
+            "workers": self.workers,
+            "time_s": time.perf_counter() - start_time,
+        }
+        return value, best_move
@@ -0,0 +1,82 @@
+# Author: Lauren Kidman
+# Date: 19 October 2026
+# COSC 76: Artificial Intelligence 24F
+
+# SearchClock.py
+#  Time control for the chess engines. A search gets either a fixed budget for this move or a share
+#  of the remaining game clock. The engines deepen iteratively; the clock tells them whether another
+#  iteration is worth starting, and interrupts an iteration that runs past the deadline by raising
+#  SearchTimeout from inside the search. The engine then unwinds the board and plays the best move
+#  of the last iteration that finished.
+
+import time
+
+# the deadline is only looked at every this many nodes (reading the time costs about as much as a node)
+CHECK_INTERVAL = 256
+
+
+class SearchTimeout(Exception):
+    pass
+
+
+class SearchClock:
+    """
+    Summary: Decides how long one move's search may take and enforces it
+
+    Attributes:
+        allotted: seconds this search may use
+        start_time: when the search started (time.perf_counter)
+        deadline: when the search must stop
+        armed: False until the first iteration is complete, so there is always a move to play
+        checks: number of calls to check so far
+    """
+    def __init__(self, time_budget=None, remaining_time=None, increment=0.0, moves_to_go=30, reserve=0.05):
+        """
+        Summary: Give the search either time_budget, or a share of remaining_time
+
+        :param time_budget: seconds for this move
+        :param remaining_time: seconds left on the game clock (used when there is no time_budget)
+        :param increment: seconds added to the clock after every move
+        :param moves_to_go: how many more moves the remaining time has to last
+        :param reserve: seconds always kept back, for the engine's own overhead
+        """
+        if time_budget is None and remaining_time is None:
+            raise ValueError("a search clock needs a time budget or the remaining time")
+        if time_budget is None:
+            time_budget = remaining_time / moves_to_go + increment
+            # never spend more than half of what is left
+            time_budget = min(time_budget, remaining_time / 2)
+        self.allotted = max(0.0, time_budget - reserve)
+        self.start_time = time.perf_counter()
+        self.deadline = self.start_time + self.allotted
+        self.armed = False
+        self.checks = 0
+
+    def elapsed(self):
+        return time.perf_counter() - self.start_time
+
+    def arm(self):
+        """
+        Summary: Start enforcing the deadline (called once the first iteration is complete)
+        """
+        self.armed = True
+
+    def check(self):
+        """
+        Summary: Called at every node; raises SearchTimeout once the deadline has passed
+        """
+        self.checks += 1
+        if self.armed and self.checks % CHECK_INTERVAL == 0 and time.perf_counter() >= self.deadline:
+            raise SearchTimeout()
+
+    def start_next_iteration(self, last_iteration_time):
+        """
+        Summary: Whether another, deeper iteration is likely to finish in time. Each iteration usually
+        takes several times as long as the one before, so there is no point starting one with little
+        time left; the time goes to the next move instead.
+
+        :param last_iteration_time: seconds the iteration that just finished took
+        :return: True to search deeper
+        """
+        remaining = self.deadline - time.perf_counter()
+        return remaining > 0 and last_iteration_time * 2 < remaining
@@ -0,0 +1,191 @@
+# Author: Lauren Kidman
+# Date: 19 October 2026
+# COSC 76: Artificial Intelligence 24F
+
+# TranspositionTable.py
+#  A bounded transposition table for AlphaBetaAI and MinimaxAI. Positions are keyed by their
+#  Zobrist hash (chess.polyglot.zobrist_hash); each slot remembers the depth a position was searched
+#  to, its score, whether that score is exact or only a bound, and the best move found there.
+#
+#  The table has a fixed number of slots and a key always maps to the same slot, so two positions
+#  can fight over a slot. The "depth" replacement scheme keeps the deeper search (an entry from an
+#  earlier choose_move is always fair game, which is how old entries age out); the "always" scheme
+#  just keeps the newest entry.
+#
+#  A mate score counts the plies to the mate from the root, which is a different number for each
+#  root the same position is reached from, so the table stores mate scores counted from the position
+#  itself instead.
+
+import chess.polyglot
+
+EXACT = 0
+LOWER = 1   # the real score is at least this (the search failed high)
+UPPER = 2   # the real score is at most this (the search failed low)
+
+# negating a score turns a lower bound into an upper bound and vice versa
+FLIPPED = {EXACT: EXACT, LOWER: UPPER, UPPER: LOWER}
+
+REPLACEMENT_SCHEMES = ("depth", "always")
+
+# the score for mating (less the plies it takes): more than any evaluation can be
+MATE_SCORE = 1000000
+MATE_BOUND = MATE_SCORE - 1000  # scores beyond this are forced mates
+
+# slot layout: (key, depth, score, bound, move, age)
+KEY, DEPTH, SCORE, BOUND, MOVE, AGE = range(6)
+
+
+def position_key(board):
+    """
+    Summary: The Zobrist hash of a position (the same key Polyglot opening books use)
+
+    :param board: the chess board
+    :return: a 64-bit integer
+    """
+    return chess.polyglot.zobrist_hash(board)
+
+
+def score_to_table(score, ply):
+    """
+    Summary: A score counted from the root, as the table stores it (mates counted from the position)
+
+    :param score: the score
+    :param ply: how many moves below the root the position is
+    """
+    if score >= MATE_BOUND:
+        return score + ply
+    if score <= -MATE_BOUND:
+        return score - ply
+    return score
+
+
+def score_from_table(score, ply):
+    """
+    Summary: A stored score, counted from the root again (the opposite of score_to_table)
+    """
+    if score >= MATE_BOUND:
+        return score - ply
+    if score <= -MATE_BOUND:
+        return score + ply
+    return score
+
+
+class TranspositionTable:
+    """
+    Summary: A fixed-size hash table of search results, kept across searches. Scores are stored from
+    White's point of view, so one table can serve either side.
+
+    Attributes:
+        size: number of slots
+        replacement: "depth" (keep the deeper entry from the current search) or "always" (keep the newest)
+        age: number of searches started; entries remember the search that wrote them
+        probes: lookups in the current search
+        hits: lookups in the current search that found their position
+        cutoffs: hits whose stored score settled the node without searching it
+        stores: entries written in the current search
+        used: number of slots holding an entry
+    """
+    def __init__(self, size=1 << 20, replacement="depth"):
+        if replacement not in REPLACEMENT_SCHEMES:
+            raise ValueError("unknown replacement scheme {:s}".format(str(replacement)))
+        self.size = size
+        self.replacement = replacement
+        self.slots = [None] * size
+        self.age = 0
+        self.used = 0
+        self.probes = 0
+        self.hits = 0
+        self.cutoffs = 0
+        self.stores = 0
+
+    def new_search(self):
+        """
+        Summary: Start a new search: entries written so far become old (and replaceable), and the
+        statistics start over
+        """
+        self.age += 1
+        self.probes = 0
+        self.hits = 0
+        self.cutoffs = 0
+        self.stores = 0
+
+    def clear(self):
+        self.slots = [None] * self.size
+        self.used = 0
+
+    def probe(self, key, depth, alpha, beta, white=True, ply=0):
+        """
+        Summary: Look a position up
+
+        :param key: the position's key
+        :param depth: the depth the caller is about to search the position to
+        :param alpha: the caller's alpha
+        :param beta: the caller's beta
+        :param white: True if the caller's scores are from White's point of view, False for Black's
+        :param ply: how many moves below the caller's root the position is (for mate scores)
+        :return: (score, move): score is the stored score if it settles the node (deep enough, and
+            exact or a bound outside the window), otherwise None; move is the stored best move or None
+        """
+        self.probes += 1
+        entry = self.slots[key % self.size]
+        if entry is None or entry[KEY] != key:
+            return None, None
+        self.hits += 1
+
+        if entry[DEPTH] >= depth:
+            score, bound = entry[SCORE], entry[BOUND]
+            if not white:
+                score = -score
+                bound = FLIPPED[bound]
+            score = score_from_table(score, ply)
+            if bound == EXACT or (bound == LOWER and score >= beta) or (bound == UPPER and score <= alpha):
+                self.cutoffs += 1
+                return score, entry[MOVE]
+
+        return None, entry[MOVE]
+
+    def store(self, key, depth, score, bound, move, white=True, ply=0):
+        """
+        Summary: Record a search result, unless the replacement scheme prefers the entry already there
+
+        :param key: the position's key
+        :param depth: the depth the position was searched to
+        :param score: its score, from the point of view given by white
+        :param bound: EXACT, LOWER or UPPER
+        :param move: the best move found (or None)
+        :param white: True if score is from White's point of view, False for Black's
+        :param ply: how many moves below the caller's root the position is (for mate scores)
+        """
+        index = key % self.size
+        old = self.slots[index]
+        if old is None:
+            self.used += 1
+        else:
+            # a deeper result from this same search is worth more than a shallower one
+            if self.replacement == "depth" and old[DEPTH] > depth and old[AGE] == self.age:
+                return
+            if old[KEY] == key and move is None:
+                move = old[MOVE]
+
+        score = score_to_table(score, ply)
+        if not white:
+            score = -score
+            bound = FLIPPED[bound]
+        self.slots[index] = (key, depth, score, bound, move, self.age)
+        self.stores += 1
+
+    def hit_rate(self):
+        return self.hits / self.probes if self.probes else 0.0
+
+    def cutoff_rate(self):
+        return self.cutoffs / self.probes if self.probes else 0.0
+
+    def stats(self):
+        """
+        Summary: Statistics for the current search
+
+        :return: a dict of counts, rates and how full the table is
+        """
+        return {"probes": self.probes, "hits": self.hits, "cutoffs": self.cutoffs, "stores": self.stores,
+                "hit_rate": self.hit_rate(), "cutoff_rate": self.cutoff_rate(),
+                "fill": self.used / self.size}
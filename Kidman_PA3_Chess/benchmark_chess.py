@@ -0,0 +1,496 @@
+# Author: Lauren Kidman
+# Date: 19 October 2026
+# COSC 76: Artificial Intelligence 24F
+
+# benchmark_chess.py
+#  Benchmark runner for the chess engines. Each suite searches a fixed set of positions with a few
+#  engine configurations and records the nodes visited (the engines' node_count), the wall time and
+#  the move chosen in a JSON file, so changes to the search can be compared run against run. Move
+#  order is shuffled at random inside the engines, so every run reseeds the random module first.
+#
+#  The "deepening" suite compares AlphaBetaAI searching straight at the requested depth against
+#  iterative deepening with the previous iteration's principal variation searched first (with and
+#  without a transposition table).
+#
+#  The "ordering" suite measures each MoveOrderer stage (hash move, MVV-LVA or SEE captures, killer
+#  moves, history heuristic) on its own and all together, against random order. Every configuration
+#  uses iterative deepening and a transposition table, so there is a hash move to put first.
+#
+#  The "evaluation" suite searches with the original material-only evaluation and with the
+#  incremental material plus piece-square evaluation, and also times a single leaf evaluation of
+#  each on every position.
+#
+#  The "quiescence" suite searches at every depth up to the requested one with and without quiescence
+#  search (and with check evasions), counting quiescence nodes separately, to show how shallow a
+#  search with quiescence can be and still pick the moves of a deeper one.
+#
+#  The "timed" suite gives every position a series of per-move time budgets and records how deep the
+#  search got, whether the last iteration was cut short, and how long the move really took.
+#
+#  The "parallel" suite searches each position to the same depth with a single process and with
+#  ParallelAlphaBetaAI on each number of workers, and reports the speedup (the worker pool is started
+#  before the clock does).
+#
+#  The "selective" suite runs the tactical positions in TACTICS (the first ten "Win at Chess" problems)
+#  under a fixed time per position, with null-move pruning and late move reductions each off and on,
+#  and reports the depth reached, depth per second, and how many problems were solved.
+#
+#  The "pvs" suite searches every position to the same depth with plain alpha-beta, with principal
+#  variation search, and with principal variation search inside aspiration windows of each width,
+#  and reports the nodes, time, and how many null-window and aspiration re-searches were needed.
+#
+#  The "book" suite plays the first --book-plies moves of a game from the starting position (the
+#  engine playing both sides) with and without the Polyglot opening book given by --book, and reports
+#  the time per move and how many moves came from the book.
+#
+#  Example:
+#    python benchmark_chess.py deepening --depth 5 --out bench.json
+#    python benchmark_chess.py ordering --depth 5 --positions kiwipete
+
+import argparse
+import json
+import platform
+import random
+import time
+
+import chess
+
+from AlphaBetaAI import AlphaBetaAI
+from IncrementalEvaluator import IncrementalEvaluator
+from MoveOrdering import MoveOrderer
+from OpeningBook import OpeningBook
+from ParallelSearch import ParallelAlphaBetaAI
+from TranspositionTable import TranspositionTable
+
+# (name, FEN): an opening, two busy middlegames and a pawn endgame
+POSITIONS = [
+    ("italian", "r1bqkbnr/pppp1ppp/2n5/4p3/2B1P3/5N2/PPPP1PPP/RNBQK2R b KQkq - 3 3"),
+    ("queens_gambit", "r1bq1rk1/pp2bppp/2n1pn2/3p4/2PP4/2N1PN2/PP2BPPP/R2QKB1R w KQ - 0 8"),
+    ("kiwipete", "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1"),
+    ("rook_endgame", "8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1"),
+]
+
+# (name, FEN, best moves in SAN): the first ten positions of the "Win at Chess" test suite
+TACTICS = [
+    ("WAC.001", "2rr3k/pp3pp1/1nnqbN1p/3pN3/2pP4/2P3Q1/PPB4P/R4RK1 w - - 0 1", ["Qg6"]),
+    ("WAC.002", "8/7p/5k2/5p2/p1p2P2/Pr1pPK2/1P1R3P/8 b - - 0 1", ["Rxb2"]),
+    ("WAC.003", "5rk1/1ppb3p/p1pb4/6q1/3P1p1r/2P1R2P/PP1BQ1P1/5RKN w - - 0 1", ["Rg3"]),
+    ("WAC.004", "r1bq2rk/pp3pbp/2p1p1pQ/7P/3P4/2PB1N2/PP3PPR/2KR4 w - - 0 1", ["Qxh7+"]),
+    ("WAC.005", "5k2/6pp/p1qN4/1p1p4/3P4/2PKP2Q/PP3r2/3R4 b - - 0 1", ["Qc4+"]),
+    ("WAC.006", "7k/p7/1R5K/6r1/6p1/6P1/8/8 w - - 0 1", ["Rb7"]),
+    ("WAC.007", "rnbqkb1r/pppp1ppp/8/4P3/6n1/7P/PPPNPPP1/R1BQKBNR b KQkq - 0 1", ["Ne3"]),
+    ("WAC.008", "r4q1k/p2bR1rp/2p2Q1N/5p2/5p2/2P5/PP3PPP/R5K1 w - - 0 1", ["Rf7"]),
+    ("WAC.009", "3q1rk1/p4pp1/2pb3p/3p4/6Pr/1PNQ4/P1PB1PP1/4RRK1 b - - 0 1", ["Bh2+"]),
+    ("WAC.010", "2br2k1/2q3rn/p2NppQ1/2p1P3/Pp5R/4P3/1P3PPP/3R2K1 w - - 0 1", ["Rh7"]),
+]
+
+
+def run_search(ai, fen, seed):
+    """
+    Summary: Search one position with one engine and collect the measurements
+
+    :param ai: the engine (anything with search(board) and node_count)
+    :param fen: the position
+    :param seed: seed for the random module (the engines shuffle their moves)
+    :return: a dict of measurements
+    """
+    random.seed(seed)
+    board = chess.Board(fen)
+    start = time.perf_counter()
+    value, move = ai.search(board)
+    elapsed = time.perf_counter() - start
+
+    return {
+        "move": move.uci() if move is not None else None,
+        "value": value,
+        "nodes": ai.node_count,
+        "quiescence_nodes": getattr(ai, "quiescence_node_count", 0),
+        "wall_time_s": elapsed,
+        "nodes_per_s": ai.node_count / elapsed if elapsed > 0 else None,
+    }
+
+
+def run_configurations(suite, configurations, args):
+    """
+    Summary: Search every position with every engine configuration
+
+    :param suite: the suite name, for the records
+    :param configurations: a list of (name, function returning a fresh engine)
+    :param args: parsed command line arguments
+    :return: a list of result records; each also has its node count relative to the first configuration
+    """
+    results = []
+    for name, fen in POSITIONS:
+        if args.positions and name not in args.positions:
+            continue
+        baseline = None
+        for config, make_ai in configurations:
+            ai = make_ai()
+            record = {"suite": suite, "position": name, "config": config, "depth": ai.depth}
+            record.update(run_search(ai, fen, args.seed))
+            if baseline is None:
+                baseline = record["nodes"]
+            record["node_ratio"] = record["nodes"] / baseline if baseline else None
+            results.append(record)
+            if not args.quiet:
+                print("{position:14s} {config:22s} move={move:6s} nodes={nodes:9d} ratio={node_ratio:6.3f} "
+                      "qnodes={quiescence_nodes:9d} t={wall_time_s:8.3f}s".format(**record))
+    return results
+
+
+def run_deepening_suite(args):
+    """
+    Summary: Fixed-depth alpha-beta against iterative deepening with principal variation ordering
+
+    :param args: parsed command line arguments
+    :return: a list of result records
+    """
+    configurations = [
+        ("fixed", lambda: AlphaBetaAI(args.depth)),
+        ("iterative", lambda: AlphaBetaAI(args.depth, iterative_deepening=True)),
+        ("iterative+table", lambda: AlphaBetaAI(args.depth, TranspositionTable(args.table_size),
+                                                iterative_deepening=True)),
+    ]
+    return run_configurations("deepening", configurations, args)
+
+
+def run_ordering_suite(args):
+    """
+    Summary: Each move ordering stage alone and all of them together, against random order
+
+    :param args: parsed command line arguments
+    :return: a list of result records
+    """
+    stages = [
+        ("random", {"hash_move": False, "captures": None, "killers": False, "history": False}),
+        ("hash_move", {"hash_move": True, "captures": None, "killers": False, "history": False}),
+        ("mvv_lva", {"hash_move": False, "captures": "mvv_lva", "killers": False, "history": False}),
+        ("see", {"hash_move": False, "captures": "see", "killers": False, "history": False}),
+        ("killers", {"hash_move": False, "captures": None, "killers": True, "history": False}),
+        ("history", {"hash_move": False, "captures": None, "killers": False, "history": True}),
+        ("all", {}),
+        ("all_see", {"captures": "see"}),
+    ]
+    configurations = [
+        (name, lambda options=options: AlphaBetaAI(args.depth, TranspositionTable(args.table_size),
+                                                   iterative_deepening=True, move_orderer=MoveOrderer(**options)))
+        for name, options in stages
+    ]
+    return run_configurations("ordering", configurations, args)
+
+
+def time_leaf_evaluation(fen, repeats=2000):
+    """
+    Summary: Time one leaf evaluation with each evaluator
+
+    :param fen: the position
+    :param repeats: how many evaluations to time
+    :return: a dict of microseconds per evaluation, by evaluator
+    """
+    board = chess.Board(fen)
+    ai = AlphaBetaAI(1)
+    ai.player = board.turn
+    evaluator = IncrementalEvaluator(board)
+
+    timings = {}
+    for name, evaluate in (("material", lambda: ai.evaluate_material(board)),
+                           ("pst", lambda: evaluator.evaluate(board.turn))):
+        start = time.perf_counter()
+        for _ in range(repeats):
+            evaluate()
+        timings[name] = (time.perf_counter() - start) / repeats * 1e6
+    return timings
+
+
+def run_evaluation_suite(args):
+    """
+    Summary: Material-only against incremental material plus piece-square evaluation
+
+    :param args: parsed command line arguments
+    :return: a list of result records
+    """
+    results = []
+    for name, fen in POSITIONS:
+        if args.positions and name not in args.positions:
+            continue
+        timings = time_leaf_evaluation(fen)
+        results.append({"suite": "evaluation", "position": name, "config": "leaf_evaluation_us", **timings})
+        if not args.quiet:
+            print("{:14s} leaf evaluation: material {:.2f}us, pst {:.2f}us".format(
+                name, timings["material"], timings["pst"]))
+
+    configurations = [
+        (evaluator, lambda evaluator=evaluator: AlphaBetaAI(
+            args.depth, TranspositionTable(args.table_size), iterative_deepening=True,
+            move_orderer=MoveOrderer(), evaluator=evaluator))
+        for evaluator in ("material", "pst")
+    ]
+    return results + run_configurations("evaluation", configurations, args)
+
+
+def run_quiescence_suite(args):
+    """
+    Summary: Every depth up to args.depth, without quiescence search, with it, and with check evasions too
+
+    :param args: parsed command line arguments
+    :return: a list of result records
+    """
+    def make_ai(depth, quiescence, check_evasions):
+        return lambda: AlphaBetaAI(depth, TranspositionTable(args.table_size), iterative_deepening=True,
+                                   move_orderer=MoveOrderer(), evaluator="pst", quiescence=quiescence,
+                                   check_evasions=check_evasions)
+
+    configurations = []
+    for depth in range(1, args.depth + 1):
+        configurations += [("depth{:d}".format(depth), make_ai(depth, False, False)),
+                           ("depth{:d}+quiescence".format(depth), make_ai(depth, True, False)),
+                           ("depth{:d}+quiescence+evasions".format(depth), make_ai(depth, True, True))]
+    return run_configurations("quiescence", configurations, args)
+
+
+def run_timed_suite(args):
+    """
+    Summary: Time-budgeted searches: depth reached and time used for each budget
+
+    :param args: parsed command line arguments
+    :return: a list of result records
+    """
+    results = []
+    for name, fen in POSITIONS:
+        if args.positions and name not in args.positions:
+            continue
+        for budget in args.time_budgets:
+            ai = AlphaBetaAI(64, TranspositionTable(args.table_size), move_orderer=MoveOrderer(), evaluator="pst",
+                             quiescence=True, time_budget=budget)
+            record = {"suite": "timed", "position": name, "config": "budget{:g}s".format(budget),
+                      "time_budget_s": budget}
+            record.update(run_search(ai, fen, args.seed))
+            record["depth"] = ai.search_info["depth"]
+            record["aborted"] = ai.search_info["aborted"]
+            record["overrun_s"] = record["wall_time_s"] - budget
+            results.append(record)
+            if not args.quiet:
+                print("{position:14s} {config:12s} move={move:6s} depth={depth:3d} aborted={aborted!s:5s} "
+                      "nodes={nodes:9d} t={wall_time_s:8.3f}s".format(**record))
+    return results
+
+
+def run_parallel_suite(args):
+    """
+    Summary: Single-process search against root splitting on each number of workers, at equal depth
+
+    :param args: parsed command line arguments
+    :return: a list of result records
+    """
+    results = []
+    for name, fen in POSITIONS:
+        if args.positions and name not in args.positions:
+            continue
+        single = AlphaBetaAI(args.depth, TranspositionTable(args.table_size), iterative_deepening=True,
+                             move_orderer=MoveOrderer(), evaluator="pst")
+        record = {"suite": "parallel", "position": name, "config": "single", "depth": args.depth, "workers": 1}
+        record.update(run_search(single, fen, args.seed))
+        record["speedup"] = 1.0
+        single_time = record["wall_time_s"]
+        results.append(record)
+        if not args.quiet:
+            print("{position:14s} {config:12s} move={move:6s} value={value!s:>6s} nodes={nodes:9d} "
+                  "t={wall_time_s:8.3f}s speedup={speedup:5.2f}".format(**record))
+
+        for workers in args.workers:
+            with ParallelAlphaBetaAI(args.depth, workers, table_size=args.table_size) as parallel:
+                parallel.start_pool()
+                record = {"suite": "parallel", "position": name, "config": "root_split",
+                          "depth": args.depth, "workers": workers}
+                record.update(run_search(parallel, fen, args.seed))
+            record["speedup"] = single_time / record["wall_time_s"]
+            results.append(record)
+            if not args.quiet:
+                print("{position:14s} {config:12s} move={move:6s} value={value!s:>6s} nodes={nodes:9d} "
+                      "t={wall_time_s:8.3f}s speedup={speedup:5.2f} workers={workers:d}".format(**record))
+    return results
+
+
+def run_selective_suite(args):
+    """
+    Summary: The tactical suite under a fixed time per position, with null-move pruning and late move
+    reductions each off and on
+
+    :param args: parsed command line arguments
+    :return: a list of result records
+    """
+    results = []
+    for null_move in (False, True):
+        for late_move_reductions in (False, True):
+            config = "null_move={:d} lmr={:d}".format(null_move, late_move_reductions)
+            solved = 0
+            depths = []
+            for name, fen, best_moves in TACTICS:
+                ai = AlphaBetaAI(64, TranspositionTable(args.table_size), move_orderer=MoveOrderer(),
+                                 evaluator="pst", quiescence=True, time_budget=args.suite_time,
+                                 null_move=null_move, late_move_reductions=late_move_reductions)
+                record = {"suite": "selective", "position": name, "config": config,
+                          "null_move": null_move, "late_move_reductions": late_move_reductions}
+                record.update(run_search(ai, fen, args.seed))
+                board = chess.Board(fen)
+                record["solved"] = record["move"] in [board.parse_san(san).uci() for san in best_moves]
+                record["depth"] = ai.search_info["depth"]
+                record["depth_per_s"] = record["depth"] / record["wall_time_s"]
+                for counter in ("null_move_cutoffs", "null_move_verifications", "reductions", "reduction_re_searches"):
+                    record[counter] = ai.search_info[counter]
+                results.append(record)
+                solved += record["solved"]
+                depths.append(record["depth"])
+                if not args.quiet:
+                    print("{config:20s} {position:8s} move={move:6s} solved={solved!s:5s} depth={depth:3d} "
+                          "depth/s={depth_per_s:6.2f} nodes={nodes:8d}".format(**record))
+
+            summary = {"suite": "selective", "position": "summary", "config": config,
+                       "solve_rate": solved / len(TACTICS), "mean_depth": sum(depths) / len(depths),
+                       "depth_per_s": sum(depths) / len(depths) / args.suite_time}
+            results.append(summary)
+            if not args.quiet:
+                print("{config:20s} solved {solve_rate:.0%}, mean depth {mean_depth:.1f}, "
+                      "{depth_per_s:.2f} depth/s".format(**summary))
+    return results
+
+
+def run_pvs_suite(args):
+    """
+    Summary: Plain alpha-beta, principal variation search, and principal variation search with each
+    aspiration window width, all to the same depth
+
+    :param args: parsed command line arguments
+    :return: a list of result records
+    """
+    def make_ai(pvs, window):
+        return lambda: AlphaBetaAI(args.depth, TranspositionTable(args.table_size), iterative_deepening=True,
+                                   move_orderer=MoveOrderer(), evaluator="pst", quiescence=True,
+                                   principal_variation_search=pvs, aspiration_window=window)
+
+    configurations = [("alphabeta", make_ai(False, None)), ("pvs", make_ai(True, None))]
+    configurations += [("pvs+aspiration{:g}".format(width), make_ai(True, width))
+                       for width in args.aspiration_widths]
+
+    results = []
+    for name, fen in POSITIONS:
+        if args.positions and name not in args.positions:
+            continue
+        baseline = None
+        for config, make in configurations:
+            ai = make()
+            record = {"suite": "pvs", "position": name, "config": config, "depth": ai.depth,
+                      "aspiration_window": ai.aspiration_window}
+            record.update(run_search(ai, fen, args.seed))
+            if baseline is None:
+                baseline = record["nodes"]
+            record["node_ratio"] = record["nodes"] / baseline if baseline else None
+            record["pvs_re_searches"] = ai.search_info["pvs_re_searches"]
+            record["aspiration_re_searches"] = ai.search_info["aspiration_re_searches"]
+            results.append(record)
+            if not args.quiet:
+                print("{position:14s} {config:20s} move={move:6s} value={value!s:>6s} nodes={nodes:9d} "
+                      "ratio={node_ratio:6.3f} t={wall_time_s:8.3f}s pvs_re={pvs_re_searches:5d} "
+                      "asp_re={aspiration_re_searches:3d}".format(**record))
+    return results
+
+
+def run_book_suite(args):
+    """
+    Summary: The opening of a game, played with and without the opening book
+
+    :param args: parsed command line arguments
+    :return: a list of result records, one per move
+    """
+    if args.book is None:
+        raise SystemExit("the book suite needs a Polyglot book: --book path/to/book.bin")
+
+    results = []
+    for config in ("search", "book"):
+        random.seed(args.seed)
+        book = OpeningBook(args.book, args.book_selection) if config == "book" else None
+        ai = AlphaBetaAI(args.depth, TranspositionTable(args.table_size), iterative_deepening=True,
+                         move_orderer=MoveOrderer(), evaluator="pst", quiescence=True, opening_book=book)
+        board = chess.Board()
+        total_time = 0.0
+        for ply in range(args.book_plies):
+            if board.is_game_over():
+                break
+            start = time.perf_counter()
+            move = ai.choose_move(board)
+            elapsed = time.perf_counter() - start
+            total_time += elapsed
+            record = {"suite": "book", "position": "ply{:d}".format(ply), "config": config,
+                      "move": board.san(move), "from_book": ai.search_info.get("book", False),
+                      "nodes": ai.search_info["nodes"], "wall_time_s": elapsed}
+            board.push(move)
+            results.append(record)
+            if not args.quiet:
+                print("{config:7s} {position:6s} move={move:7s} book={from_book!s:5s} nodes={nodes:8d} "
+                      "t={wall_time_s:10.6f}s".format(**record))
+
+        summary = {"suite": "book", "position": "summary", "config": config, "wall_time_s": total_time,
+                   "book_hits": book.hits if book is not None else 0,
+                   "book_probes": book.probes if book is not None else 0}
+        results.append(summary)
+        if book is not None:
+            book.close()
+        if not args.quiet:
+            print("{config:7s} {book_hits:d} book moves of {book_probes:d} looked up, "
+                  "{wall_time_s:.3f}s in all".format(**summary))
+    return results
+
+
+SUITES = {
+    "deepening": run_deepening_suite,
+    "ordering": run_ordering_suite,
+    "evaluation": run_evaluation_suite,
+    "quiescence": run_quiescence_suite,
+    "timed": run_timed_suite,
+    "parallel": run_parallel_suite,
+    "selective": run_selective_suite,
+    "pvs": run_pvs_suite,
+    "book": run_book_suite,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the chess engines")
+    parser.add_argument("suite", choices=sorted(SUITES))
+    parser.add_argument("--depth", type=int, default=4)
+    parser.add_argument("--positions", nargs="+", choices=[name for name, _ in POSITIONS],
+                        help="only these positions (default: all)")
+    parser.add_argument("--time-budgets", nargs="+", type=float, default=[0.25, 1, 4],
+                        help="seconds per move for the timed suite")
+    parser.add_argument("--workers", nargs="+", type=int, default=[1, 2, 4],
+                        help="worker counts for the parallel suite")
+    parser.add_argument("--suite-time", type=float, default=5,
+                        help="seconds per position for the selective suite")
+    parser.add_argument("--aspiration-widths", nargs="+", type=float, default=[0.25, 0.5, 1],
+                        help="aspiration window widths in pawns for the pvs suite")
+    parser.add_argument("--book", help="Polyglot opening book (.bin) for the book suite")
+    parser.add_argument("--book-selection", choices=["weighted", "best"], default="weighted")
+    parser.add_argument("--book-plies", type=int, default=12, help="plies to play in the book suite")
+    parser.add_argument("--table-size", type=int, default=1 << 18, help="transposition table slots")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", default="bench_chess.json")
+    parser.add_argument("--quiet", action="store_true")
+    args = parser.parse_args()
+
+    results = SUITES[args.suite](args)
+
+    report = {
+        "suite": args.suite,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "arguments": vars(args),
+        "results": results,
+    }
+    with open(args.out, "w") as f:
+        json.dump(report, f, indent=1)
+    print("wrote {:d} results to {:s}".format(len(results), args.out))
+
+
+if __name__ == "__main__":
+    main()
@@ -2,24 +2,79 @@
 
 
 import chess
+import random
 from RandomAI import RandomAI
 from HumanPlayer import HumanPlayer
 from MinimaxAI import MinimaxAI
 from AlphaBetaAI import AlphaBetaAI
 from ChessGame import ChessGame
+from MoveOrdering import MoveOrderer
+from ParallelSearch import ParallelAlphaBetaAI
+from TranspositionTable import TranspositionTable
+from benchmark_chess import POSITIONS
 
 
 import sys
 
 
-player1 = MinimaxAI(2)
-player2 = RandomAI()
+# Consistency checks: at a fixed depth every alpha-beta variant must return the same value as plain
+#  minimax (the moves may differ when several are equally good)
+CHECK_DEPTH = 3
+CHECK_POSITIONS = POSITIONS + [
+    ("mate_in_1", "r1bqkb1r/pppp1ppp/2n2n2/4p2Q/2B1P3/8/PPPP1PPP/RNB1K1NR w KQkq - 4 4"),
+    ("mate_in_2", "r5k1/5ppp/8/8/8/8/4RPPP/4R1K1 w - - 0 1"),
+]
 
-game = ChessGame(player1, player2)
+ENGINES = [
+    ("minimax", lambda: MinimaxAI(CHECK_DEPTH)),
+    ("alphabeta", lambda: AlphaBetaAI(CHECK_DEPTH)),
+    ("iterative+ordering", lambda: AlphaBetaAI(CHECK_DEPTH, TranspositionTable(1 << 16), iterative_deepening=True,
+                                                move_orderer=MoveOrderer())),
+    ("pvs", lambda: AlphaBetaAI(CHECK_DEPTH, TranspositionTable(1 << 16), iterative_deepening=True,
+                                move_orderer=MoveOrderer(), principal_variation_search=True)),
+    ("pvs+aspiration", lambda: AlphaBetaAI(CHECK_DEPTH, TranspositionTable(1 << 16), iterative_deepening=True,
+                                           move_orderer=MoveOrderer(), principal_variation_search=True,
+                                           aspiration_window=50)),
+]
 
-while not game.is_game_over():
-    print(game)
-    game.make_move()
 
-print("Game over! Game outcome: ", game.board.outcome())
-#print(hash(str(game.board)))
+def check_engines_agree():
+    for name, fen in CHECK_POSITIONS:
+        values = []
+        for engine_name, make_ai in ENGINES:
+            random.seed(0)
+            value, move = make_ai().search(chess.Board(fen))
+            values.append((engine_name, value))
+        print(name, values)
+        assert all(value == values[0][1] for _, value in values), name
+
+
+def check_parallel_agrees():
+    # the parallel engine uses the "pst" evaluator, so compare it with a single-process search using it too
+    with ParallelAlphaBetaAI(CHECK_DEPTH, 2) as parallel:
+        for name, fen in CHECK_POSITIONS:
+            random.seed(0)
+            single = AlphaBetaAI(CHECK_DEPTH, TranspositionTable(1 << 16), iterative_deepening=True,
+                                 move_orderer=MoveOrderer(), evaluator="pst")
+            single_value, single_move = single.search(chess.Board(fen))
+            parallel_value, parallel_move = parallel.search(chess.Board(fen))
+            print(name, "single:", single_value, single_move, "parallel:", parallel_value, parallel_move)
+            assert parallel_value == single_value and parallel_move == single_move, name
+
+
+# the parallel engine's workers import this file, so only the main process runs the checks and the game
+if __name__ == "__main__":
+    check_engines_agree()
+    check_parallel_agrees()
+
+    player1 = MinimaxAI(2)
+    player2 = RandomAI()
+
+    game = ChessGame(player1, player2)
+
+    while not game.is_game_over():
+        print(game)
+        game.make_move()
+
+    print("Game over! Game outcome: ", game.board.outcome())
+    #print(hash(str(game.board)))